@@ -1,8 +1,9 @@
+python3 tools/build_pack.py || exit 1
 rm -rf ../flash
 mkdir -p ../flash/apps/badgemon_source
 rsync -avs ../badgemon-source/ ../flash/apps/badgemon_source
 cd ../flash/apps/badgemon_source
-rm -rf .git* .vscode/ design/ docs/ TODO.md LICENCE *.code-workspace *.gitignore README.md .env *.gitmodules flash.sh __pycache__
+rm -rf .git* .vscode/ design/ docs/ tools/ TODO.md LICENCE *.code-workspace *.gitignore README.md .env *.gitmodules flash.sh __pycache__
 find . -name '*.ase' | xargs rm
 find . -name '__pycache__' | xargs rm -rf
 cd ../../
@@ -1,19 +1,33 @@
 from .mons import mons_list
-from struct import pack, unpack_from, calcsize
 
 class Badgedex:
+    """
+    Which mons the player has found, one bit per mon id.
+    """
     def __init__(self):
-        self.found = [False]*len(mons_list)
-    
+        self._found = bytearray((len(mons_list) + 7) // 8)
+        # How many bits are set, kept up to date by find() so it never needs counting again
+        self.found_count = 0
+
     def find(self, index):
-        self.found[index] = True
-    
+        mask = 1 << (index & 7)
+        if not self._found[index >> 3] & mask:
+            self._found[index >> 3] |= mask
+            self.found_count += 1
+
+    def is_found(self, index) -> bool:
+        return bool(self._found[index >> 3] & (1 << (index & 7)))
+
     def serialise(self):
-        return pack(f'{len(self.found)}B', *self.found)
+        return bytes(self._found)
 
     @staticmethod
     def deserialise(data):
         b = Badgedex()
-        b.found = [bool(unpack_from('B', data, m * calcsize("B"))[0]) for m in range(0, len(mons_list))]
+        length = min(len(data), len(b._found))
+        b._found[:length] = data[:length]
+        # Bits past the last mon can't have been found
+        if len(mons_list) & 7:
+            b._found[-1] &= (1 << (len(mons_list) & 7)) - 1
+        b.found_count = sum(bin(byte).count("1") for byte in b._found)
         return b
-    
\ No newline at end of file
@@ -1,26 +1,41 @@
+import math
 from ..util import static_random as random
-import sys
-
-from app import App
-
-from ..util.speech import SpeechDialog
 
 from sys import implementation as _sys_implementation
 if _sys_implementation.name != "micropython":
-    from typing import Union
+    from typing import Union, Callable, Awaitable, Tuple, List
 
 from . import constants, mons, moves, calculation, player, items
 
 
+class BattleEvent:
+    """
+    Things that happened during a battle, which the UI may want to show.
+
+    The battle never waits on the UI by itself. Everything it wants to show is queued as an event tuple,
+    and the queue is handed to the presenter whenever the battle needs an answer from a player,
+    or when the turn is over. Events are tuples starting with one of these kinds:
+
+    (TEXT, message)
+    (ANIMATION, anim_class, user, target)
+    (HP, mon, hp)
+    (SWITCH, is_player1, mon)
+    """
+    TEXT = 0
+    ANIMATION = 1
+    HP = 2
+    SWITCH = 3
+
+
 class Battle:
-    def __init__(self, player1: player.Player, player2: player.Player, app: App, news_target: SpeechDialog):
+    def __init__(self, player1: player.Player, player2: player.Player):
         """
         A battle takes place between two players, until all BadgeMon on one side have fainted.
 
+        This only advances the game state. Use run() to play it out, passing a presenter to show what happens.
+
         @param player1: The beloved hero!
         @param player2: The cruel enemy!
-        @param start: Does player1 start
-        @param news_target: Output for all log messages
         """
 
         self.player1 = player1
@@ -30,10 +45,9 @@ class Battle:
         self.mon1 = player1.badgemon[0]
         self.mon2 = player2.badgemon[0]
 
-        if news_target:
-            self.news_target = news_target
-        else:
-            self.news_target = sys.stdout
+        self.events = []
+        self.winner = None  # type: Union[player.Player, None]
+        self.caught = None  # type: Union[mons.Mon, None]
 
         player1.battle_context = self
         player2.battle_context = self
@@ -42,12 +56,146 @@ class Battle:
             self.turn = random.getrandbits(1) == 0
         else:
             self.turn = self.mon1.stats[constants.STAT_SPD] > self.mon2.stats[constants.STAT_SPD]
-        self._app = app
 
-    async def push_news_entry(self, *entry):
-        await self.news_target.write(" ".join(str(e) for e in entry))
+    def push_news_entry(self, *entry):
+        self.events.append((BattleEvent.TEXT, " ".join(str(e) for e in entry)))
+
+    def play_animation(self, anim: 'moves.MoveAnim', user: mons.Mon, target: mons.Mon):
+        self.events.append((BattleEvent.ANIMATION, anim, user, target))
+
+    def _push_hp(self, mon: mons.Mon):
+        self.events.append((BattleEvent.HP, mon, mon.hp))
+
+    def _set_active(self, is_player1: bool, mon: mons.Mon):
+        if is_player1:
+            self.mon1 = mon
+        else:
+            self.mon2 = mon
+        self.events.append((BattleEvent.SWITCH, is_player1, mon))
+
+    async def flush(self, presenter: Union[Callable[[Tuple], Awaitable], None]):
+        """
+        Hand every queued event to the presenter, in order. Without a presenter the events are dropped.
+        """
+        events = self.events
+        self.events = []
+        if presenter is not None:
+            for event in events:
+                await presenter(event)
+
+    async def run(self, presenter: Union[Callable[[Tuple], Awaitable], None] = None) -> player.Player:
+        """
+        Play turns until one side wins, runs away or has their mon caught.
+
+        :param presenter: Awaited with each BattleEvent tuple. If None, nothing is shown and the battle
+         only waits on the players themselves.
+        :return: The winning player.
+        """
+        while self.winner is None:
+            await self.play_turn(presenter)
+        await self.flush(presenter)
+        if self.caught is not None:
+            await self.winner.gain_badgemon(self.caught, self.winner.badgemon_case, self.winner.badgedex)
+        return self.winner
+
+    async def play_turn(self, presenter: Union[Callable[[Tuple], Awaitable], None] = None):
+        """
+        Play a single turn for whoever's turn it is.
+        """
+        if self.turn:
+            curr_player, curr_target = self.player1, self.player2
+        else:
+            curr_player, curr_target = self.player2, self.player1
+
+        if await self._replace_fainted(curr_target, curr_player, presenter):
+            return
+        if await self._replace_fainted(curr_player, curr_target, presenter):
+            return
+
+        if self.turn:
+            player_mon, target_mon = self.mon1, self.mon2
+        else:
+            player_mon, target_mon = self.mon2, self.mon1
+
+        await self.flush(presenter)
+        action = await curr_player.get_move(player_mon)
+        await curr_target.inform(action)
+
+        same_turn = self.take_action(curr_player, curr_target, player_mon, target_mon, action)
+
+        await self.flush(presenter)
+        if not same_turn and self.winner is None:
+            self.turn = not self.turn
 
-    async def use_move(self, user: mons.Mon, target: mons.Mon, move: moves.Move, custom_log: str = ""):
+    async def _replace_fainted(self, owner: player.Player, opponent: player.Player, presenter) -> bool:
+        """
+        If the active mon of owner has fainted, rewards the opponent and asks owner for a new mon.
+
+        :return: Whether the battle is over.
+        """
+        is_player1 = owner is self.player1
+        if is_player1:
+            mon, opponent_mon = self.mon1, self.mon2
+        else:
+            mon, opponent_mon = self.mon2, self.mon1
+
+        if not mon.fainted:
+            return False
+
+        self.push_news_entry(f"{mon.nickname} fainted!")
+        if opponent is self.player1:
+            self.gain_exp(opponent_mon, mon)
+            self.gain_money(opponent, mon.level*10)
+
+        if all(m.fainted for m in owner.badgemon):
+            self.end(opponent, f"{opponent.name} wins!")
+            return True
+
+        await self.flush(presenter)
+        self._set_active(is_player1, await owner.get_new_badgemon())
+        return False
+
+    def take_action(self, curr_player: player.Player, curr_target: player.Player, player_mon: mons.Mon,
+                    target_mon: mons.Mon, action: Union[mons.Mon, items.Item, moves.Move, None]) -> bool:
+        """
+        Resolve the action a player picked. This does not wait on anything.
+
+        :return: Whether the same player gets to go again.
+        """
+        same_turn = False
+
+        if isinstance(action, moves.Move):
+            self.use_move(player_mon, target_mon, action)
+
+        elif isinstance(action, mons.Mon):
+            self._set_active(curr_player is self.player1, action)
+
+        elif isinstance(action, items.Item):
+            if action.name == "Badgemon Doll":
+                if curr_player is self.player1:
+                    self.push_news_entry(f"{player_mon.nickname} appreciated the craftsmanship of the doll.")
+                same_turn = True
+            self.push_news_entry(f"Used {action.name}!")
+            if action.name.endswith("HexBox"):
+                if not isinstance(self.player2, player.Cpu):
+                    self.push_news_entry("Oh no! You can't catch THAT Badgemon!")
+                elif self.catch(curr_player, player_mon, target_mon, action):
+                    self.caught = target_mon
+                    self.winner = curr_player
+            else:
+                action.function_in_battle(curr_player, self, player_mon, target_mon)
+                self._push_hp(player_mon)
+
+        elif action is None:
+            self.end(curr_target, f"{curr_target.name} wins by default!")
+
+        return same_turn
+
+    def end(self, winner: player.Player, message: str):
+        self.push_news_entry(message)
+        self.winner = winner
+
+    def use_move(self, user: mons.Mon, target: mons.Mon, move: moves.Move, custom_log: str = ""):
         """
         Use a move on a target. This is what you should call to use a move.
 
@@ -58,7 +206,7 @@ class Battle:
         """
         if custom_log == "":
             custom_log = "{user} used {move_name}!\n"
-        await self.push_news_entry(custom_log.format(user=user.nickname, move_name=move.name))
+        self.push_news_entry(custom_log.format(user=user.nickname, move_name=move.name))
 
         if move.special_override == moves.MoveOverrideSpecial.NO_OVERRIDE:
             (damage, crit, effective) = calculation.calculate_damage(
@@ -71,26 +219,62 @@ class Battle:
 
         if calculation.get_hit(move.accuracy, user.accuracy, target.evasion):
             if crit:
-                await self.push_news_entry("A CRITICAL Hit!\n")
+                self.push_news_entry("A CRITICAL Hit!\n")
             else:
-                await self.push_news_entry("A Hit!\n")
+                self.push_news_entry("A Hit!\n")
 
             if effective == calculation.EFF_EFFECTIVE:
-                await self.push_news_entry("It was really effective!\n")
+                self.push_news_entry("It was really effective!\n")
             elif effective == calculation.EFF_INEFFECTIVE:
-                await self.push_news_entry("It didn't really do much...\n")
-            
-            if move.effect_on_hit:
-                await move.effect_on_hit.execute(self, user, target, damage)
+                self.push_news_entry("It didn't really do much...\n")
 
-            await self.deal_damage(user, target, damage, move.move_type)
+            effect_on_hit = move.compiled_effects()[0]
+            if effect_on_hit:
+                self.run_effect(effect_on_hit, user, target, damage)
+
+            self.deal_damage(user, target, damage, move.move_type)
 
         else:
-            await self.push_news_entry("A Miss!\n")
-            if move.effect_on_miss:
-                await move.effect_on_miss.execute(self, user, target, damage)
+            self.push_news_entry("A Miss!\n")
+            effect_on_miss = move.compiled_effects()[1]
+            if effect_on_miss:
+                self.run_effect(effect_on_miss, user, target, damage)
+
+    def run_effect(self, ops: List[Tuple], user: mons.Mon, target: mons.Mon, damage: int) -> bool:
+        """
+        Run a compiled move effect. See moves.EffectOp for what each op does.
 
-    async def inflict_status(self, user: Union[mons.Mon, None], target: mons.Mon, status: constants.StatusEffect,
+        :param ops: The ops, from MoveEffect.compile() or Move.compiled_effects().
+        :param user: The user of the move.
+        :param target: The target of the move.
+        :param damage: The amount of damage the move dealt (or would have done, in the case of a miss)
+        :return: The outcome of the last op.
+        """
+        outcome = False
+        pc = 0
+        end = len(ops)
+        while pc < end:
+            op, args = ops[pc]
+            pc += 1
+            if op == moves.EffectOp.SKIP_UNLESS:
+                if outcome != args[0]:
+                    outcome = False
+                    pc += args[1]
+            elif op == moves.EffectOp.STATUS:
+                outcome = random.random() < args[1] and self.inflict_status(user, target, args[0])
+            elif op == moves.EffectOp.RECOIL:
+                self.deal_damage(
+                    user, target, math.floor(damage * args[0]), None, "{target} took {damage_taken} recoil damage!"
+                )
+                outcome = True
+            elif op == moves.EffectOp.ANIMATION:
+                self.play_animation(moves.move_anims[args[0]], user, target)
+                outcome = True
+            elif op == moves.EffectOp.CALL:
+                outcome = args[0](self, user, target, damage)
+        return outcome
+
+    def inflict_status(self, user: Union[mons.Mon, None], target: mons.Mon, status: constants.StatusEffect,
                        custom_log: str = "") -> bool:
         """
         Apply a status effect. Default log message is "{target} was inflicted with the {status} condition!"
@@ -104,10 +288,10 @@ class Battle:
         status_taken = target.apply_status(status)
         if custom_log == "":
             custom_log = "{target} was inflicted with the {status} condition!\n"
-        await self.push_news_entry(custom_log.format(target=target, user=user, status=constants.status_to_str(status)))
+        self.push_news_entry(custom_log.format(target=target, user=user, status=constants.status_to_str(status)))
         return status_taken
 
-    async def deal_damage(self, user: Union[mons.Mon, None], target: mons.Mon, amount: int,
+    def deal_damage(self, user: Union[mons.Mon, None], target: mons.Mon, amount: int,
                     dmg_type: Union[constants.MonType, None], custom_log: str = "") -> int:
         """
         Deal damage. Default log message is "{target} took {damage_taken} damage!",
@@ -125,11 +309,12 @@ class Battle:
         damage_taken = target.take_damage(amount, dmg_type)
         if custom_log == "":
             custom_log = "{target} took {damage_taken} damage!\n"
-        await self.push_news_entry(custom_log.format(target=target.nickname, user=user.nickname, damage_taken=-damage_taken,
+        self.push_news_entry(custom_log.format(target=target.nickname, user=user.nickname, damage_taken=-damage_taken,
                                                dmg_type=constants.type_to_str(dmg_type), original_damage=amount))
+        self._push_hp(target)
         return damage_taken
 
-    async def gain_exp(self, user: mons.Mon, target: mons.Mon, custom_log: str = "") -> int:
+    def gain_exp(self, user: mons.Mon, target: mons.Mon, custom_log: str = "") -> int:
         """
         Deal damage. Default log message is "{user} gained {exp} experience!"
         :param user: The mon which caused the target to faint. This mon will gain exp.
@@ -141,10 +326,14 @@ class Battle:
         user.gain_exp(exp)
         if custom_log == "":
             custom_log = "{user} gained {exp} experience!\n"
-        await self.push_news_entry(custom_log.format(target=target.nickname, user=user.nickname, exp=exp))
+        self.push_news_entry(custom_log.format(target=target.nickname, user=user.nickname, exp=exp))
         return exp
 
-    async def heal_target(self, user: Union[mons.Mon, None], target: mons.Mon, amount: int, custom_log: str = ""):
+    def gain_money(self, user: player.Player, amount: int):
+        user.money += amount
+        self.push_news_entry(f"Got {amount} monies!")
+
+    def heal_target(self, user: Union[mons.Mon, None], target: mons.Mon, amount: int, custom_log: str = ""):
         """
         Heal some HP. Default log message is "{target} regained {heal_taken} HP!",
          or "There was no effect." if heal_taken==0.
@@ -160,25 +349,22 @@ class Battle:
         heal_taken = target.take_heal(amount)
         if custom_log == "":
             custom_log = "{target} regained {heal_taken} HP!\n"
-        await self.push_news_entry(custom_log.format(target=target, user=user, heal_taken=heal_taken, original_heal=amount))
+        self.push_news_entry(custom_log.format(target=target, user=user, heal_taken=heal_taken, original_heal=amount))
+        self._push_hp(target)
         return heal_taken
 
-    async def catch(self, user: player.Player, this_mon: mons.Mon, target: mons.Mon, ball: items.Item):
+    def catch(self, user: player.Player, this_mon: mons.Mon, target: mons.Mon, ball: items.Item) -> bool:
         ball_rate = ball.function_in_battle(user, self, this_mon, target)
         (base, rate) = calculation.get_catch_rate(target, ball_rate)
-        if base == 1.0:
-            await self.push_news_entry(f"{target.nickname} just fell straight in!")
+        if base >= calculation.CATCH_CERTAIN:
+            self.push_news_entry(f"{target.nickname} just fell straight in!")
             return True
         else:
             ooos = ["ooo...", "Oooooo... ", "OOOOOOOOO...", "Yes! You caught them!"]
-            escape = "NO! They escaped!"
-            caught = True
-            for oo in ooos:
-                if calculation.get_shake(rate):
-                    await self.push_news_entry(oo)
-                else:
-                    await self.push_news_entry(escape)
-                    caught = False
-                    break
-            return caught
-                    
+            shakes = calculation.get_shakes(rate)
+            for oo in ooos[:shakes]:
+                self.push_news_entry(oo)
+            if shakes < 4:
+                self.push_news_entry("NO! They escaped!")
+                return False
+            return True
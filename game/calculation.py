@@ -1,13 +1,14 @@
 import math
+from array import array
 from ..util import static_random as random
 
 from sys import implementation as _sys_implementation
 
 from ..game.mons import Mon
 if _sys_implementation.name != "micropython":
-    from typing import Tuple
+    from typing import Tuple, Union
 
-from . import constants
+from . import constants, levels
 
 STAGES = [33, 36, 43, 50, 60, 75, 100, 133, 166, 200, 233, 266, 300]
 
@@ -73,24 +74,55 @@ def get_hit(move_accuracy: int, user_accuracy: int, target_evasion: int) -> bool
 
     return random.randrange(0, 100) <= move_accuracy
 
-def get_catch_rate(mon: Mon, ball: float):
+# Catch rates are fixed point, with CATCH_CERTAIN being a guaranteed catch
+CATCH_BITS = 12
+CATCH_CERTAIN = 1 << CATCH_BITS
+_SHAKE_STEPS = 256
+_SHAKE_SHIFT = CATCH_BITS - 8
+
+# Chance of a single shake succeeding out of 65536, for catch rates of 0/256 to 256/256.
+# Each shake passes with probability (rate * 65536/65280) ** 0.25, so all four pass at about the catch rate.
+_shake_table = array("H", [0] + [
+    min(65535, int(1048560 / math.pow(65280 * _SHAKE_STEPS / i, 0.25))) for i in range(1, _SHAKE_STEPS + 1)
+])
+
+
+def get_catch_rate(mon: Mon, ball: Union[int, float]) -> Tuple[int, int]:
+    """
+    Works out how likely a mon is to be caught, in integers only.
+
+    @param mon: The mon being caught.
+    @param ball: The ball's multiplier, 255 always catches.
+    @return: (catch rate out of CATCH_CERTAIN, shake threshold out of 65536)
+    """
     if ball == 255:
-        return (1.0, 1.0)
-    three = (3 * mon.stats[constants.STAT_HP])
-    base = (three - (2 * mon.hp)) / three
-    base *= mon.template.catch_rate
-    base *= ball
-    base *= constants.catch_table[mon.status]
-    base = min(max(base,0.0),1.0)
-    print(f"BASE: {base}")
-    check2 = 1048560/math.pow(65280/base, 0.25)
-    print(f"RATE: {check2}")
-    return (base, check2)
-
-def get_shake(catch_rate: float):
-    check1 = random.randrange(0, 65536)
-    print(f"1: {check1}, 2: {catch_rate}")
-    return check1 < catch_rate
+        return (CATCH_CERTAIN, 65536)
+    three = 3 * mon.stats[constants.STAT_HP]
+    # Ball and status multipliers are both counted in halves
+    rate = (three - (mon.hp << 1)) * mon.template.catch_rate * int(ball * 2) * constants.catch_table[mon.status]
+    three <<= 2
+    if rate >= three:
+        return (CATCH_CERTAIN, 65536)
+    rate = (rate << CATCH_BITS) // three
+    i = rate >> _SHAKE_SHIFT
+    low = _shake_table[i]
+    return (rate, low + (((_shake_table[i + 1] - low) * (rate & ((1 << _SHAKE_SHIFT) - 1))) >> _SHAKE_SHIFT))
+
+
+def get_shakes(threshold: int) -> int:
+    """
+    Rolls all four shakes at once. Shake n passes with chance (threshold/65536)^n.
+
+    @param threshold: The shake threshold from get_catch_rate.
+    @return: The number of shakes passed, 4 means caught.
+    """
+    check = random.randrange(0, 65536)
+    half = threshold >> 1
+    shakes = 0
+    while shakes < 4 and check < threshold:
+        shakes += 1
+        threshold = ((threshold >> 1) * half) >> 14
+    return shakes
 
 def get_experience(mon: Mon, target: Mon):
-    return int(((mon.template.base_exp * target.level)/5)*math.pow((2*target.level+10)/(target.level+mon.level+10), 2.5)+1)
+    return int(((mon.template.base_exp * target.level)/5)*levels.exp_scale(target.level, mon.level)+1)
@@ -93,12 +93,12 @@ type_table = [
     [0 for _ in range(17)] for _ in range(17)
     ]
 
-# How likely to affect catch rate
+# How likely to affect catch rate, in halves (2 is 1x)
 catch_table = [
-    1,   # NO_EFFECT = 0
-    1.5, # POISONED = 1
-    1.5, # BURNED = 2
-    1.5, # PARALYZED = 3
-    2,   # FROZEN = 4
-    2    # SLEEPING = 5
+    2, # NO_EFFECT = 0
+    3, # POISONED = 1
+    3, # BURNED = 2
+    3, # PARALYZED = 3
+    4, # FROZEN = 4
+    4  # SLEEPING = 5
 ]
\ No newline at end of file
@@ -0,0 +1,150 @@
+from struct import pack, unpack_from, calcsize
+from array import array
+
+from ..config import ASSET_PATH
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Callable, List, Union
+
+# The game data (mons, moves, items), compiled by tools/build_pack.py.
+# If it's missing, the game falls back to the lists in mons_data, moves_data and items_data.
+PACK_PATH = ASSET_PATH + "data.pack"
+
+MAGIC = b"BMDP"
+VERSION = 3
+
+# Sections, in the order they appear in the header
+MONS = 0
+MOVES = 1
+ITEMS = 2
+MON_WEIGHTS = 3
+SECTIONS = 4
+
+# Set to False to ignore the pack, e.g. when building a new one
+enabled = True
+
+# Header: magic, version, section count, a hash of the data modules it was built from.
+# The badge doesn't check the hash, flash.sh rebuilds the pack each time. See tools/build_pack.py --check.
+# Then per section: record count, offset of its record index.
+# A section's index is count+1 offsets, so record i runs from index[i] to index[i+1].
+_HEADER = "<4sBB8s"
+_NO_HASH = bytes(8)
+_SECTION = "<HI"
+
+
+def pack_str(s: str) -> bytes:
+    data = s.encode("utf-8")
+    return pack("<H", len(data)) + data
+
+
+def unpack_str(data, offset: int):
+    """
+    @return: (the string, the offset after it)
+    """
+    length = unpack_from("<H", data, offset)[0]
+    offset += 2
+    return str(data[offset:offset + length], "utf-8"), offset + length
+
+
+def write_pack(path: str, sections: List[List[bytes]], source: bytes = _NO_HASH):
+    """
+    Write a pack, from a list of records (bytes) for each section.
+    The same format holds the descriptions, see game/descriptions.py.
+    :param source: Hash of the data the pack was built from.
+    """
+    data = bytearray(pack(_HEADER, MAGIC, VERSION, len(sections), source))
+    offset = len(data) + calcsize(_SECTION) * len(sections)
+    indexes = []
+    for records in sections:
+        index = [offset + 4 * (len(records) + 1)]
+        for record in records:
+            index.append(index[-1] + len(record))
+        data += pack(_SECTION, len(records), offset)
+        indexes.append(index)
+        offset = index[-1]
+    for records, index in zip(sections, indexes):
+        data += pack(f"<{len(index)}I", *index)
+        for record in records:
+            data += record
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class DataPack:
+    """
+    Reads records out of a pack on demand. Only the header and record indexes are kept in memory.
+    """
+    def __init__(self, path: str, sections: int = SECTIONS):
+        self._file = open(path, "rb")
+        header = self._file.read(calcsize(_HEADER))
+        magic, version, count, self.source = unpack_from(_HEADER, header)
+        if magic != MAGIC or version != VERSION or count != sections:
+            self._file.close()
+            raise ValueError(f"{path} is not a version {VERSION} data pack")
+        sections = self._file.read(calcsize(_SECTION) * count)
+        self._indexes = []
+        for i in range(count):
+            records, offset = unpack_from(_SECTION, sections, i * calcsize(_SECTION))
+            self._file.seek(offset)
+            index = array("I", [0] * (records + 1))
+            self._file.readinto(index)
+            self._indexes.append(index)
+
+    def count(self, section: int) -> int:
+        return len(self._indexes[section]) - 1
+
+    def record(self, section: int, i: int) -> bytes:
+        index = self._indexes[section]
+        self._file.seek(index[i])
+        return self._file.read(index[i + 1] - index[i])
+
+
+class LazyList:
+    """
+    A read-only list of records from a pack. Each one is only built the first time it's used, then kept.
+    """
+    def __init__(self, data_pack: DataPack, section: int, build: Callable[[int, bytes], object]):
+        self._pack = data_pack
+        self._section = section
+        self._build = build
+        self._items = [None] * data_pack.count(section)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, i: int):
+        if i < 0:
+            i += len(self._items)
+        item = self._items[i]
+        if item is None:
+            item = self._build(i, self._pack.record(self._section, i))
+            self._items[i] = item
+        return item
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def index(self, item) -> int:
+        return self._items.index(item)
+
+
+_pack = None
+_pack_tried = False
+
+
+def get_pack() -> Union[DataPack, None]:
+    """
+    @return: The game's data pack, or None if there isn't a usable one.
+    """
+    global _pack, _pack_tried
+    if not enabled:
+        return None
+    if not _pack_tried:
+        _pack_tried = True
+        try:
+            _pack = DataPack(PACK_PATH)
+        except (OSError, ValueError) as e:
+            print(f"Not using data pack: {e}")
+    return _pack
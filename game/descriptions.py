@@ -0,0 +1,50 @@
+from ..config import ASSET_PATH
+from . import datapack
+
+# Descriptions of mons, moves and items, written by tools/build_pack.py alongside the data pack.
+# They're only shown now and then, so they stay on flash and are read when needed.
+DESC_PATH = ASSET_PATH + "descriptions.pack"
+
+MONS = 0
+MOVES = 1
+ITEMS = 2
+SECTIONS = 3
+
+# How many descriptions to keep after reading them. The dex and battle menus tend to show the same few in a row.
+_CACHE_SIZE = 4
+
+_store = None
+_store_tried = False
+# (section, index, text), most recently used last
+_cache = []
+
+
+def _get_store():
+    global _store, _store_tried
+    if not _store_tried:
+        _store_tried = True
+        try:
+            _store = datapack.DataPack(DESC_PATH, SECTIONS)
+        except (OSError, ValueError) as e:
+            print(f"Not using descriptions: {e}")
+    return _store
+
+
+def get(section: int, index: int) -> str:
+    """
+    @return: The description of mons_list[index], moves_list[index] or items_list[index], depending on section.
+    """
+    for i in range(len(_cache)):
+        entry = _cache[i]
+        if entry[0] == section and entry[1] == index:
+            if i != len(_cache) - 1:
+                _cache.append(_cache.pop(i))
+            return entry[2]
+    store = _get_store()
+    if store is None:
+        return ""
+    text = str(store.record(section, index), "utf-8")
+    if len(_cache) >= _CACHE_SIZE:
+        _cache.pop(0)
+    _cache.append((section, index, text))
+    return text
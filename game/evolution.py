@@ -0,0 +1,114 @@
+from array import array
+
+from . import mons
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Tuple
+
+NONE = 255
+
+# Evolutions by mon id, built the first time anything asks.
+# _evolves_to[i] and _evolve_level[i] are what mon i evolves into and when, NONE/0 if it doesn't.
+# _evolves_from[i] is the mon that evolves into i, NONE if it's the start of its line.
+# _chain_of[i] indexes _chains, the whole line mon i is part of, first form to final form.
+_evolves_to = None
+_evolve_level = None
+_evolves_from = None
+_chain_of = None
+_chains = None
+
+
+def _build():
+    global _evolves_to, _evolve_level, _evolves_from, _chain_of, _chains
+    count = len(mons.mons_list)
+    evolves_to = array("B", [NONE] * count)
+    evolve_level = array("B", [0] * count)
+    evolves_from = array("B", [NONE] * count)
+    for i in range(count):
+        to, level = mons.evolution_of(i)
+        if to != NONE and level:
+            evolves_to[i] = to
+            evolve_level[i] = level
+            if evolves_from[to] == NONE:
+                evolves_from[to] = i
+    chain_of = array("H", [0xFFFF] * count)
+    chains = []
+    for i in range(count):
+        if evolves_from[i] != NONE:
+            continue
+        chain = [i]
+        while evolves_to[chain[-1]] != NONE and evolves_to[chain[-1]] not in chain:
+            chain.append(evolves_to[chain[-1]])
+        for m in chain:
+            chain_of[m] = len(chains)
+        chains.append(tuple(chain))
+    # Anything left is in a loop of evolutions, which shouldn't happen. Treat it as not evolving.
+    for i in range(count):
+        if chain_of[i] == 0xFFFF:
+            evolves_to[i] = NONE
+            evolve_level[i] = 0
+            chain_of[i] = len(chains)
+            chains.append((i,))
+    _evolves_to, _evolve_level, _evolves_from, _chain_of, _chains = (
+        evolves_to, evolve_level, evolves_from, chain_of, chains
+    )
+
+
+def _graph():
+    if _evolves_to is None:
+        _build()
+
+
+def evolves_to(mon_id: int) -> Tuple[int, int]:
+    """
+    @return: (id of the mon this evolves into, level it evolves at), or (NONE, 0) if it doesn't evolve.
+    """
+    _graph()
+    return _evolves_to[mon_id], _evolve_level[mon_id]
+
+
+def evolves_from(mon_id: int) -> int:
+    """
+    @return: The id of the mon that evolves into this one, or NONE if it's the first in its line.
+    """
+    _graph()
+    return _evolves_from[mon_id]
+
+
+def chain(mon_id: int) -> Tuple[int, ...]:
+    """
+    @return: Every mon in this mon's evolution line, first form to final form. Just the mon if it doesn't evolve.
+    """
+    _graph()
+    return _chains[_chain_of[mon_id]]
+
+
+def form_at_level(mon_id: int, level: int) -> int:
+    """
+    @return: What this mon would have evolved into by this level, or the mon itself.
+    """
+    _graph()
+    line = _chains[_chain_of[mon_id]]
+    for i in range(line.index(mon_id), len(line) - 1):
+        if _evolve_level[line[i]] > level:
+            return line[i]
+    return line[-1]
+
+
+def evolution_between(mon_id: int, old_level: int, new_level: int) -> int:
+    """
+    The form a mon ends up as after levelling from old_level to new_level. It only evolves when it passes
+    the level an evolution happens at, so a mon that was already past it (say, caught wild at a high level)
+    stays as it is.
+    @return: The id of the form it evolves into, or mon_id if it doesn't.
+    """
+    _graph()
+    line = _chains[_chain_of[mon_id]]
+    form = mon_id
+    for i in range(line.index(mon_id), len(line) - 1):
+        level = _evolve_level[line[i]]
+        if not old_level < level <= new_level:
+            break
+        form = line[i + 1]
+    return form
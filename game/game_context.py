@@ -14,12 +14,23 @@ mon3 = Mon(mon_template1, 17).set_nickname("David")
 mon4 = Mon(mon_template2, 33).set_nickname("large individual")
 mon5 = Mon(mon_template1, 100).set_nickname("biggest dude")
 
-VERSION = 3
+VERSION = 6
+
+# How much of a battle is shown, set from the Field menu
+BATTLE_SPEED_NORMAL = 0
+# Move animations are skipped
+BATTLE_SPEED_FAST = 1
+# Move animations and battle text are skipped, only the health bars and menus are left
+BATTLE_SPEED_INSTANT = 2
+BATTLE_SPEEDS = 3
 
 class GameContext:
     def __init__(self):
         self.player = Player("SCARLETT", [], [], {potion: 2})
         self.random_encounters = True
+        # Off unless the player turns it on in the Field menu
+        self.power_save = False
+        self.battle_speed = BATTLE_SPEED_NORMAL
         self.custom = Customisation()
 
     def serialise(self):
@@ -30,6 +41,8 @@ class GameContext:
         data += pack("H", len(player))
         data += player
         data += pack('B', self.random_encounters)
+        data += pack('B', self.power_save)
+        data += pack('B', self.battle_speed)
         custom = self.custom.serialise()
         data += pack("B", len(custom))
         data += custom
@@ -44,6 +57,10 @@ class GameContext:
         offset += pl_len
         gc.random_encounters = unpack_from('B', data, offset)[0]
         offset += 1
+        gc.power_save = unpack_from('B', data, offset)[0]
+        offset += 1
+        gc.battle_speed = unpack_from('B', data, offset)[0]
+        offset += 1
         cm_len = unpack_from('B', data, offset)[0]
         offset += 1
         gc.custom = Customisation.deserialise(data[offset:offset+cm_len])
@@ -1,13 +1,16 @@
 try:
     from sys import implementation as _sys_implementation
     if _sys_implementation.name != "micropython":
-        from typing import Callable, Union, TYPE_CHECKING
+        from typing import Dict, List, Tuple, Union, TYPE_CHECKING
         if TYPE_CHECKING:
             from . import player, battle_main, mons
 except ImportError:
     pass
 
-from ..game import constants
+from struct import pack, unpack_from, calcsize
+from array import array
+
+from ..game import datapack, descriptions
 
 class FieldTargetingType:
     NOT_USABLE = 0
@@ -15,82 +18,205 @@ class FieldTargetingType:
     NO_TARGETS = 2
 
 
+class ItemEffect:
+    """
+    What an item does when it's used, as (kind, argument). Items are plain data so they can go in a data pack.
+    """
+    NONE = 0
+    HEAL_STATUS = 1   # arg: the status to cure, or ANY_STATUS for any
+    HEAL = 2          # arg: HP to heal, or FULL for all of it
+    CURE_AND_HEAL = 3 # cures any status, and heals to full HP
+    REVIVE = 4        # arg: 1 to revive at half HP, 0 for full
+    RESTORE_PP = 5    # arg: PP to restore to each move, or FULL for all of it
+    CATCH = 6         # arg: the HexBox's catch multiplier in halves, 510 always catches
+    DOLL = 7
+    FISHING_ROD = 8
+
+    ANY_STATUS = 255
+    FULL = 0
+
+
 class Item:
+    __slots__ = ('id', 'name', '_desc', 'value', 'usable_in_battle', 'usable_in_field',
+                 'battle_effect', 'field_effect')
     id_inc = 0
 
     def __init__(self, name: str, desc: str, value: int, usable_in_battle: bool, usable_in_field: int,
-                 function_in_battle: Union[
-                     Callable[['player.Player', 'battle_main.Battle', 'mons.Mon', 'mons.Mon'], None], None
-                 ] = None,
-                 function_in_field: Union[Callable[['player.Player', Union['mons.Mon', None]], None], None] = None):
+                 battle_effect: Tuple[int, int] = (ItemEffect.NONE, 0),
+                 field_effect: Tuple[int, int] = (ItemEffect.NONE, 0)):
         """
         :param name: Name of the item
-        :param desc: Description of the item
+        :param desc: Description of the item. None to load it from the description store.
         :param value: Value of the item (price when bought)
-        :param usable_in_battle: Is this item usable in battle? (Must have function_in_battle defined)
+        :param usable_in_battle: Is this item usable in battle? (Must have battle_effect defined)
         :param usable_in_field: How is this item usable in the field?
-        :param function_in_battle: The function to call when this item is used in battle. (player, battle, user, target)
-        user is always the player's mon. target is always the opposing mon - even if those variables are not used.
-        :param function_in_field: The function to call when this item is used in the field. (player, target_mon)
-        If usable_in_field == FieldTargetingType.NO_TARGETS, target_mon will be None.
+        :param battle_effect: What happens when this item is used in battle, as (ItemEffect kind, argument).
+        :param field_effect: What happens when this item is used in the field, as (ItemEffect kind, argument).
         """
 
         self.id = Item.id_inc
         Item.id_inc += 1
 
         self.name = name
-        self.desc = desc
+        self._desc = desc
         self.value = value
         self.usable_in_battle = usable_in_battle
         self.usable_in_field = usable_in_field
-        self.function_in_battle = function_in_battle
-        self.function_in_field = function_in_field
-
-def parabox(mon: 'mons.Mon'):
-    mon.heal_status(None)
-    mon.take_heal(999999)
-
-items_list = [
-    Item("Charcoal", "A lump of activated charcoal. It does the job of curing poison, just about.",
-         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.heal_status(constants.StatusEffect.POISONED), lambda _, m: m.heal_status(constants.StatusEffect.POISONED)),
-    Item("Ointment", "A wet, sticky gel that soothes burns.",
-         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.heal_status(constants.StatusEffect.BURNED), lambda _, m: m.heal_status(constants.StatusEffect.BURNED)),
-    Item("Heat Pack", "A portable heater to attach to frozen badgemon.",
-         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.heal_status(constants.StatusEffect.FROZEN), lambda _, m: m.heal_status(constants.StatusEffect.FROZEN)),
-    Item("Klaxon", "\'Heals\' a sleeping badgemon.",
-         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.heal_status(constants.StatusEffect.SLEEPING), lambda _, m: m.heal_status(constants.StatusEffect.SLEEPING)),
-    Item("Hot Chocolate", "One cup of this and paralysis is no more.",
-         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.heal_status(constants.StatusEffect.PARALYZED), lambda _, m: m.heal_status(constants.StatusEffect.PARALYZED)),
-    Item("Antibiotics", "Cures any status condition and heals the badgemon to full HP.",
-         3000, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: parabox(m), lambda _, m: parabox(m)),
-    Item("Gargantuan Cookie", "Heals a badgemon to full HP. Useless if they are fainted.",
-         2500, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.take_heal(999999), lambda _, m: m.take_heal(999999)),
-    Item("Massive Cookie", "Heals a badgemon by 200 HP. Useless if they are fainted.",
-         1500, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.take_heal(200), lambda _, m: m.take_heal(200)),
-    Item("Large Cookie", "Heals a badgemon by 50 HP. Useless if they are fainted.",
-         700, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.take_heal(50), lambda _, m: m.take_heal(50)),
-    Item("Cookie", "Heals a badgemon by 20 HP. Useless if they are fainted.",
-         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.take_heal(20), lambda _, m: m.take_heal(20)),
-    Item("Paracetamol", "Cures any status condition.",
-         400, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.heal_status(None), lambda _, m: m.heal_status(None)),
-    Item("Enticing Scent", "Revives a badgemon at half HP.",
-         2000, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.revive(True), lambda _, m: m.revive(True)),
-    Item("Extreme Scent", "Revives a badgemon at full HP.",
-         4000, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.revive(), lambda _, m: m.revive()),
-    Item("Espresso", "Restores 10 PP of all a badgemon's moves.",
-         400, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.modify_pp(10), lambda _, m: m.modify_pp(10)),
-    Item("Energy Drink", "Fully restores the PP of all a badgemon's moves.",
-         1000, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, lambda _, __, m, ___: m.modify_pp(999999), lambda _, m: m.modify_pp(999999)),
-    Item("Fishing Rod", "Allows fishing, but only if you have an Eastnor Fishing Permit.",
-         500, False,  FieldTargetingType.NO_TARGETS, None, lambda _, __: print("You don't have a licence!")),
-    Item("Badgemon Doll", "Was intended to look cute... probably.",
-         400, True,  FieldTargetingType.NOT_USABLE, lambda _, __, m, ___: print(f"{m.nickname} appreciated the craftsmanship of the doll."), None),
-    Item("HexBox", "A device able to catch badgemon after they are weakened.",
-         200, True,  FieldTargetingType.NOT_USABLE, lambda p, b, ___, t: 1, None),
-    Item("Super HexBox", "A modification of the original HexBox design, with enhanced catching ability.",
-         600, True,  FieldTargetingType.NOT_USABLE, lambda p, b, ___, t: 1.5, None),
-    Item("Ultra HexBox", "A high-tech box full of features to make catching badgemon easier.",
-         800, True,  FieldTargetingType.NOT_USABLE, lambda p, b, ___, t: 2, None),
-    Item("Master HexBox", "The ultimate box. Will catch a badgemon without fail.",
-         1600, True,  FieldTargetingType.NOT_USABLE, lambda p, b, ___, t: 255, None),
-]
+        self.battle_effect = battle_effect
+        self.field_effect = field_effect
+
+    @property
+    def desc(self) -> str:
+        """
+        The description. Loaded from the description store when this came from a data pack.
+        """
+        if self._desc is None:
+            return descriptions.get(descriptions.ITEMS, self.id)
+        return self._desc
+
+    def function_in_battle(self, player: 'player.Player', battle: 'battle_main.Battle', user: 'mons.Mon',
+                           target: 'mons.Mon'):
+        """
+        Use this item in battle. user is always the player's mon. target is always the opposing mon.
+        :return: For HexBoxes, the catch multiplier. Otherwise, whether it did anything.
+        """
+        kind, arg = self.battle_effect
+        if kind == ItemEffect.CATCH:
+            return arg / 2
+        if kind == ItemEffect.DOLL:
+            print(f"{user.nickname} appreciated the craftsmanship of the doll.")
+            return True
+        return _use_on_mon(kind, arg, user)
+
+    def function_in_field(self, player: 'player.Player', target: Union['mons.Mon', None]):
+        """
+        Use this item in the field.
+        If usable_in_field == FieldTargetingType.NO_TARGETS, target will be None.
+        """
+        kind, arg = self.field_effect
+        if kind == ItemEffect.FISHING_ROD:
+            print("You don't have a licence!")
+            return False
+        return _use_on_mon(kind, arg, target)
+
+    # value, usable_in_battle, usable_in_field, battle effect kind and argument, field effect kind and argument.
+    # Then the name string. The desc goes in the description store instead.
+    _RECORD = '<HBBBHBH'
+
+    def pack_record(self) -> bytes:
+        """
+        Turn this item into a data pack record. Opposite of Item.unpack_record().
+        """
+        data = bytearray(pack(Item._RECORD, self.value, self.usable_in_battle, self.usable_in_field,
+                              *self.battle_effect, *self.field_effect))
+        data += datapack.pack_str(self.name)
+        return data
+
+    @staticmethod
+    def unpack_record(index: int, data: bytes) -> 'Item':
+        value, usable_in_battle, usable_in_field, battle_kind, battle_arg, field_kind, field_arg = \
+            unpack_from(Item._RECORD, data)
+        offset = calcsize(Item._RECORD)
+        name, offset = datapack.unpack_str(data, offset)
+        item = Item(name, None, value, bool(usable_in_battle), usable_in_field,
+                    (battle_kind, battle_arg), (field_kind, field_arg))
+        item.id = index
+        return item
+
+
+def _use_on_mon(kind: int, arg: int, mon: 'mons.Mon'):
+    if kind == ItemEffect.HEAL_STATUS:
+        return mon.heal_status(None if arg == ItemEffect.ANY_STATUS else arg)
+    if kind == ItemEffect.HEAL:
+        return mon.take_heal(arg or 999999)
+    if kind == ItemEffect.CURE_AND_HEAL:
+        mon.heal_status(None)
+        return mon.take_heal(999999)
+    if kind == ItemEffect.REVIVE:
+        return mon.revive(bool(arg))
+    if kind == ItemEffect.RESTORE_PP:
+        return mon.modify_pp(arg or 999999)
+    return False
+
+
+_pack = datapack.get_pack()
+if _pack:
+    items_list = datapack.LazyList(_pack, datapack.ITEMS, Item.unpack_record)
+else:
+    from .items_data import items_list
+
+
+class Inventory:
+    """
+    How many of each item a player has, as one count per Item.id. Items can be given as Items or ids.
+    Counts are 0-255, and an item with a count of 0 isn't in the inventory.
+    """
+    __slots__ = ('_counts',)
+
+    def __init__(self, counts: Union[Dict[Item, int], List[Tuple[Item, int]], None] = None):
+        """
+        :param counts: Starting counts, as a dict or list of (item, count).
+        """
+        self._counts = array('B', [0] * len(items_list))
+        if counts:
+            for item, count in (counts.items() if isinstance(counts, dict) else counts):
+                self[item] = count
+
+    def __len__(self) -> int:
+        n = 0
+        for count in self._counts:
+            if count:
+                n += 1
+        return n
+
+    def __contains__(self, item: Union[Item, int]) -> bool:
+        return self[item] > 0
+
+    def __getitem__(self, item: Union[Item, int]) -> int:
+        return self._counts[item if isinstance(item, int) else item.id]
+
+    def __setitem__(self, item: Union[Item, int], count: int):
+        self._counts[item if isinstance(item, int) else item.id] = count
+
+    def get(self, item: Union[Item, int], default: Union[int, None] = None) -> Union[int, None]:
+        count = self[item]
+        return count if count else default
+
+    def pop(self, item: Union[Item, int], default: Union[int, None] = None) -> Union[int, None]:
+        count = self.get(item, default)
+        self[item] = 0
+        return count
+
+    def add(self, item: Union[Item, int], count: int = 1) -> int:
+        """
+        :return: The new count, which stops at 255.
+        """
+        count = min(255, self[item] + count)
+        self[item] = count
+        return count
+
+    def remove(self, item: Union[Item, int], count: int = 1) -> bool:
+        """
+        :return: False, leaving the count alone, if there weren't enough to remove.
+        """
+        current = self[item]
+        if current < count:
+            return False
+        self[item] = current - count
+        return True
+
+    def ids(self):
+        """
+        Iterate over (item id, count) for every item in the inventory, without building the Items.
+        """
+        for i in range(len(self._counts)):
+            if self._counts[i]:
+                yield i, self._counts[i]
+
+    def items(self):
+        """
+        Iterate over (item, count) for every item in the inventory.
+        """
+        for i in range(len(self._counts)):
+            if self._counts[i]:
+                yield items_list[i], self._counts[i]
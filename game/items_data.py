@@ -0,0 +1,48 @@
+# The items, as Python. Only imported if there's no data pack, see game/datapack.py
+from .items import Item, ItemEffect, FieldTargetingType
+from . import constants
+
+items_list = [
+    Item("Charcoal", "A lump of activated charcoal. It does the job of curing poison, just about.",
+         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL_STATUS, constants.StatusEffect.POISONED), (ItemEffect.HEAL_STATUS, constants.StatusEffect.POISONED)),
+    Item("Ointment", "A wet, sticky gel that soothes burns.",
+         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL_STATUS, constants.StatusEffect.BURNED), (ItemEffect.HEAL_STATUS, constants.StatusEffect.BURNED)),
+    Item("Heat Pack", "A portable heater to attach to frozen badgemon.",
+         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL_STATUS, constants.StatusEffect.FROZEN), (ItemEffect.HEAL_STATUS, constants.StatusEffect.FROZEN)),
+    Item("Klaxon", "\'Heals\' a sleeping badgemon.",
+         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL_STATUS, constants.StatusEffect.SLEEPING), (ItemEffect.HEAL_STATUS, constants.StatusEffect.SLEEPING)),
+    Item("Hot Chocolate", "One cup of this and paralysis is no more.",
+         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL_STATUS, constants.StatusEffect.PARALYZED), (ItemEffect.HEAL_STATUS, constants.StatusEffect.PARALYZED)),
+    Item("Antibiotics", "Cures any status condition and heals the badgemon to full HP.",
+         3000, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.CURE_AND_HEAL, 0), (ItemEffect.CURE_AND_HEAL, 0)),
+    Item("Gargantuan Cookie", "Heals a badgemon to full HP. Useless if they are fainted.",
+         2500, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL, ItemEffect.FULL), (ItemEffect.HEAL, ItemEffect.FULL)),
+    Item("Massive Cookie", "Heals a badgemon by 200 HP. Useless if they are fainted.",
+         1500, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL, 200), (ItemEffect.HEAL, 200)),
+    Item("Large Cookie", "Heals a badgemon by 50 HP. Useless if they are fainted.",
+         700, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL, 50), (ItemEffect.HEAL, 50)),
+    Item("Cookie", "Heals a badgemon by 20 HP. Useless if they are fainted.",
+         200, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL, 20), (ItemEffect.HEAL, 20)),
+    Item("Paracetamol", "Cures any status condition.",
+         400, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.HEAL_STATUS, ItemEffect.ANY_STATUS), (ItemEffect.HEAL_STATUS, ItemEffect.ANY_STATUS)),
+    Item("Enticing Scent", "Revives a badgemon at half HP.",
+         2000, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.REVIVE, 1), (ItemEffect.REVIVE, 1)),
+    Item("Extreme Scent", "Revives a badgemon at full HP.",
+         4000, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.REVIVE, 0), (ItemEffect.REVIVE, 0)),
+    Item("Espresso", "Restores 10 PP of all a badgemon's moves.",
+         400, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.RESTORE_PP, 10), (ItemEffect.RESTORE_PP, 10)),
+    Item("Energy Drink", "Fully restores the PP of all a badgemon's moves.",
+         1000, True,  FieldTargetingType.TARGETS_SPECIFIC_MON, (ItemEffect.RESTORE_PP, ItemEffect.FULL), (ItemEffect.RESTORE_PP, ItemEffect.FULL)),
+    Item("Fishing Rod", "Allows fishing, but only if you have an Eastnor Fishing Permit.",
+         500, False,  FieldTargetingType.NO_TARGETS, (ItemEffect.NONE, 0), (ItemEffect.FISHING_ROD, 0)),
+    Item("Badgemon Doll", "Was intended to look cute... probably.",
+         400, True,  FieldTargetingType.NOT_USABLE, (ItemEffect.DOLL, 0), (ItemEffect.NONE, 0)),
+    Item("HexBox", "A device able to catch badgemon after they are weakened.",
+         200, True,  FieldTargetingType.NOT_USABLE, (ItemEffect.CATCH, 2), (ItemEffect.NONE, 0)),
+    Item("Super HexBox", "A modification of the original HexBox design, with enhanced catching ability.",
+         600, True,  FieldTargetingType.NOT_USABLE, (ItemEffect.CATCH, 3), (ItemEffect.NONE, 0)),
+    Item("Ultra HexBox", "A high-tech box full of features to make catching badgemon easier.",
+         800, True,  FieldTargetingType.NOT_USABLE, (ItemEffect.CATCH, 4), (ItemEffect.NONE, 0)),
+    Item("Master HexBox", "The ultimate box. Will catch a badgemon without fail.",
+         1600, True,  FieldTargetingType.NOT_USABLE, (ItemEffect.CATCH, 510), (ItemEffect.NONE, 0)),
+]
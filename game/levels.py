@@ -0,0 +1,34 @@
+import math
+from array import array
+
+from ..util.search import bisect_right
+
+# Levels are saved as a byte
+MAX_LEVEL = 255
+
+# Total xp needed to reach each level
+_xp_table = array("I", [l * l * l for l in range(MAX_LEVEL + 1)])
+
+# n^2.5 for every n get_experience can ask for, (2*level+10) and (level+level+10)
+_pow_2_5 = array("f", [math.pow(n, 2.5) for n in range(2 * MAX_LEVEL + 11)])
+
+
+def xp_for_level(level: int) -> int:
+    """
+    @return: The total xp a mon needs to be at this level.
+    """
+    return _xp_table[min(max(level, 0), MAX_LEVEL)]
+
+
+def level_for_xp(xp: int) -> int:
+    """
+    @return: The highest level a mon with this much xp can be.
+    """
+    return bisect_right(_xp_table, xp) - 1
+
+
+def exp_scale(target_level: int, level: int) -> float:
+    """
+    @return: ((2*target_level+10)/(target_level+level+10))^2.5, for scaling exp by level difference.
+    """
+    return _pow_2_5[2 * target_level + 10] / _pow_2_5[target_level + level + 10]
@@ -1,6 +1,9 @@
+from struct import pack, unpack_from
+
 from ..config import SAVE_PATH
 
 VERSION_LOC = 4
+PLAYER_LEN_LOC = 6
 
 def save_1to2():
     with open(SAVE_PATH+"sav.dat", "rb") as f:
@@ -17,5 +20,57 @@ def save_2to3():
     with open(SAVE_PATH+"sav.dat", "wb") as f:
         f.write(data)
 
+def save_3to4():
+    # The badgedex went from a byte per mon to a bit per mon. Walk the player to find it.
+    with open(SAVE_PATH+"sav.dat", "rb") as f:
+        data = bytearray(f.read())
+        data[VERSION_LOC] = 4
+        player_start = PLAYER_LEN_LOC + 2
+        player_len = unpack_from('H', data, PLAYER_LEN_LOC)[0]
+        offset = player_start
+        offset += 1 + data[offset]  # name
+        for _ in range(2):  # party, then case
+            count = data[offset]
+            offset += 1
+            for _ in range(count):
+                offset += 1 + data[offset]
+        offset += 1 + 2 * data[offset]  # inventory
+        offset += 8  # last heal
+        bdex_len = data[offset]
+        found = data[offset + 1:offset + 1 + bdex_len]
+        bits = bytearray((bdex_len + 7) // 8)
+        for i, was_found in enumerate(found):
+            if was_found:
+                bits[i >> 3] |= 1 << (i & 7)
+        data[offset:offset + 1 + bdex_len] = bytes([len(bits)]) + bits
+        data[PLAYER_LEN_LOC:player_start] = pack('H', player_len - bdex_len + len(bits))
+    with open(SAVE_PATH+"sav.dat", "wb") as f:
+        f.write(data)
+
+def save_4to5():
+    # Power saving was added after random encounters. It's off, as for new games
+    with open(SAVE_PATH+"sav.dat", "rb") as f:
+        data = bytearray(f.read())
+        data[VERSION_LOC] = 5
+        player_len = unpack_from('H', data, PLAYER_LEN_LOC)[0]
+        offset = PLAYER_LEN_LOC + 2 + player_len + 1
+        data[offset:offset] = b'\x00'
+    with open(SAVE_PATH+"sav.dat", "wb") as f:
+        f.write(data)
+
+def save_5to6():
+    # Battle speed was added after power saving, at normal speed
+    with open(SAVE_PATH+"sav.dat", "rb") as f:
+        data = bytearray(f.read())
+        data[VERSION_LOC] = 6
+        player_len = unpack_from('H', data, PLAYER_LEN_LOC)[0]
+        offset = PLAYER_LEN_LOC + 2 + player_len + 2
+        data[offset:offset] = b'\x00'
+    with open(SAVE_PATH+"sav.dat", "wb") as f:
+        f.write(data)
+
 conversion = {1: save_1to2,
-              2: save_2to3}
+              2: save_2to3,
+              3: save_3to4,
+              4: save_4to5,
+              5: save_5to6}
@@ -1,18 +1,23 @@
 import math
 from ..util import static_random as random
-from struct import pack, unpack_from
+from struct import pack, unpack_from, calcsize
+from array import array
 
 from sys import implementation as _sys_implementation
 if _sys_implementation.name != "micropython":
     from typing import List, Tuple, Union
 
-from . import moves, constants
+from . import moves, constants, levels, datapack, descriptions
+from ..util.search import bisect_left, bisect_right
 
 
 class MonTemplate:
     """
     A template for a mon. This is copied into every instance of a mon, but NEVER MODIFIED.
     """
+    __slots__ = ('id', 'name', '_desc', 'type1', 'type2', 'evolve_mon', 'evolve_level',
+                 'base_hp', 'base_atk', 'base_def', 'base_spatk', 'base_spdef', 'base_spd', 'base_stats',
+                 'learnset', '_learn_levels', 'sprite', 'weight', 'catch_rate', 'base_exp')
     id_inc = 0
 
     def __init__(self, name: str, desc: str, type1: constants.MonType, type2: constants.MonType,
@@ -25,7 +30,7 @@ class MonTemplate:
                  catch_rate: int = 1, base_exp = 150):
         """
         :param name: Name of the mon
-        :param desc: Description (dex entry)
+        :param desc: Description (dex entry). None to load it from the description store.
         :param type1: First type, e.g. Fire, Ground
         :param type2: Second type, e.g. Fire, Ground
         :param evolve_mon: The mon this will evolve into. Will not evolve if this is None.
@@ -49,7 +54,7 @@ class MonTemplate:
         MonTemplate.id_inc += 1
 
         self.name = name
-        self.desc = desc
+        self._desc = desc
         self.type1 = type1
         self.type2 = type2
         self.evolve_mon = evolve_mon
@@ -66,6 +71,7 @@ class MonTemplate:
         ]
 
         self.learnset = learnset
+        self._learn_levels = None
 
         self.sprite = sprite
 
@@ -73,12 +79,107 @@ class MonTemplate:
         self.catch_rate = catch_rate
         self.base_exp = base_exp
 
+    @property
+    def desc(self) -> str:
+        """
+        The description. Loaded from the description store when this came from a data pack.
+        """
+        if self._desc is None:
+            return descriptions.get(descriptions.MONS, self.id)
+        return self._desc
+
+    def _learnset_index(self) -> array:
+        # The level of each learnset entry, built the first time it's needed
+        if self._learn_levels is None:
+            self._learn_levels = array('B', [level for _, level in self.learnset])
+        return self._learn_levels
+
+    def moves_learnt_at(self, level: int) -> List[Tuple[moves.Move, int]]:
+        """
+        :return: The learnset entries for exactly this level.
+        """
+        index = self._learnset_index()
+        return self.learnset[bisect_left(index, level):bisect_right(index, level)]
+
+    def moves_learnt_between(self, old_level: int, new_level: int) -> List[Tuple[moves.Move, int]]:
+        """
+        :return: The learnset entries a mon gets going from old_level to new_level, not including old_level.
+        """
+        index = self._learnset_index()
+        return self.learnset[bisect_right(index, old_level):bisect_right(index, new_level)]
+
+    def moves_known_count(self, level: int) -> int:
+        """
+        :return: How many learnset entries a mon has learnt by this level. learnset[:count] are those entries.
+        """
+        return bisect_right(self._learnset_index(), level)
+
+    # type1, type2, evolve_mon id (255 for none), evolve_level (0 for none), base stats, weight, catch_rate,
+    # base_exp, learnset length. Then sprite and name strings, then (move id, level) for each learnt move.
+    # The desc goes in the description store instead.
+    _RECORD = '<BBBB6HHBHB'
+
+    def pack_record(self) -> bytes:
+        """
+        Turn this template into a data pack record. Opposite of MonTemplate.unpack_record().
+        """
+        data = bytearray(pack(
+            MonTemplate._RECORD, self.type1, self.type2,
+            self.evolve_mon.id if self.evolve_mon else 255, self.evolve_level or 0,
+            *self.base_stats, self.weight, self.catch_rate, self.base_exp, len(self.learnset)
+        ))
+        data += datapack.pack_str(str(self.sprite))
+        data += datapack.pack_str(self.name)
+        for move, level in self.learnset:
+            data += pack('<BB', move.id, level)
+        return data
+
+    @staticmethod
+    def unpack_record(index: int, data: bytes) -> 'MonTemplate':
+        """
+        Build a template from a data pack record. Any mon it evolves into, and its moves, are built too.
+        """
+        (type1, type2, evolve_id, evolve_level, hp, atk, defense, spatk, spdef, spd,
+         weight, catch_rate, base_exp, learnset_len) = unpack_from(MonTemplate._RECORD, data)
+        offset = calcsize(MonTemplate._RECORD)
+        sprite, offset = datapack.unpack_str(data, offset)
+        name, offset = datapack.unpack_str(data, offset)
+        learnset = []
+        for i in range(learnset_len):
+            move_id, level = unpack_from('<BB', data, offset + 2 * i)
+            learnset.append((moves.moves_list[move_id], level))
+        template = MonTemplate(
+            name, None, type1, type2,
+            mons_list[evolve_id] if evolve_id != 255 else None, evolve_level or None,
+            hp, atk, defense, spatk, spdef, spd, learnset,
+            int(sprite) if sprite.isdigit() else sprite,
+            weight, catch_rate, base_exp
+        )
+        template.id = index
+        return template
+
+# Where each of a Mon's numbers are in its array
+_STATS = 0
+_EVS = 6
+_IVS = 12
+_PP = 18
+_DATA_LEN = 22
+
+def _copy_into(data, start, values, count):
+    for i in range(count):
+        data[start + i] = values[i]
+
 class Mon:
     """
     The dynamic form of a mon. This is the one used in battles and everywhere else.
 
     Don't call functions on this directly if currently in battle - use the Battle object instead.
+
+    Stats, EVs, IVs and PP all live in one array, and are read and written through memoryviews of it,
+    so mon.stats[STAT_ATK] += 1 and the like still work. The views are made once, as battles read them every frame.
     """
+    __slots__ = ('template', 'nickname', 'level', 'hp', 'fainted', 'accuracy', 'evasion', 'status', 'xp',
+                 'moves', '_data', '_stats', '_evs', '_ivs', '_pp')
 
     def __init__(self, template: MonTemplate, level: int,
                  ivs: Union[List[int], None] = None,
@@ -100,10 +201,16 @@ class Mon:
         self.nickname = template.name
         self.level = level
 
-        #            hp    atk   def  spatk spdef  spd
-        self.stats = [0,    0,    0,    0,    0,    0]
+        # stats, evs and ivs (hp atk def spatk spdef spd), then pp
+        self._data = array('H', [0] * _DATA_LEN)
+        data = memoryview(self._data)
+        self._stats = data[_STATS:_STATS + 6]
+        self._evs = data[_EVS:_EVS + 6]
+        self._ivs = data[_IVS:_IVS + 6]
+        self._pp = data[_PP:_PP + 4]
 
-        self.evs = evs if evs else [0, 0, 0, 0, 0, 0]
+        if evs:
+            self.evs = evs
         self.ivs = ivs if ivs else [random.randint(0, 31) for _ in range(6)]
 
         self.calculate_stats()
@@ -116,9 +223,7 @@ class Mon:
 
         self.status = constants.StatusEffect.NO_EFFECT
 
-        self.xp = level*level*level
-
-        self.pp = [0, 0, 0, 0]
+        self.xp = levels.xp_for_level(level)
 
         self.moves = []  # type: List[moves.Move]
 
@@ -132,6 +237,38 @@ class Mon:
     def __repr__(self):
         return f'{self.nickname}, HP: {self.hp}'
 
+    @property
+    def stats(self):
+        return self._stats
+
+    @stats.setter
+    def stats(self, values: List[int]):
+        _copy_into(self._data, _STATS, values, 6)
+
+    @property
+    def evs(self):
+        return self._evs
+
+    @evs.setter
+    def evs(self, values: List[int]):
+        _copy_into(self._data, _EVS, values, 6)
+
+    @property
+    def ivs(self):
+        return self._ivs
+
+    @ivs.setter
+    def ivs(self, values: List[int]):
+        _copy_into(self._data, _IVS, values, 6)
+
+    @property
+    def pp(self):
+        return self._pp
+
+    @pp.setter
+    def pp(self, values: List[int]):
+        _copy_into(self._data, _PP, values, 4)
+
     def serialise(self) -> bytes:
         """
         Transform the mon into serialised data. Opposite of Mon.deserialise().
@@ -259,14 +396,11 @@ class Mon:
         This function resets PP and should only be used when a new mon is instantiated.
         """
         self.moves = []
-        self.pp = [0, 0, 0, 0]
-        for i in range(len(self.template.learnset) - 1, -1, -1):
+        self.pp = (0, 0, 0, 0)
+        for i in range(self.template.moves_known_count(self.level) - 1, -1, -1):
             if len(self.moves) >= 4:
                 break
 
-            if self.template.learnset[i][1] > self.level:
-                continue
-
             chance = 2.0 / 3.0
             if (4 - len(self.moves)) >= i:
                 chance = 1
@@ -344,655 +478,130 @@ class Mon:
         
     def modify_pp(self, by: int) -> int:
         for i in range(min(len(self.pp), len(self.moves))):
-            self.pp[i] += by
-            self.pp[i] = max(0, min(self.moves[i].max_pp, self.pp[i]))
+            self.pp[i] = max(0, min(self.moves[i].max_pp, self.pp[i] + by))
 
     def gain_exp(self, amount: int):
         self.xp += amount
 
     def level_up_needed(self):
-        l = (self.level+1)
-        return l*l*l <= self.xp
-
-mons_list = [
-    MonTemplate(
-        "EMF Duck", "Can quack louder than a jet engine",
-        constants.MonType.WATER, constants.MonType.NO_TYPE,
-        None, None,
-        50, 40, 40, 65, 60, 35, [
-            (moves.moves_list[1], 5),
-            (moves.moves_list[2], 5),
-            (moves.moves_list[11], 8),
-            (moves.moves_list[16], 13),
-            (moves.moves_list[14], 21),
-            (moves.moves_list[18], 30),
-            (moves.moves_list[41], 40)
-        ],
-        1,
-        100
-    ),
-    MonTemplate(
-        "EMF Goose", "It's a peaceful day in the Maths Village, and you are a horrible goose",
-        constants.MonType.WATER, constants.MonType.FIGHTING,
-        None, None,
-        80, 100, 65, 90, 65, 90, [
-            (moves.moves_list[1], 5),
-            (moves.moves_list[2], 5),
-            (moves.moves_list[11], 8),
-            (moves.moves_list[16], 13),
-            (moves.moves_list[14], 21),
-            (moves.moves_list[18], 30),
-            (moves.moves_list[41], 40)
-        ],
-        2,
-        4
-    ),
-    MonTemplate(
-        "Bit Warden", "Their powerful shield is self-hosted",
-        constants.MonType.PSYCHIC, constants.MonType.NO_TYPE,
-        None, None,
-        70, 70, 70, 40, 40, 25, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 5),
-            (moves.moves_list[24], 8),
-            (moves.moves_list[18], 13),
-            (moves.moves_list[20], 21),
-            (moves.moves_list[40], 30),
-            (moves.moves_list[44], 40)
-        ],
-        3,
-        100
-    ),
-    MonTemplate(
-        "Install Wizard", "He's actually paid for WinRAR",
-        constants.MonType.PSYCHIC, constants.MonType.NO_TYPE,
-        None, None,
-        75, 75, 75, 100, 100, 30, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 5),
-            (moves.moves_list[24], 8),
-            (moves.moves_list[18], 13),
-            (moves.moves_list[20], 21),
-            (moves.moves_list[40], 30),
-            (moves.moves_list[44], 40)
-        ],
-        4,
-        4
-    ),
-    MonTemplate(
-        "Blacksmith", "Has a lot of coke. don't ask",
-        constants.MonType.FIRE, constants.MonType.NO_TYPE,
-        None, None,
-        60, 90, 70, 20, 20, 60, [
-            (moves.moves_list[3], 5),
-            (moves.moves_list[12], 5),
-            (moves.moves_list[28], 8),
-            (moves.moves_list[30], 13),
-            (moves.moves_list[17], 21),
-            (moves.moves_list[26], 30),
-            (moves.moves_list[19], 40)
-        ],
-        5,
-        100
-    ),
-    MonTemplate(
-        "Blacksmite", "This is the last time you misuse an anvil in minecraft",
-        constants.MonType.FIRE, constants.MonType.STEEL,
-        None, None,
-        75, 100, 100, 70, 70, 60, [
-            (moves.moves_list[3], 5),
-            (moves.moves_list[12], 5),
-            (moves.moves_list[28], 8),
-            (moves.moves_list[30], 13),
-            (moves.moves_list[17], 21),
-            (moves.moves_list[26], 30),
-            (moves.moves_list[19], 40)
-        ],
-        6,
-        4
-    ),
-    MonTemplate(
-        "Radio Wave", "FM modulated!",
-        constants.MonType.WATER, constants.MonType.NO_TYPE,
-        None, None,
-        40, 60, 45, 60, 45, 120, [
-            (moves.moves_list[18], 5),
-            (moves.moves_list[3], 5),
-            (moves.moves_list[14], 8),
-            (moves.moves_list[41], 13),
-            (moves.moves_list[14], 21),
-            (moves.moves_list[15], 30),
-            (moves.moves_list[12], 40)
-        ],
-        7,
-        70
-    ),
-    MonTemplate(
-        "Radio Tsunami", "Someone left the microwave running again",
-        constants.MonType.WATER, constants.MonType.WATER,
-        None, None,
-        50, 75, 50, 75, 50, 150, [
-            (moves.moves_list[18], 5),
-            (moves.moves_list[3], 5),
-            (moves.moves_list[14], 8),
-            (moves.moves_list[41], 13),
-            (moves.moves_list[14], 21),
-            (moves.moves_list[15], 30),
-            (moves.moves_list[12], 40)
-        ],
-        8,
-        4
-    ),
-    MonTemplate(
-        "Pirate", "True pirates seed",
-        constants.MonType.DARK, constants.MonType.NO_TYPE,
-        None, None,
-        70, 80, 75, 25, 25, 50, [
-            (moves.moves_list[11], 5),
-            (moves.moves_list[1], 5),
-            (moves.moves_list[26], 8),
-            (moves.moves_list[2], 13),
-            (moves.moves_list[31], 21),
-            (moves.moves_list[15], 30),
-            (moves.moves_list[20], 40)
-        ],
-        "unknown",
-        80
-    ),
-    MonTemplate(
-        "Swashbuckler", "Has never paid for a copy of Photoshop",
-        constants.MonType.DARK, constants.MonType.NO_TYPE,
-        None, None,
-        75, 115, 90, 35, 35, 70, [
-            (moves.moves_list[11], 5),
-            (moves.moves_list[1], 5),
-            (moves.moves_list[26], 8),
-            (moves.moves_list[2], 13),
-            (moves.moves_list[31], 21),
-            (moves.moves_list[15], 30),
-            (moves.moves_list[20], 40)
-        ],
-        "unknown",
-        4
-    ),
-    MonTemplate(
-        "Furry", "Will nya for headpats",
-        constants.MonType.DRAGON, constants.MonType.NO_TYPE,
-        None, None,
-        75, 35, 25, 80, 80, 20, [
-            (moves.moves_list[25], 5),
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 8),
-            (moves.moves_list[18], 13),
-            (moves.moves_list[2], 21),
-            (moves.moves_list[3], 30),
-            (moves.moves_list[15], 40)
-        ],
-        "unknown",
-        80
-    ),
-    MonTemplate(
-        "Furry artist", "They're overworked, but damn are they not loaded",
-        constants.MonType.DRAGON, constants.MonType.NO_TYPE,
-        None, None,
-        90, 45, 50, 110, 100, 25, [
-            (moves.moves_list[25], 5),
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 8),
-            (moves.moves_list[18], 13),
-            (moves.moves_list[2], 21),
-            (moves.moves_list[3], 30),
-            (moves.moves_list[15], 40)
-        ],
-        "unknown",
-        8
-    ),
-    MonTemplate(
-        "Maths PhD", "They've written a thesis on how many hyperplanes you can fit in a non-euclidean sphere or something",
-        constants.MonType.NORMAL, constants.MonType.NO_TYPE,
-        None, None,
-        40, 30, 30, 75, 80, 40, [
-            (moves.moves_list[2], 5),
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 8),
-            (moves.moves_list[0], 13),
-            (moves.moves_list[18], 21),
-            (moves.moves_list[34], 30),
-            (moves.moves_list[42], 40)
-        ],
-        "unknown",
-        90
-    ),
-    MonTemplate(
-        "Maths Burnout", "Whoops",
-        constants.MonType.GHOST, constants.MonType.NO_TYPE,
-        None, None,
-        60, 40, 40, 140, 100, 50, [
-            (moves.moves_list[2], 5),
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 8),
-            (moves.moves_list[0], 13),
-            (moves.moves_list[18], 21),
-            (moves.moves_list[34], 30),
-            (moves.moves_list[42], 40)
-        ],
-        "unknown",
-        4
-    ),
-    MonTemplate(
-        "StaticShock", "Kinda spicy tbh",
-        constants.MonType.ELECTRIC, constants.MonType.NO_TYPE,
-        None, None,
-        15, 10, 10, 100, 30, 100, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 5),
-            (moves.moves_list[29], 8),
-            (moves.moves_list[35], 13),
-            (moves.moves_list[18], 21),
-            (moves.moves_list[21], 30),
-            (moves.moves_list[42], 40)
-        ],
-        "unknown",
-        80
-    ),
-    MonTemplate(
-        "Electrocution", "Too spicy tbh",
-        constants.MonType.ELECTRIC, constants.MonType.FIGHTING,
-        None, None,
-        25, 25, 25, 160, 50, 180, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 5),
-            (moves.moves_list[29], 8),
-            (moves.moves_list[35], 13),
-            (moves.moves_list[18], 21),
-            (moves.moves_list[21], 30),
-            (moves.moves_list[42], 40)
-        ],
-        "unknown",
-        4
-    ),
-    MonTemplate(
-        "LAZERS", "LAZERSLAZERSLAZERS",
-        constants.MonType.GHOST, constants.MonType.ELECTRIC,
-        None, None,
-        20, 40, 30, 80, 50, 120, [
-            (moves.moves_list[39], 5),
-            (moves.moves_list[29], 5),
-            (moves.moves_list[18], 8),
-            (moves.moves_list[42], 13),
-            (moves.moves_list[13], 21),
-            (moves.moves_list[0], 30),
-            (moves.moves_list[34], 40)
-        ],
-        "unknown",
-        70
-    ),
-    MonTemplate(
-        "LAAAZEERRRSS", "LAAAAAAZZZZZEEE EEEEERRRRRSS",
-        constants.MonType.GHOST, constants.MonType.ELECTRIC,
-        None, None,
-        50, 60, 40, 100, 70, 140, [
-            (moves.moves_list[39], 5),
-            (moves.moves_list[29], 5),
-            (moves.moves_list[18], 8),
-            (moves.moves_list[42], 13),
-            (moves.moves_list[13], 21),
-            (moves.moves_list[0], 30),
-            (moves.moves_list[34], 40)
-        ],
-        "unknown",
-        4
-    ),
-    MonTemplate(
-        "Pint", "Quite stout",
-        constants.MonType.POISON, constants.MonType.NO_TYPE,
-        None, None,
-        90, 70, 60, 25, 20, 40, [
-            (moves.moves_list[23], 5),
-            (moves.moves_list[11], 5),
-            (moves.moves_list[0], 8),
-            (moves.moves_list[1], 13),
-            (moves.moves_list[37], 21),
-            (moves.moves_list[19], 30),
-            (moves.moves_list[18], 40)
-        ],
-        "unknown",
-        100
-    ),
-    MonTemplate(
-        "Keg", "Finely aged",
-        constants.MonType.POISON, constants.MonType.NO_TYPE,
-        None, None,
-        125, 110, 100, 50, 40, 40, [
-            (moves.moves_list[23], 5),
-            (moves.moves_list[11], 5),
-            (moves.moves_list[0], 8),
-            (moves.moves_list[1], 13),
-            (moves.moves_list[37], 21),
-            (moves.moves_list[19], 30),
-            (moves.moves_list[18], 40)
-        ],
-        "unknown",
-        4
-    ),
-    MonTemplate(
-        "AntiStatic", "Makes your body less spicy",
-        constants.MonType.GROUND, constants.MonType.NO_TYPE,
-        None, None,
-        100, 55, 90, 40, 100, 25, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[3], 5),
-            (moves.moves_list[12], 8),
-            (moves.moves_list[36], 13),
-            (moves.moves_list[19], 21),
-            (moves.moves_list[38], 30),
-            (moves.moves_list[2], 40)
-        ],
-        "unknown",
-        60
-    ),
-    MonTemplate(
-        "Multimeter", "Knows how many amps are being drawn",
-        constants.MonType.ELECTRIC, constants.MonType.NO_TYPE,
-        None, None,
-        60, 55, 65, 55, 60, 40, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[29], 5),
-            (moves.moves_list[35], 8),
-            (moves.moves_list[18], 13),
-            (moves.moves_list[2], 21),
-            (moves.moves_list[40], 30),
-            (moves.moves_list[44], 40)
-        ],
-        "unknown",
-        80
-    ),
-    MonTemplate(
-        "Omnimeter", "Knows the answers to the universe",
-        constants.MonType.ELECTRIC, constants.MonType.PSYCHIC,
-        None, None,
-        80, 80, 90, 90, 80, 75, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[29], 5),
-            (moves.moves_list[35], 8),
-            (moves.moves_list[18], 13),
-            (moves.moves_list[2], 21),
-            (moves.moves_list[40], 30),
-            (moves.moves_list[44], 40)
-        ],
-        "unknown",
-        4
-    ),
-    MonTemplate(
-        "Firepit", "Keeps your hands warm - but watch out!",
-        constants.MonType.FIRE, constants.MonType.GROUND,
-        None, None,
-        30, 75, 25, 75, 30, 80, [
-            (moves.moves_list[38], 5),
-            (moves.moves_list[30], 5),
-            (moves.moves_list[18], 8),
-            (moves.moves_list[28], 13),
-            (moves.moves_list[30], 21),
-            (moves.moves_list[12], 30),
-            (moves.moves_list[0], 40)
-        ],
-        "unknown",
-        90
-    ),
-    MonTemplate(
-        "Firenado", "Fire makes everything better",
-        constants.MonType.FIRE, constants.MonType.FIRE,
-        None, None,
-        50, 100, 40, 110, 40, 130, [
-            (moves.moves_list[38], 5),
-            (moves.moves_list[30], 5),
-            (moves.moves_list[18], 8),
-            (moves.moves_list[28], 13),
-            (moves.moves_list[30], 21),
-            (moves.moves_list[12], 30),
-            (moves.moves_list[0], 40)
-        ],
-        "unknown",
-        4
-    ),
-    MonTemplate(
-        "Ghidra", "There's a lingering feeling that they're a cop but it's probably fine",
-        constants.MonType.DRAGON, constants.MonType.NO_TYPE,
-        None, None,
-        60, 100, 80, 50, 110, 10, [
-            (moves.moves_list[25], 5),
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 8),
-            (moves.moves_list[2], 13),
-            (moves.moves_list[27], 21),
-            (moves.moves_list[15], 30),
-            (moves.moves_list[43], 40)
-        ],
-        "unknown",
-        50
-    ),
-    MonTemplate(
-        "EMF 2020", "Faint whispers of festivals past",
-        constants.MonType.GHOST, constants.MonType.NO_TYPE,
-        None, None,
-        50, 90, 90, 90, 90, 20, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[34], 5),
-            (moves.moves_list[39], 8),
-            (moves.moves_list[13], 13),
-            (moves.moves_list[18], 21),
-            (moves.moves_list[19], 30),
-            (moves.moves_list[3], 40)
-        ],
-        "unknown",
-        20
-    ),
-    MonTemplate(
-        "smolhaj", "Just a lil guy",
-        constants.MonType.WATER, constants.MonType.NO_TYPE,
-        None, None,
-        15, 15, 25, 20, 40, 20, [
-            (moves.moves_list[11], 5),
-            (moves.moves_list[0], 5),
-            (moves.moves_list[14], 8),
-            (moves.moves_list[41], 13),
-            (moves.moves_list[18], 21),
-            (moves.moves_list[20], 30),
-            (moves.moves_list[41], 40)
-        ],
-        9,
-        70
-    ),
-    MonTemplate(
-        "blahaj", "Does 2x damage to transphobes",
-        constants.MonType.WATER, constants.MonType.NO_TYPE,
-        None, None,
-        110, 160, 80, 140, 60, 90, [
-            (moves.moves_list[11], 5),
-            (moves.moves_list[0], 5),
-            (moves.moves_list[14], 8),
-            (moves.moves_list[41], 13),
-            (moves.moves_list[18], 21),
-            (moves.moves_list[20], 30),
-            (moves.moves_list[41], 40)
-        ],
-        10,
-        4
-    ),
-    MonTemplate(
-        "Tetris", "Is often seen hiding in the arcade",
-        constants.MonType.NORMAL, constants.MonType.NO_TYPE,
-        None, None,
-        200, 120, 100, 60, 120, 60, [
-            (moves.moves_list[0], 5),
-            (moves.moves_list[1], 5),
-            (moves.moves_list[2], 8),
-            (moves.moves_list[3], 13),
-            (moves.moves_list[15], 21),
-            (moves.moves_list[21], 30),
-            (moves.moves_list[43], 40)
-        ],
-        0,
-        20
-    ),
-    MonTemplate(
-        "Mew", "Was found hiding under a van in null sector",
-        constants.MonType.PSYCHIC, constants.MonType.NO_TYPE,
-        None, None,
-        100, 100, 100, 100, 100, 100, [
-            (moves.moves_list[40], 5),
-            (moves.moves_list[44], 5),
-            (moves.moves_list[2], 8),
-            (moves.moves_list[3], 13),
-            (moves.moves_list[24], 21),
-            (moves.moves_list[18], 30),
-            (moves.moves_list[19], 40)
-        ],
-        "unknown",
-        4
-    ),
-    MonTemplate(
-        "NaN", "They will absorb your vision into their consiousness",
-        constants.MonType.POISON, constants.MonType.BUG,
-        None, None,
-        10, 156, 42, 11, 69, 12, [
-            (moves.moves_list[23], 5),
-            (moves.moves_list[8], 5),
-            (moves.moves_list[9], 8),
-            (moves.moves_list[10], 13),
-            (moves.moves_list[23], 21),
-            (moves.moves_list[32], 30),
-            (moves.moves_list[43], 40)
-        ],
-        "unknown",
-        50
-    ),
-    MonTemplate(
-        "NullPointer", "You follow the signs, but they point at the abyss. Your journey has been meaningless",
-        constants.MonType.POISON, constants.MonType.BUG,
-        None, None,
-        70, 117, 77, 21, 127, 13, [
-            (moves.moves_list[23], 5),
-            (moves.moves_list[8], 5),
-            (moves.moves_list[9], 8),
-            (moves.moves_list[10], 13),
-            (moves.moves_list[23], 21),
-            (moves.moves_list[32], 30),
-            (moves.moves_list[43], 40)
-        ],
-        "unknown",
-        20
-    ),
-    MonTemplate(
-        "MISSINGNO.", "The shoreline is awash with the screams of those that should not exist",
-        constants.MonType.POISON, constants.MonType.BUG,
-        None, None,
-        15, 287, 87, 137, 13, 11, [
-            (moves.moves_list[23], 5),
-            (moves.moves_list[8], 5),
-            (moves.moves_list[9], 8),
-            (moves.moves_list[10], 13),
-            (moves.moves_list[23], 21),
-            (moves.moves_list[32], 30),
-            (moves.moves_list[43], 40)
-        ],
-        "unknown",
-        10
-    ),
-    MonTemplate(
-        "Div. Zero", "These axioms are too feeble to describe the knowledge of the gods",
-        constants.MonType.BUG, constants.MonType.NO_TYPE,
-        None, None,
-        70, 110, 0, 110, 0, 0, [
-            (moves.moves_list[32], 5),
-            (moves.moves_list[9], 5),
-            (moves.moves_list[10], 8),
-            (moves.moves_list[8], 13),
-            (moves.moves_list[19], 21),
-            (moves.moves_list[18], 30),
-            (moves.moves_list[43], 40)
-        ],
-        "unknown",
-        40
-    ),
-    MonTemplate(
-        "Out.Memory", "Your head is full, but it is set to burst. Everything fades",
-        constants.MonType.BUG, constants.MonType.NO_TYPE,
-        None, None,
-        90, 111, 111, 111, 111, 44, [
-            (moves.moves_list[32], 5),
-            (moves.moves_list[9], 5),
-            (moves.moves_list[10], 8),
-            (moves.moves_list[8], 13),
-            (moves.moves_list[19], 21),
-            (moves.moves_list[18], 30),
-            (moves.moves_list[43], 40)
-        ],
-        "unknown",
-        10
-    ),
-]
-
-print(f"NO. MONS: {len(mons_list)}")
-
-# duck -> goose
-mons_list[ 0].evolve_level = 15
-mons_list[ 0].evolve_mon = mons_list[1]
-# warden -> wizard
-mons_list[ 2].evolve_level = 20
-mons_list[ 2].evolve_mon = mons_list[3]
-# smith -> smite
-mons_list[ 4].evolve_level = 17
-mons_list[ 4].evolve_mon = mons_list[5]
-# wave -> tsunami
-mons_list[ 6].evolve_level = 18
-mons_list[ 6].evolve_mon = mons_list[7]
-# pirate -> swashbucker
-mons_list[ 8].evolve_level = 19
-mons_list[ 8].evolve_mon = mons_list[9]
-# furry -> artist
-mons_list[10].evolve_level = 16
-mons_list[10].evolve_mon = mons_list[11]
-# PhD -> burnout
-mons_list[12].evolve_level = 16
-mons_list[12].evolve_mon = mons_list[13]
-# static -> 'cute
-mons_list[14].evolve_level = 20
-mons_list[14].evolve_mon = mons_list[15]
-# lazer -> LAZER
-mons_list[16].evolve_level = 15
-mons_list[16].evolve_mon = mons_list[17]
-# pint -> keg
-mons_list[18].evolve_level = 18
-mons_list[18].evolve_mon = mons_list[19]
-# multi -> omni
-mons_list[21].evolve_level = 23
-mons_list[21].evolve_mon = mons_list[22]
-# pit -> nado
-mons_list[23].evolve_level = 19
-mons_list[23].evolve_mon = mons_list[24]
-# smol -> haj
-mons_list[27].evolve_level = 17
-mons_list[27].evolve_mon = mons_list[28]
-# nan -> null
-mons_list[31].evolve_level = 25
-mons_list[31].evolve_mon = mons_list[32]
-# null -> missing
-mons_list[32].evolve_level = 39
-mons_list[32].evolve_mon = mons_list[33]
-# div -> outmem
-mons_list[34].evolve_level = 27
-mons_list[34].evolve_mon = mons_list[35]
-
-_cum = 0
-_cum_weights = []
-for mon in mons_list:
-    _cum += mon.weight
-    _cum_weights.append(_cum)
-
-def choose_weighted_mon():
-    value = random.randrange(0, _cum)
-    i = 0
-    while _cum_weights[i] < value:
-        i+=1
-    return mons_list[i]
+        return self.level < levels.MAX_LEVEL and levels.xp_for_level(self.level + 1) <= self.xp
+
+    def level_from_xp(self) -> int:
+        """
+        @return: The level this mon should be at with its current xp. Never lower than its current level.
+        """
+        return max(self.level, levels.level_for_xp(self.xp))
+
+class EncounterTable:
+    """
+    A weighted table of mons that can be encountered.
+
+    Sampling uses the alias method, so it takes one random number and no searching.
+    If a weight is changed, the cumulative weights are updated in place and samples
+    bisect them until enough samples have been taken to pay for rebuilding the alias table.
+    """
+    def __init__(self, weights: List[int], templates: Union[List[MonTemplate], None] = None):
+        """
+        :param weights: The weight of each mon, as with MonTemplate.weight. 0 means never.
+        :param templates: The mons to choose from, in the same order as weights. Defaults to mons_list.
+        """
+        self.templates = mons_list if templates is None else templates
+        self._weights = array('I', weights)
+        self._cum_weights = array('I', weights)
+        self._rebuild_cumulative(0)
+        self._prob = array('I', [0] * len(weights))
+        self._alias = array('H', [0] * len(weights))
+        self._build_alias()
+
+    def _rebuild_cumulative(self, start: int):
+        cum = self._cum_weights[start - 1] if start > 0 else 0
+        for i in range(start, len(self._weights)):
+            cum += self._weights[i]
+            self._cum_weights[i] = cum
+        self.total = cum
+
+    def _build_alias(self):
+        # Vose's alias method, in integers. Every bucket holds total/n of the weight,
+        # made up of prob[i]/total of its own mon and the rest of its alias.
+        n = len(self._weights)
+        scaled = [w * n for w in self._weights]
+        small = [i for i in range(n) if scaled[i] < self.total]
+        large = [i for i in range(n) if scaled[i] >= self.total]
+        while small and large:
+            s = small.pop()
+            l = large[-1]
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] -= self.total - scaled[s]
+            if scaled[l] < self.total:
+                small.append(large.pop())
+        for i in large:
+            self._prob[i] = self.total
+        for i in small:
+            # Only left over by a weight of zero everywhere
+            self._prob[i] = self.total
+        self._stale_samples = -1
+
+    def set_weight(self, index: int, weight: int):
+        """
+        Change how likely a mon in this table is to appear.
+        """
+        self._weights[index] = weight
+        self._rebuild_cumulative(index)
+        self._stale_samples = 0
+
+    def sample(self) -> MonTemplate:
+        """
+        :return: A random mon from this table.
+        """
+        if self.total == 0:
+            raise ValueError("Every mon in this EncounterTable has a weight of 0")
+        if self._stale_samples >= 0:
+            self._stale_samples += 1
+            if self._stale_samples >= len(self._weights):
+                self._build_alias()
+            else:
+                return self.templates[bisect_right(self._cum_weights, random.randrange(0, self.total))]
+        r = random.randrange(0, len(self._weights) * self.total)
+        i = r // self.total
+        if r - i * self.total < self._prob[i]:
+            return self.templates[i]
+        return self.templates[self._alias[i]]
+
+    def sample_with_level(self, min_level: int, max_level: int) -> Tuple[MonTemplate, int]:
+        """
+        :param min_level: The lowest level to pick.
+        :param max_level: One past the highest level to pick.
+        :return: A random mon from this table, and a random level for it.
+        """
+        return self.sample(), random.randrange(min_level, max(max_level, min_level + 1))
+
+_pack = datapack.get_pack()
+if _pack:
+    mons_list = datapack.LazyList(_pack, datapack.MONS, MonTemplate.unpack_record)
+    # Weights are kept in a record of their own, so encounters can be set up without building every mon
+    mon_weights = array('H', unpack_from(f'<{len(mons_list)}H', _pack.record(datapack.MON_WEIGHTS, 0)))
+else:
+    from .mons_data import mons_list
+    mon_weights = array('H', [mon.weight for mon in mons_list])
+
+# Every mon, weighted by MonTemplate.weight. Tables for other areas can be made from their own weights.
+default_encounters = EncounterTable(mon_weights)
+
+def evolution_of(index: int) -> Tuple[int, int]:
+    """
+    Read what a mon evolves into, without building its template (or the template it evolves into).
+    :param index: The mon's id.
+    :return: The id of the mon it evolves into, or 255 for none, and the level it evolves at, or 0 for none.
+    """
+    if _pack:
+        return unpack_from('<BB', _pack.record(datapack.MONS, index), 2)
+    template = mons_list[index]
+    if template.evolve_mon is None or not template.evolve_level:
+        return 255, 0
+    return template.evolve_mon.id, template.evolve_level
+
+def choose_weighted_mon(table: Union[EncounterTable, None] = None) -> MonTemplate:
+    if table is None:
+        table = default_encounters
+    return table.sample()
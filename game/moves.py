@@ -1,7 +1,9 @@
 import math
+from array import array
+from struct import pack, unpack_from, calcsize
 from ..util import static_random as random
 
-from . import constants
+from . import constants, datapack, descriptions
 
 try:
     from sys import implementation as _sys_implementation
@@ -14,14 +16,23 @@ try:
 except ImportError:
     pass
 
-from ..util.animation import Animation, AnimationEvent
+from ..util.animation import Animation
 from ..util import animation
 from ..util.misc import shrink_until_fit, ASSET_PATH
-from asyncio import Event
+from ..util.image import get_layer
 from ctx import Context
 from app import App
 
+# How far apart baked animation frames are, in ms
+FRAME_MS = 20
+# How many animations' baked frames to keep. A battle only uses a few, with the mons in the same two places.
+_BAKED_SIZE = 4
+
 class MoveAnim(Animation):
+    # (key, frames) for frames that have been worked out already, most recently used last.
+    # The key is the animation class and anything else that changes them.
+    _baked = []
+
     def __init__(self, *args, app: App, draw_user = True, draw_target = True, user_pos: Tuple[float, float] = (0,0), target_pos: Tuple[float, float] = (0,0), user: 'Mon' = None, target: 'Mon' = None, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._draw_user = draw_user
@@ -51,62 +62,129 @@ class MoveAnim(Animation):
     def draw(self, ctx: Context) -> None:
         pass
 
+    def _bake(self, key: tuple, fun: Callable[[float], Tuple[float, ...]]) -> array:
+        """
+        Work out every frame of the animation, or get them if an identical one already has.
+        :param key: Everything the frames depend on, apart from the length.
+        :param fun: Gives the numbers for one frame, from how far through the animation it is.
+        @return: Each frame's numbers one after another
+        """
+        key = (type(self), self._length) + key
+        baked = MoveAnim._baked
+        for i in range(len(baked)):
+            entry = baked[i]
+            if entry[0] == key:
+                if i != len(baked) - 1:
+                    baked.append(baked.pop(i))
+                return entry[1]
+        count = self._length // FRAME_MS + 1
+        values = []
+        for i in range(count):
+            values.extend(fun(i / max(count - 1, 1)))
+        frames = array("f", values)
+        if len(baked) >= _BAKED_SIZE:
+            baked.pop(0)
+        baked.append((key, frames))
+        return frames
+
+    def _frame(self, frames: array, stride: int) -> int:
+        """
+        @return: Where in frames the frame to show now starts.
+        """
+        count = len(frames) // stride
+        i = int(self._time * (count - 1) + 0.5)
+        return min(max(i, 0), count - 1) * stride
+
 class SlanderAnim(MoveAnim):
     def __init__(self, *args, length=3000, **kwargs) -> None:
         insults = ["SUCKS", "IS BAD", "STINKS"]
         self.insult = random.choice(insults)
         super().__init__(*args, length, **kwargs)
+        # (rotation, scale, fade) for each frame
+        self._frames = self._bake((), self._transform)
+        self._name = self._target.nickname.upper()
+        # Font sizes for the name and insult, found on the first draw
+        self._sizes = None
 
-    def draw(self, ctx: Context) -> None:
-        if self._time < 0.33:
-            rot = animation.lerp(0,math.tau*3.95,self._time*3.0)
-            scale = animation.lerp(time=self._time*3.0)
+    @staticmethod
+    def _transform(time: float) -> Tuple[float, float, float]:
+        if time < 0.33:
+            rot = animation.lerp(0,math.tau*3.95,time*3.0)
+            scale = animation.lerp(time=time*3.0)
         else:
             scale = 1
             rot = math.tau*3.95
-        if self._time > 0.75:
-            fade = animation.lerp(1,0,(self._time-0.75)*4)
+        if time > 0.75:
+            fade = animation.lerp(1,0,(time-0.75)*4)
         else:
             fade = 1
-        
+        return rot, scale, fade
+
+    def draw(self, ctx: Context) -> None:
+        i = self._frame(self._frames, 3)
+        rot = self._frames[i]
+        scale = self._frames[i + 1]
+        fade = self._frames[i + 2]
+        if self._sizes is None:
+            self._sizes = (shrink_until_fit(ctx, self._name, 90, 60), shrink_until_fit(ctx, self.insult, 90, 60))
+
         ctx.rotate(rot)
         ctx.scale(scale,scale)
         ctx.rectangle(-50,-50,100,100).rgba(1,1,1,fade).fill()
-        ctx.rectangle(-50,-50,100,100).rgba(0,0,0,fade).stroke()
+        ctx.rectangle(-50,-50,100,100)
         for i in range(5):
-            ctx.move_to(-40, 10*i).line_to(40,10*i).stroke()
+            ctx.move_to(-40, 10*i).line_to(40,10*i)
+        ctx.rgba(0,0,0,fade).stroke()
         ctx.text_align = Context.CENTER
         ctx.text_baseline = Context.MIDDLE
-        name = self._target.nickname.upper()
-        shrink_until_fit(ctx, name, 90, 60)
-        ctx.move_to(0,-35).text(name)
-        shrink_until_fit(ctx, self.insult, 90, 60)
+        ctx.font_size = self._sizes[0]
+        ctx.move_to(0,-35).text(self._name)
+        ctx.font_size = self._sizes[1]
         ctx.move_to(0,-15).text(self.insult)
 
 class ScratchAnim(MoveAnim):
     def __init__(self, *args, length=500, **kwargs) -> None:
         super().__init__(*args, length, **kwargs)
-    
-    def draw(self, ctx: Context) -> None:
-        end = animation.slower(x=self._time)
-        start = animation.faster(x=self._time)
+        # The three lines, (x1, y1, x2, y2) each, for each frame
+        self._frames = self._bake(tuple(self._target_pos), self._lines)
+
+    def _lines(self, time: float) -> List[float]:
+        end = animation.slower(x=time)
+        start = animation.faster(x=time)
+        lines = []
         for i in range(3):
             start_point_x = self._target_pos[0] + 15-i*30
             end_point_x = self._target_pos[0] + 45-i*30
             start_point_y = self._target_pos[1] + 45-i*15
             end_point_y = self._target_pos[1] + -45-i*15
-            ctx.move_to(animation.lerp(start_point_x, end_point_x, start), animation.lerp(start_point_y, end_point_y, start))\
-                .line_to(animation.lerp(start_point_x, end_point_x, end), animation.lerp(start_point_y, end_point_y, end))\
-                .rgb(0.8,0.2,0.2).stroke()
+            lines.extend((
+                animation.lerp(start_point_x, end_point_x, start), animation.lerp(start_point_y, end_point_y, start),
+                animation.lerp(start_point_x, end_point_x, end), animation.lerp(start_point_y, end_point_y, end)
+            ))
+        return lines
+
+    def draw(self, ctx: Context) -> None:
+        f = self._frames
+        o = self._frame(f, 12)
+        for i in range(o, o + 12, 4):
+            ctx.move_to(f[i], f[i + 1]).line_to(f[i + 2], f[i + 3])
+        ctx.rgb(0.8,0.2,0.2).stroke()
             
 class DevourAnim(MoveAnim):
     def __init__(self, *args, length=4000, **kwargs) -> None:
         self.image = ASSET_PATH+"moves/devour-"+str(random.randrange(0,3))+".jpg"
         super().__init__(*args, length, **kwargs)
 
+    def on_anim_start(self) -> None:
+        get_layer().show(self.image)
+        return super().on_anim_start()
+
+    def on_anim_end(self) -> None:
+        get_layer().release()
+        return super().on_anim_end()
+
     def draw(self, ctx: Context) -> None:
-        ctx.image_smoothing = 0
-        ctx.image(self.image, -120, -120, 240, 240)
+        get_layer().draw(ctx)
         text_pos = animation.lerp(0, -600, self._time)
         ctx.text_align = Context.LEFT
         ctx.text_baseline = Context.MIDDLE
@@ -122,14 +200,44 @@ class MoveOverrideSpecial:
     NO_OVERRIDE = 0
 
 
+class EffectOp:
+    """
+    Opcodes for compiled move effects. A compiled effect is a flat list of (opcode, args) tuples,
+    which Battle.run_effect steps through in order. Each op sets the outcome (True or False) that the
+    next conditional op checks. Everything except CALL is plain data, so can be sent to the other badge.
+
+    CALL: (function,) - a custom MoveSpecial function
+    STATUS: (status, chance_to_apply)
+    RECOIL: (pct,)
+    ANIMATION: (index into move_anims,)
+    SKIP_UNLESS: (wanted_outcome, count) - if the last outcome wasn't wanted_outcome,
+     the outcome becomes False and the next count ops are skipped.
+    """
+    CALL = 0
+    STATUS = 1
+    RECOIL = 2
+    ANIMATION = 3
+    SKIP_UNLESS = 4
+
+
+# Animations that can be referenced by EffectOp.ANIMATION
+move_anims = [ScratchAnim, SlanderAnim, DevourAnim]
+
+# Custom MoveSpecial functions used by moves. A data pack refers to them by their index here,
+# so they have to be listed before the pack is built.
+move_specials = []
+
+
 class MoveEffect:
     """
     Special effects called when moves are used, to do things aside from just dealing damage.
-    Works as a nested set of functions.
+    Works as a chain of steps, which is compiled into a flat list of ops before it is run.
 
     Objects can be instantiated using the MoveEffect static method (for prebuilt functions)
     or by writing a custom function with the signature:
-    function(battle: battle_main.Battle, user: mons.Mon, target: mons.Mon, damage: int)
+    function(battle: battle_main.Battle, user: mons.Mon, target: mons.Mon, damage: int) -> bool
+
+    Effects never wait on the UI. Anything that should be shown is queued on the battle as an event.
 
     To chain effects together (e.g. to deal 20% recoil damage then apply the BURNING status effect),
     use "then()" on a MoveEffect object.
@@ -144,13 +252,7 @@ class MoveEffect:
         :param chance_to_apply: The chance that status is applied.
         :return: A MoveEffect object containing this effect only.
         """
-        async def function(battle: 'Battle', user: 'Mon', target: 'Mon', damage: int):
-            if random.random() < chance_to_apply:
-                return await battle.inflict_status(user, target, status)
-
-            return False
-
-        return MoveEffect(function)
+        return MoveEffect((EffectOp.STATUS, (status, chance_to_apply)))
 
     @staticmethod
     def recoil_damage(pct: float) -> "MoveEffect":
@@ -159,35 +261,18 @@ class MoveEffect:
         :param pct: The amount of damage to deal back to the user.
         :return: A MoveEffect object containing this effect only.
         """
-        async def function(battle: 'Battle', user: 'Mon', target: 'Mon', damage: int):
-            await battle.deal_damage(
-                user, target, math.floor(damage * pct), None, "{target} took {damage_taken} recoil damage!"
-            )
-            return True
-
-        return MoveEffect(function)
+        return MoveEffect((EffectOp.RECOIL, (pct,)))
 
     @staticmethod
     def animation(Anim: MoveAnim) -> "MoveEffect":
         """
-        Plays an animation in full before continuing.
-        :param anim: The Animation
+        Queues an animation, which the presenter plays in full before showing anything after it.
+        :param anim: The Animation class. It is constructed by the presenter.
         :return: A MoveEffect object containing this effect only.
         """
-        async def function(battle: 'Battle', user: 'Mon', target: 'Mon', damage: int):
-            if user == battle.mon1:
-                user_pos, target_pos = (-16*3, (16*3)-10), (16*3, -(16*3)+10)
-            else:
-                target_pos, user_pos = (-16*3, (16*3)-10), (16*3, -(16*3)+10)
-
-            anim = Anim(app=battle._app, user_pos=user_pos, target_pos=target_pos, user = user, target = target)
-            event = Event()
-            anim.and_then(AnimationEvent(event))
-            battle._app._animation_scheduler.trigger(anim)
-            await event.wait()
-            return True
-
-        return MoveEffect(function)
+        if Anim not in move_anims:
+            move_anims.append(Anim)
+        return MoveEffect((EffectOp.ANIMATION, (move_anims.index(Anim),)))
 
     def _extend_with_condition(
             self, new_fn: Union['MoveSpecial', "MoveEffect"], valid_outcomes: List) -> "MoveEffect":
@@ -197,24 +282,18 @@ class MoveEffect:
         :param valid_outcomes: A list of the valid outcomes (true or false). "Always" is [True, False].
         :return: This object.
         """
-        old_fn = self.action
-
-        new_fn_checked = new_fn
-        if isinstance(new_fn, MoveEffect):
-            new_fn_checked = new_fn.action
-
-        async def new_action(battle: 'Battle', user: 'Mon', target: 'Mon', damage: int) -> bool:
-            outcome = await old_fn(battle, user, target, damage)
-            if outcome in valid_outcomes:
-                return await new_fn_checked(battle, user, target, damage)
-
-            return False
-
-        self.action = new_action
+        if True in valid_outcomes and False in valid_outcomes:
+            condition = None
+        else:
+            condition = True in valid_outcomes
+        self._steps.append((condition, new_fn))
         return self
 
-    def __init__(self, action: 'MoveSpecial'):
-        self.action = action
+    def __init__(self, action: Union['MoveSpecial', Tuple]):
+        """
+        :param action: A MoveSpecial function, or an (opcode, args) tuple.
+        """
+        self._steps = [(None, action)]
 
     def then(self, new_fn: Union['MoveSpecial', "MoveEffect"]):
         """
@@ -242,20 +321,44 @@ class MoveEffect:
         """
         return self._extend_with_condition(new_fn, [True])
 
-    async def execute(self, battle: 'Battle', user: 'Mon', target: 'Mon', damage: int):
+    def compile(self) -> List[Tuple]:
+        """
+        Flatten this chain (and any MoveEffects chained into it) into a list of (opcode, args) tuples.
+        A chained MoveEffect is inlined behind a SKIP_UNLESS op covering all of it, so it still
+        counts as a single step of this chain.
+        :return: The ops, to be run by Battle.run_effect.
+        """
+        ops = []
+        for condition, step in self._steps:
+            if isinstance(step, MoveEffect):
+                body = step.compile()
+            elif isinstance(step, tuple):
+                body = [step]
+            else:
+                body = [(EffectOp.CALL, (step,))]
+            if condition is not None:
+                ops.append((EffectOp.SKIP_UNLESS, (condition, len(body))))
+            ops.extend(body)
+        return ops
+
+    def execute(self, battle: 'Battle', user: 'Mon', target: 'Mon', damage: int):
         """
         Do it. Call this when the move is used - after damage is calculated and dealt. If the move missed, still call
          this, but use the predicted damage rather than the actual damage.
+
+        This compiles the effect every time. Moves use their cached copy from Move.compiled_effects() instead.
         :param battle: The current battle.
         :param user: The user of the move.
         :param target: The target of the move.
         :param damage: The amount of damage the move dealt (or would have done, in the case of a miss)
         :return:
         """
-        await self.action(battle, user, target, damage)
+        battle.run_effect(self.compile(), user, target, damage)
 
 
 class Move:
+    __slots__ = ('id', 'name', '_desc', 'move_type', 'max_pp', 'power', 'accuracy',
+                 'effect_on_hit', 'effect_on_miss', 'special_override', '_compiled')
     id_inc = 0
 
     def __init__(
@@ -266,7 +369,7 @@ class Move:
         """
         Any kind of move.
         :param name: The name of the move.
-        :param desc: The description of the move.
+        :param desc: The description of the move. None to load it from the description store.
         :param move_type: The damage type of the move.
         :param max_pp: The maximum PP of the move. The move's PP is reset to this on a full heal.
         :param power: Analogous to Pokémon move power, e.g. tackle is 40 power, hyper beam is 150.
@@ -279,7 +382,7 @@ class Move:
         Move.id_inc += 1
 
         self.name = name
-        self.desc = desc
+        self._desc = desc
         self.move_type = move_type
         self.max_pp = max_pp
         self.power = power
@@ -287,52 +390,106 @@ class Move:
         self.effect_on_hit = effect_on_hit
         self.effect_on_miss = effect_on_miss
         self.special_override = special_override
+        self._compiled = None
+
+    def compiled_effects(self) -> Tuple[Union[List[Tuple], None], Union[List[Tuple], None]]:
+        """
+        The move's effects as flat lists of ops. These are compiled the first time they are needed, then kept.
+        :return: (ops on hit, ops on miss). Either is None if the move has no effect for it.
+        """
+        if self._compiled is None:
+            self._compiled = (
+                self.effect_on_hit.compile() if self.effect_on_hit else None,
+                self.effect_on_miss.compile() if self.effect_on_miss else None
+            )
+        return self._compiled
+
+    @property
+    def desc(self) -> str:
+        """
+        The description. Loaded from the description store when this came from a data pack.
+        """
+        if self._desc is None:
+            return descriptions.get(descriptions.MOVES, self.id)
+        return self._desc
 
+    # move_type, max_pp, power, accuracy, special_override. Then the name string,
+    # then the compiled on hit and on miss ops. The desc goes in the description store instead.
+    _RECORD = '<BBBBB'
 
-moves_list = [
-    Move('Scratch', 'Scratches opponent', constants.MonType.NORMAL, 35, 40, 100, MoveEffect.animation(ScratchAnim)),
-    Move('Tackle', "A crude body slam.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Bite', "The user bites the opponent.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Slap', "A quick slap to the opponent's face.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('PleadingFace', "The user looks pathetically at the opponent, reducing their ATK and SpATK.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Scowl', "The user fixes a withering scowl at the opponent, sharply reducing their DEF.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Think', "The user ponders deeply, gaining an increase to SpATK and SpDEF.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('PsychUp', "The user repeats some words of self-encouragement, gaining an increase to ATK and SpATK.", constants.MonType.FIGHTING, 35, 40, 100),
-    Move('free()', "Deallocates the space previously allocated to the opponent", constants.MonType.BUG, 35, 40, 100),
-    Move('StackSmash', "Writes a \'normal amount of data\' to the opponent's stack.", constants.MonType.BUG, 35, 40, 100),
-    Move('SQLInject', "Writes a \'normal\' string to the opponent's database';DROP TABLE HP", constants.MonType.BUG, 35, 40, 100),
-    Move('WetFish', "The opponent is hit across the face with a wet fish", constants.MonType.WATER, 35, 40, 100),
-    Move('ScathingInsult', "Make a witty remark about the opponent's mother.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Pandemic', "Cancels opponent due to pandemic restrictions", constants.MonType.GHOST, 35, 40, 100),
-    Move('TorrentialRain', "Maybe if the opponent had pitched at the top of the hill they would still be fine right now", constants.MonType.WATER, 35, 40, 100),
-    Move('ICBM', "This feels self explanatory.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Mallet', "Hits opponent with comically large mallet", constants.MonType.FIGHTING, 35, 40, 100),
-    Move('Rework', "Rework the opponent into a stylish broach", constants.MonType.STEEL, 35, 40, 100),
-    Move('Slander', "Run a smear campain against the opponent in the local newspaper.", constants.MonType.NORMAL, 35, 40, 100, MoveEffect.animation(SlanderAnim)),
-    Move('Nose!', "Get your opponent's nose.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('DangerHug', "Gives opponent a (deadly) hug.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('PinchCheeks', "Pinch the opponent's cheeks and tell them how much they've grown.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('MailFraud', "All items applied to the opponent for 2 turns will be appllied to you instead.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('Intoxicate', "Gets opponent drunk.", constants.MonType.POISON, 35, 40, 100),
-    Move('Irrationalise', "Use advanced mathematics to prove that the opponent is irrational, and therefore not representable as a fraction.", constants.MonType.PSYCHIC, 35, 40, 100),
-    Move('Rawr', "OwO? *nuzzles opponent*", constants.MonType.DRAGON, 35, 40, 100),
-    Move('Uppercut', "Pow! Blam! Wham! Slap! Ka-pow!", constants.MonType.FIGHTING, 35, 40, 100),
-    Move('Disassemble', "Disassembles the opponent to look for vulnerabilities.", constants.MonType.DRAGON, 35, 40, 100),
-    Move('Arson', "Did you know that the opponent is flammable?", constants.MonType.FIRE, 35, 40, 100),
-    Move('Tazer', "The power of the sun in the palm of your hand.", constants.MonType.ELECTRIC, 35, 40, 100),
-    Move('FlamingSword', "Its cool factor more than makes up for its impractibility.", constants.MonType.FIRE, 35, 40, 100),
-    Move('Duel', "Challenge opponent to pistol duel", constants.MonType.DARK, 35, 40, 100),
-    Move('FP16', "Cast the opponent to a smaller data type, making them less accurate.", constants.MonType.BUG, 35, 40, 100),
-    Move('ShakeHands', "Shake hands with the opponent and recover 50% HP each.", constants.MonType.NORMAL, 35, 40, 100),
-    Move('OOOooOOoO!', "Spook opponent", constants.MonType.GHOST, 35, 40, 100),
-    Move('Overvolt', "Send more than the rated voltage to the opponent's VCC pin.", constants.MonType.ELECTRIC, 35, 40, 100),
-    Move('Drain', "Reduce the opponent's voltage potential.", constants.MonType.GROUND, 35, 40, 100),
-    Move('DodgyCurry', "Serve the opponent a dodgy curry.", constants.MonType.POISON, 35, 40, 100),
-    Move('Bury', "Covers opponent in a layer of dirt", constants.MonType.GROUND, 35, 40, 100),
-    Move('FancyLighting', "Blind opponent using dope ass lightshow", constants.MonType.GHOST, 35, 40, 100),
-    Move('WTF?', "Shows the opponent the \'WTF?\' talk.", constants.MonType.PSYCHIC, 35, 40, 100),
-    Move('FineMist', "Gives opponent a light misting.", constants.MonType.WATER, 35, 40, 100),
-    Move('UnexpectedBill', "Gives opponent a large shock.", constants.MonType.ELECTRIC, 35, 40, 100),
-    Move('Devour', "Attempt to eat opponent. You cannot eat Rinoa.", constants.MonType.NORMAL, 35, 40, 100, MoveEffect.animation(DevourAnim)),
-    Move('DadJoke', "Tell a dad joke to the opponent, who cringes so hard they deal themselves damage.", constants.MonType.PSYCHIC, 35, 40, 100)
-]
\ No newline at end of file
+    def pack_record(self) -> bytes:
+        """
+        Turn this move into a data pack record. Opposite of Move.unpack_record().
+        """
+        data = bytearray(pack(Move._RECORD, self.move_type, self.max_pp, self.power, self.accuracy,
+                              self.special_override))
+        data += datapack.pack_str(self.name)
+        for ops in self.compiled_effects():
+            data += _pack_ops(ops)
+        return data
+
+    @staticmethod
+    def unpack_record(index: int, data: bytes) -> 'Move':
+        """
+        Build a move from a data pack record. Its effects come already compiled.
+        """
+        move_type, max_pp, power, accuracy, special_override = unpack_from(Move._RECORD, data)
+        offset = calcsize(Move._RECORD)
+        name, offset = datapack.unpack_str(data, offset)
+        on_hit, offset = _unpack_ops(data, offset)
+        on_miss, offset = _unpack_ops(data, offset)
+        move = Move(name, None, move_type, max_pp, power, accuracy, special_override=special_override)
+        move.id = index
+        move._compiled = (on_hit, on_miss)
+        return move
+
+
+# Arguments of each EffectOp in a data pack. CALL is stored as an index into move_specials.
+_OP_ARGS = {
+    EffectOp.CALL: '<B',
+    EffectOp.STATUS: '<Bf',
+    EffectOp.RECOIL: '<f',
+    EffectOp.ANIMATION: '<B',
+    EffectOp.SKIP_UNLESS: '<BB',
+}
+
+
+def _pack_ops(ops: Union[List[Tuple], None]) -> bytes:
+    if ops is None:
+        return pack('<B', 255)
+    data = bytearray(pack('<B', len(ops)))
+    for op, args in ops:
+        if op == EffectOp.CALL:
+            if args[0] not in move_specials:
+                raise ValueError(f"{args[0]} must be in move_specials to be packed")
+            args = (move_specials.index(args[0]),)
+        data += pack('<B', op) + pack(_OP_ARGS[op], *args)
+    return data
+
+
+def _unpack_ops(data: bytes, offset: int):
+    """
+    @return: (the ops or None, the offset after them)
+    """
+    count = data[offset]
+    offset += 1
+    if count == 255:
+        return None, offset
+    ops = []
+    for _ in range(count):
+        op = data[offset]
+        args = unpack_from(_OP_ARGS[op], data, offset + 1)
+        offset += 1 + calcsize(_OP_ARGS[op])
+        if op == EffectOp.CALL:
+            args = (move_specials[args[0]],)
+        elif op == EffectOp.SKIP_UNLESS:
+            args = (bool(args[0]), args[1])
+        ops.append((op, args))
+    return ops, offset
+
+
+_pack = datapack.get_pack()
+if _pack:
+    moves_list = datapack.LazyList(_pack, datapack.MOVES, Move.unpack_record)
+else:
+    from .moves_data import moves_list
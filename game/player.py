@@ -21,7 +21,7 @@ from .mons import Mon
 _TIME_BETWEEN_HEALS = 1000*60*10 # 1 minute
 
 class Player:
-    def __init__(self, name: str, badgemon: List['Mon'], badgemon_case: List['Mon'], inventory: Dict['Item', int], last_heal = None, money = 1000, bdex = None):
+    def __init__(self, name: str, badgemon: List['Mon'], badgemon_case: List['Mon'], inventory: Union[items.Inventory, Dict['Item', int]], last_heal = None, money = 1000, bdex = None):
         """
         The Player class will be inherited by classes implementing the user interface, it broadly holds player data and
         handles interaction with the main Battle class
@@ -29,12 +29,12 @@ class Player:
         @param name:
         @param badgemon: player's team. max 6
         @param badgemon_case: all other badgemon
-        @param inventory:
+        @param inventory: an Inventory, or a dict of item counts to make one from
         """
         self.name = name
         self.badgemon = badgemon[0:6]
         self.badgemon_case = badgemon_case
-        self.inventory = inventory
+        self.inventory = inventory if isinstance(inventory, items.Inventory) else items.Inventory(inventory)
         if last_heal is None:
             self.last_heal = time.ticks_ms()
         else:
@@ -66,8 +66,8 @@ class Player:
             data += mon_data
 
         data += pack('B', len(self.inventory))
-        for item, count in self.inventory.items():
-            data += pack('BB', item.id, count)
+        for item_id, count in self.inventory.ids():
+            data += pack('BB', item_id, count)
 
         data += pack('Q', self.last_heal)
 
@@ -108,13 +108,12 @@ class Player:
             badgemon_case.append(mon)
             offset += mon_len
 
-        inventory = {}
+        inventory = items.Inventory()
         inv_len = data[offset]
         offset += 1
         for _ in range(inv_len):
             item_id, count = data[offset:offset + 2]
-            item = items.items_list[item_id]
-            inventory[item] = count
+            inventory[item_id] = count
             offset += 2
 
         print(f"OFFSET: {offset}")
@@ -7,6 +7,7 @@ from ..util.animation import AnimLerp, AnimSin
 
 from ..scenes.scene import Scene
 from ..game.mons import MonTemplate, mons_list
+from ..game import evolution
 from ..util.misc import *
 from ..game.constants import type_to_str, MonType
 from events.input import BUTTON_TYPES
@@ -19,15 +20,21 @@ class Badgedex(Scene):
         super().__init__(*args, **kwargs)
         self._index = 0
         self._current_mon = mons_list[self._index]
-        self._mon_known = self.context.player.badgedex.found[self._index]
+        self._mon_known = self.context.player.badgedex.is_found(self._index)
         self._exit = Event()
         self._arrow_wobble = 0
-        self.animation_scheduler.trigger(AnimSin(AnimLerp(lambda x: self._set_wobble(x), end=4)))
+        self.animation_scheduler.trigger(AnimSin(AnimLerp(lambda x: self._set_wobble(x), end=4), background=True))
 
     def _show_detail(self):
         if self._current_mon is None:
             return
-        self.speech.set_speech(self._current_mon.desc)
+        desc = self._current_mon.desc
+        line = evolution.chain(self._index)
+        if len(line) > 1:
+            badgedex = self.context.player.badgedex
+            names = [mons_list[m].name if badgedex.is_found(m) else "???" for m in line]
+            desc = f"{desc} |EVOLUTION LINE:| {' > '.join(names)}"
+        self.speech.set_speech(desc)
         self.speech.open()
 
     def handle_buttondown(self, event):
@@ -39,11 +46,11 @@ class Badgedex(Scene):
             elif BUTTON_TYPES["UP"] in event.button:
                 self._index =  (self._index - 1 + len(mons_list)) % len(mons_list)
                 self._current_mon = mons_list[self._index]
-                self._mon_known = self.context.player.badgedex.found[self._index]
+                self._mon_known = self.context.player.badgedex.is_found(self._index)
             elif BUTTON_TYPES["DOWN"] in event.button:
                 self._index =  (self._index + 1 + len(mons_list)) % len(mons_list)
                 self._current_mon = mons_list[self._index]
-                self._mon_known = self.context.player.badgedex.found[self._index]
+                self._mon_known = self.context.player.badgedex.is_found(self._index)
 
     def _draw_arrow(self, ctx: Context):
         (ctx.move_to(-10, -100+self._arrow_wobble)
@@ -1,13 +1,15 @@
 from ..scenes.scene import Scene
-from events.input import ButtonDownEvent
+from events.input import ButtonDownEvent, BUTTON_TYPES
 from ..util.misc import *
-from ..util.animation import AnimLerp, AnimSin
+from ..util.animation import AnimLerp, AnimSin, AnimationEvent
+from ..util.image import get_layer
 
 from ..game.mons import Mon, mons_list
 from ..game.items import Item, items_list
 from ..game.moves import Move
-from ..game.battle_main import Battle as BContext
-from ..game.player import Cpu, Player
+from ..game.battle_main import Battle as BContext, BattleEvent
+from ..game.player import Player
+from ..game.game_context import BATTLE_SPEED_NORMAL, BATTLE_SPEED_INSTANT
 from ctx import Context
 
 from ..game import constants
@@ -29,17 +31,20 @@ class Battle(Scene):
     
     def __init__(self, *args, opponent: Player, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context.player.get_move = self._get_move
-        self.context.player.get_new_badgemon = self._get_new_badgemon
-        self.context.player.gain_badgemon = self._gain_badgemon
-        self._battle_context = BContext(self.context.player, opponent, self.sm, self.speech)
+        self._opponent = opponent
+        self._battle_context = None
         self._next_move: Mon | Item | Move | self.Desc | None = None
         self._next_move_available = Event()
-        self._gen_choice_dialog()
         self._text_tilt = 0
         self._draw_user = True
         self._draw_target = True
-        self.animation_scheduler.trigger(AnimSin(AnimLerp(editor=lambda x: self._set_text_tilt(x)), length=3000))
+        # What the player has been shown so far, which lags behind the battle itself
+        self._shown_mons = []
+        self._shown_hp = []
+        # Set from the battle speed in scene_start. Holding cancel also skips animations.
+        self.skip_text = False
+        self.skip_animations = False
+        self.animation_scheduler.trigger(AnimSin(AnimLerp(editor=lambda x: self._set_text_tilt(x)), length=3000, background=True))
 
     def _gen_choice_dialog(self):
         available_moves: set[Move] = set()
@@ -54,13 +59,13 @@ class Battle(Scene):
                         (f"{pp}x {m.name}", self._do_move(m, index)) for index, (m, pp) in enumerate(zip(self._battle_context.mon1.moves,self._battle_context.mon1.pp)) if pp > 0
                     ])),
                     ("Item", ("Item", [
-                        (f"{count}x {item.name}", self._do_item(item, count)) for (item,count) in self._battle_context.player1.inventory.items() if item.usable_in_battle and count > 0
+                        (f"{count}x {item.name}", self._do_item(item, count)) for (item,count) in self._battle_context.player1.inventory.items() if item.usable_in_battle
                     ])),
                     ("Swap Mon", ("Swap Mon", [
                         (m.nickname, self._do_mon(m)) for m in self._battle_context.player1.badgemon if not m.fainted
                     ])),
                     ("Describe...", ("Describe...", [
-                        ("Item", ("Describe Item", [(i.name, self._describe(i)) for i,c in self._battle_context.player1.inventory.items() if i.usable_in_battle and c > 0])),
+                        ("Item", ("Describe Item", [(i.name, self._describe(i)) for i,c in self._battle_context.player1.inventory.items() if i.usable_in_battle])),
                         ("Move", ("Describe Move", [(m.name, self._describe(m)) for m in available_moves]))
                     ])),
                     ("Run Away", ("Run Away??", [
@@ -85,9 +90,9 @@ class Battle(Scene):
 
     def _draw_mons(self, ctx: Context):
         if self._draw_target:
-            draw_mon(ctx, self._battle_context.mon2.template.sprite, 0, -(32*3)+10, False, False, 3)
+            draw_mon(ctx, self._shown_mons[1].template.sprite, 0, -(32*3)+10, False, False, 3)
         if self._draw_user:
-            draw_mon(ctx, self._battle_context.mon1.template.sprite, 0, -10, True, False, 3)
+            draw_mon(ctx, self._shown_mons[0].template.sprite, 0, -10, True, False, 3)
 
     def _draw_health(self, ctx: Context):
         x = 10
@@ -96,8 +101,8 @@ class Battle(Scene):
         radius = 10
         border = 3
         
-        other_health = (self._battle_context.mon2.hp / self._battle_context.mon2.stats[constants.STAT_HP])
-        us_health = (self._battle_context.mon1.hp / self._battle_context.mon1.stats[constants.STAT_HP])
+        other_health = (self._shown_hp[1] / self._shown_mons[1].stats[constants.STAT_HP])
+        us_health = (self._shown_hp[0] / self._shown_mons[0].stats[constants.STAT_HP])
 
         ctx.gray(0)
         ctx.round_rectangle(-x-width-border, -y-border, width+border*2, radius+border*2, radius).fill()
@@ -115,11 +120,11 @@ class Battle(Scene):
         ctx.font_size = 20
         ctx.text_baseline = Context.MIDDLE
         ctx.text_align = Context.RIGHT
-        shrink_until_fit(ctx, self._battle_context.mon2.nickname, 90)
-        ctx.move_to(-x,-y).text(self._battle_context.mon2.nickname)
+        shrink_until_fit(ctx, self._shown_mons[1].nickname, 90)
+        ctx.move_to(-x,-y).text(self._shown_mons[1].nickname)
         ctx.text_align = Context.LEFT
-        shrink_until_fit(ctx, self._battle_context.mon1.nickname, 90)
-        ctx.move_to(x,y).text(self._battle_context.mon1.nickname)
+        shrink_until_fit(ctx, self._shown_mons[0].nickname, 90)
+        ctx.move_to(x,y).text(self._shown_mons[0].nickname)
 
     def _your_turn(self, ctx: Context):
         ctx.text_baseline = Context.MIDDLE
@@ -203,11 +208,7 @@ class Battle(Scene):
     def _do_item(self, item: Item, count: int):
         def f():
             if item.name != "Badgemon Doll":
-                nc = count - 1
-                if nc == 0:
-                    self._battle_context.player1.inventory.pop(item)
-                else:
-                    self._battle_context.player1.inventory[item] = nc  # decrease stock
+                self._battle_context.player1.inventory.remove(item)  # decrease stock
             self._next_move = item
             self._next_move_available.set()
         return f
@@ -232,11 +233,17 @@ class Battle(Scene):
         return f
 
     async def _get_move(self, mon: Mon):
-        self._gen_choice_dialog()
-        print("AWAITING MOVE")
-        await self._next_move_available.wait()
-        self._next_move_available.clear()
-        return self._next_move
+        while True:
+            self._gen_choice_dialog()
+            print("AWAITING MOVE")
+            await self._next_move_available.wait()
+            self._next_move_available.clear()
+            if not isinstance(self._next_move, self.Desc):
+                return self._next_move
+            if isinstance(self._next_move.t, Move):
+                await self.speech.write(f"|TYPE: {constants.type_to_str(self._next_move.t.move_type)}| {self._next_move}")
+            else:
+                await self.speech.write(str(self._next_move))
     
     async def _get_new_badgemon(self):
         self._gen_new_badgemon_dialog()
@@ -251,116 +258,52 @@ class Battle(Scene):
         badgedex.find(mon.template.id)
         await self.speech.write(f"{mon.nickname} has been added to your badgemon case!")
 
-    async def _gain_money(self, player: Player, amount: int):
-        player.money += amount
-        await self.speech.write(f"Got {amount} monies!")
-    
-    async def background_task(self):
-        print("test")
-        while True:
-            if self._battle_context.turn:
-                curr_player, curr_target = self._battle_context.player1, self._battle_context.player2
-                player_mon, target_mon = self._battle_context.mon1, self._battle_context.mon2
-            else:
-                curr_player, curr_target = self._battle_context.player2, self._battle_context.player1
-                player_mon, target_mon = self._battle_context.mon2, self._battle_context.mon1
-
-            print("target faint?")
-            
-            if target_mon.fainted:
-                await self.speech.write(f"{target_mon.nickname} fainted!")
-                if self._battle_context.turn:
-                    await self._battle_context.gain_exp(player_mon, target_mon)
-                    await self._gain_money(curr_player, target_mon.level*10)
-                all_fainted = True
-                for mon in curr_target.badgemon:
-                    all_fainted = all_fainted and mon.fainted
-                if all_fainted:
-                    await self.speech.write(f"{curr_player.name} wins!")
-                    await self.fade_to_scene(2)
-                    return
-                else:
-                    new_badgemon = await curr_target.get_new_badgemon()
-                    if self._battle_context.turn:
-                        self._battle_context.mon2 = new_badgemon
-                    else:
-                        self._battle_context.mon1 = new_badgemon
-                    target_mon = new_badgemon
-
-            print("player faint?")
-
-            if player_mon.fainted:
-                await self.speech.write(f"{player_mon.nickname} fainted!")
-                if not self._battle_context.turn:
-                    await self._battle_context.gain_exp(target_mon, player_mon)
-                    await self._gain_money(curr_target, player_mon.level*10)
-                all_fainted = True
-                for mon in curr_player.badgemon:
-                    all_fainted = all_fainted and mon.fainted
-                if all_fainted:
-                    await self.speech.write(f"{curr_target.name} wins!")
-                    await self.fade_to_scene(2)
-                    return
-                else:
-                    new_badgemon = await curr_player.get_new_badgemon()
-                    if self._battle_context.turn:
-                        self._battle_context.mon1 = new_badgemon
-                    else:
-                        self._battle_context.mon2 = new_badgemon
-                    player_mon = new_badgemon
-
-            print("getting move")
-
-            action = await curr_player.get_move(player_mon)
-
-            print(f"move got: {action}")
-
-            same_turn = False
-
-            if not isinstance(action, self.Desc):
-                curr_target.inform(action)
-
-            if isinstance(action, Move):
-                print(f"USING MOVE {action}")
-                await self._battle_context.use_move(player_mon, target_mon, action)
-
-            elif isinstance(action, Mon):
-                if self._battle_context.turn:
-                    self._battle_context.mon1 = action
-                else:
-                    self._battle_context.mon2 = action
-
-            elif isinstance(action, Item):
-                if action.name == "Badgemon Doll":
-                    if self._battle_context.turn:
-                        await self.speech.write(f"{player_mon.nickname} appreciated the craftsmanship of the doll.")
-                    same_turn = True
-                await self.speech.write(f"Used {action.name}!") 
-                if action.name.endswith("HexBox"):
-                    if not isinstance(self._battle_context.player2, Cpu):
-                        await self.speech.write("Oh no! You can't catch THAT Badgemon!")
-                    else:
-                        catch = await self._battle_context.catch(curr_player, player_mon, target_mon, action)
-                        if catch:
-                            print("CATCH")
-                            await curr_player.gain_badgemon(target_mon, curr_player.badgemon_case, curr_player.badgedex)
-                            await self.fade_to_scene(2)
-                            return
-                else:
-                    action.function_in_battle(curr_player, self._battle_context, player_mon, target_mon)
-
-            elif isinstance(action, self.Desc):
-                if self._battle_context.turn:
-                    if isinstance(action.t, Move):
-                        await self.speech.write(f"|TYPE: {constants.type_to_str(action.t.move_type)}| {action}")
-                    else:
-                        await self.speech.write(str(action))
-                same_turn = True
+    async def _play_animation(self, Anim, user: Mon, target: Mon):
+        if user is self._shown_mons[0]:
+            user_pos, target_pos = (-16*3, (16*3)-10), (16*3, -(16*3)+10)
+        else:
+            target_pos, user_pos = (-16*3, (16*3)-10), (16*3, -(16*3)+10)
+
+        anim = Anim(app=self.sm, user_pos=user_pos, target_pos=target_pos, user = user, target = target)
+        event = Event()
+        anim.and_then(AnimationEvent(event))
+        self.animation_scheduler.trigger(anim)
+        await event.wait()
+
+    async def _present(self, event):
+        kind = event[0]
+        if kind == BattleEvent.TEXT:
+            if not self.skip_text:
+                await self.speech.write(event[1])
+        elif kind == BattleEvent.ANIMATION:
+            if not (self.skip_animations or self.buttons.get(BUTTON_TYPES["CANCEL"])):
+                await self._play_animation(event[1], event[2], event[3])
+        elif kind == BattleEvent.HP:
+            for i in range(2):
+                if self._shown_mons[i] is event[1]:
+                    self._shown_hp[i] = event[2]
+        elif kind == BattleEvent.SWITCH:
+            i = 0 if event[1] else 1
+            self._shown_mons[i] = event[2]
+            self._shown_hp[i] = event[2].hp
+
+    def scene_start(self):
+        self.context.player.get_move = self._get_move
+        self.context.player.get_new_badgemon = self._get_new_badgemon
+        self.context.player.gain_badgemon = self._gain_badgemon
+        self._battle_context = BContext(self.context.player, self._opponent)
+        self._shown_mons = [self._battle_context.mon1, self._battle_context.mon2]
+        self._shown_hp = [self._battle_context.mon1.hp, self._battle_context.mon2.hp]
+        speed = self.context.battle_speed
+        self.skip_animations = speed != BATTLE_SPEED_NORMAL
+        self.skip_text = speed == BATTLE_SPEED_INSTANT
+        self._gen_choice_dialog()
+        super().scene_start()
 
-            elif action is None:
-                await self.speech.write(f"{curr_target.name} wins by default!")
-                await self.fade_to_scene(2)
-                return
+    def scene_end(self):
+        super().scene_end()
+        get_layer().release()
 
-            if not same_turn:
-                self._battle_context.turn = not self._battle_context.turn
\ No newline at end of file
+    async def background_task(self):
+        await self._battle_context.run(self._present)
+        await self.fade_to_scene(2)
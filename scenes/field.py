@@ -7,14 +7,15 @@ if _sys_implementation.name != "micropython":
 
 from ..game.player import Cpu, Player
 
-from ..scenes.scene import Scene
+from ..scenes.scene import Scene, Element
 from ..game.items import Item, items_list
-from ..game.mons import Mon, mons_list, choose_weighted_mon
+from ..game.mons import Mon, mons_list, default_encounters
 from ..util.misc import shrink_until_fit, draw_mon
 from ..protocol import packet
 from events.input import ButtonDownEvent
 from ctx import Context
 from ..game.customisation import COLOURS, PATTERNS
+from ..game.game_context import BATTLE_SPEEDS, BATTLE_SPEED_FAST, BATTLE_SPEED_INSTANT
 
 potion = items_list[0]
 mon_template1 = mons_list[0]
@@ -39,6 +40,9 @@ class Field(Scene):
         self._random_enc_needed = Event()
         self._tasks_finished = Event()
         self.adv = None
+        self._add_elements()
+
+    def scene_start(self):
         if len(self.context.player.badgemon) == 0:
             self.context.player.badgemon.append(Mon(mon_template1, 5).set_nickname("LIL GUY"))
         try:
@@ -46,6 +50,7 @@ class Field(Scene):
         except Exception as e:
             print(e)
         self.sm._attempt_save()
+        super().scene_start()
 
     def redirect(self):
         for m in self.context.player.badgemon:
@@ -62,11 +67,7 @@ class Field(Scene):
 
     async def _use_item(self, item: Item, count: int, mon: Mon):
         if item.name != "Fishing Rod":
-            count -= 1
-            if count == 0:
-                self.context.player.inventory.pop(item)
-            else:
-                self.context.player.inventory[item] = count
+            self.context.player.inventory.remove(item)
         await self.speech.write(f"Using {item.name}!")
         if item.name == "Fishing Rod":
             await self.speech.write(f"But wait - You don't have an Eastnor Fishing licence! Try again later.")
@@ -95,9 +96,8 @@ class Field(Scene):
         await self.context.player.use_full_heal(self.speech)
 
     async def _initiate_battle(self):
-        template = choose_weighted_mon()
         max_level = max([m.level for m in self.context.player.badgemon])
-        level = random.randrange(max(max_level//8,5), int(max_level*1.2))
+        template, level = default_encounters.sample_with_level(max(max_level//8,5), int(max_level*1.2))
 
         await self.fade_to_scene(3, opponent=Cpu(template.name, [Mon(template, level)], [], []))
 
@@ -106,10 +106,7 @@ class Field(Scene):
         await self.speech.write("Game Saved!")
 
     async def _purchase(self, item: Item, count: int):
-        current = self.context.player.inventory.get(item)
-        if current is None:
-            current = 0
-        self.context.player.inventory[item] = count+current
+        self.context.player.inventory.add(item, count)
         self.context.player.money -= item.value*count
         await self.speech.write(f"Bought {count}x {item.name}! Have a nice day!")
 
@@ -120,6 +117,22 @@ class Field(Scene):
         else:
             await self.speech.write("Random encounters are disabled.")
 
+    async def _toggle_power_save(self):
+        self.context.power_save ^= True
+        if self.context.power_save:
+            await self.speech.write("Power saving is enabled.")
+        else:
+            await self.speech.write("Power saving is disabled.")
+
+    async def _cycle_battle_speed(self):
+        self.context.battle_speed = (self.context.battle_speed + 1) % BATTLE_SPEEDS
+        if self.context.battle_speed == BATTLE_SPEED_FAST:
+            await self.speech.write("Battles skip move animations.")
+        elif self.context.battle_speed == BATTLE_SPEED_INSTANT:
+            await self.speech.write("Battles skip move animations and text.")
+        else:
+            await self.speech.write("Battles are shown in full.")
+
     async def _inspect(self, mon: Mon):
         await self.fade_to_scene(8, mon=mon)
 
@@ -208,9 +221,9 @@ class Field(Scene):
             
         inspect = ("Inspect BMon", [(f"{m.nickname}", self._get_answer(self._inspect(m), True)) for m in self.context.player.badgemon])
             
-        usable_items = [(i, c) for (i, c) in self.context.player.inventory.items() if i.usable_in_field and c > 0]
+        usable_items = ((i, c) for (i, c) in self.context.player.inventory.items() if i.usable_in_field)
 
-        if len(usable_items) == 0:
+        if not any(i.usable_in_field for (i, _) in self.context.player.inventory.items()):
             use_item = self._get_answer(self.speech.write("You have no (usable) items!"))
         else:
             use_item = ("Pick an item", [(f"{c}x {i.name}",
@@ -228,9 +241,7 @@ class Field(Scene):
         max_purchase = []
         no_purchase = True
         for item in items_list:
-            current = self.context.player.inventory.get(item)
-            if current is None:
-                current = 0
+            current = self.context.player.inventory[item]
             m = min(self.context.player.money//item.value, 255-current, 10)
             no_purchase &= m == 0
             max_purchase.append((item, m))
@@ -272,7 +283,9 @@ class Field(Scene):
             #("Host Fight",self._get_answer(self._host_fight())),
             #("Instructions", self._get_answer(self.fade_to_scene(4), True)),
             ("Settings", ("Settings",[
-                ("Tog. RandEnc", self._get_answer(self._toggle_randomenc()))
+                ("Tog. RandEnc", self._get_answer(self._toggle_randomenc())),
+                ("Tog. PowerSave", self._get_answer(self._toggle_power_save())),
+                ("Battle Speed", self._get_answer(self._cycle_battle_speed()))
             ])),
             ("Main Menu", ("Main Menu?",[
                 ("Confirm", self._get_answer(self.fade_to_scene(0), True))
@@ -287,17 +300,31 @@ class Field(Scene):
             ("Field", options)
         )
 
-    def draw(self, ctx: Context):
-        ctx.rectangle(-120,-120,240,240).rgb(*COLOURS[self.context.custom.background_col]).fill()
-        ctx.text_align = Context.LEFT
-        ctx.text_baseline = Context.MIDDLE
-        ctx.font_size = 25
-        ctx.rgb(*COLOURS[self.context.custom.foreground_col])
-        ctx.move_to(-105, -35).text("Hi, my name is").fill()
-        shrink_until_fit(ctx, self.context.player.name, 220, 60)
-        ctx.move_to(-110, 0).text(self.context.player.name).fill()
-        ctx.font_size = 20
-        ctx.move_to(-105, 35).text(f"Badgedex: {sum(self.context.player.badgedex.found)}/{len(mons_list)}").fill()
+    def _add_elements(self):
+        self._colours = None
+        fg = lambda ctx: ctx.rgb(*COLOURS[self.context.custom.foreground_col])
+        def greeting(ctx: Context):
+            ctx.text_align = Context.LEFT
+            ctx.text_baseline = Context.MIDDLE
+            ctx.font_size = 25
+            fg(ctx)
+            ctx.move_to(-105, -35).text("Hi, my name is").fill()
+        def name(ctx: Context):
+            ctx.text_align = Context.LEFT
+            ctx.text_baseline = Context.MIDDLE
+            fg(ctx)
+            shrink_until_fit(ctx, self.context.player.name, 220, 60)
+            ctx.move_to(-110, 0).text(self.context.player.name).fill()
+        def badgedex(ctx: Context):
+            ctx.text_align = Context.LEFT
+            ctx.text_baseline = Context.MIDDLE
+            ctx.font_size = 20
+            fg(ctx)
+            ctx.move_to(-105, 35).text(f"Badgedex: {self.context.player.badgedex.found_count}/{len(mons_list)}").fill()
+        self.add_element(Element(-120, -50, 240, 26, greeting))
+        # Up to 60pt, centred on y=0
+        self.add_element(Element(-120, -32, 240, 64, name, lambda: self.context.player.name))
+        self.add_element(Element(-120, 24, 240, 22, badgedex, lambda: self.context.player.badgedex.found_count))
         positions = [
             (-34-16, -90 -16),
             (   -16, -100-16),
@@ -305,9 +332,33 @@ class Field(Scene):
             (-34-16,  90 -16),
             (  0-16,  100-16),
             ( 34-16,  90 -16),]
-        for mon, pos in zip(self.context.player.badgemon, positions):
-            draw_mon(ctx, mon.template.sprite, pos[0], pos[1], False, False, 1)
-        
+        for i, pos in enumerate(positions):
+            self.add_element(Element(pos[0], pos[1], 32, 32, self._mon_drawer(i, pos), self._mon_key(i)))
+
+    def _mon_key(self, i: int):
+        def f():
+            badgemon = self.context.player.badgemon
+            return badgemon[i].template.sprite if i < len(badgemon) else None
+        return f
+
+    def _mon_drawer(self, i: int, pos):
+        def f(ctx: Context):
+            if i < len(self.context.player.badgemon):
+                draw_mon(ctx, self.context.player.badgemon[i].template.sprite, pos[0], pos[1], False, False, 1)
+        return f
+
+    def _draw_background_region(self, ctx: Context, x: float, y: float, width: float, height: float):
+        ctx.rectangle(x, y, width, height).rgb(*COLOURS[self.context.custom.background_col]).fill()
+
+    def draw(self, ctx: Context):
+        colours = (self.context.custom.background_col, self.context.custom.foreground_col)
+        if colours != self._colours:
+            self._colours = colours
+            self.invalidate()
+        self._draw_elements(ctx)
+
+    def idle(self) -> bool:
+        return not self.choice.is_open() and not self.speech.is_open() and not self.text.is_open()
 
     def handle_buttondown(self, event: ButtonDownEvent):
         if not self.choice.is_open() and not self.speech.is_open():
@@ -4,12 +4,13 @@ from ..util import static_random as random
 
 from ctx import Context
 
-from ..game.mons import Mon, mons_list
+from ..game.mons import Mon, mons_list, mon_weights
 
 from ..config import ASSET_PATH
 
 from ..util.animation import AnimationEvent
 from ..util.misc import *
+from ..util.image import get_layer
 
 from ..scenes.scene import Scene
 class Onboarding(Scene):
@@ -19,7 +20,7 @@ class Onboarding(Scene):
         self._slide = None
         self._bmons = []
         chosen = set()
-        common_mons = [m for m in mons_list if m.weight >= 80]
+        common_mons = [mons_list[i] for i, weight in enumerate(mon_weights) if weight >= 80]
         for _ in range(3):
             mon = random.choice(common_mons)
             while mon.id in chosen:
@@ -34,6 +35,10 @@ class Onboarding(Scene):
         self.animation_scheduler.trigger(self._fader)
         await self._fade_complete.wait()
         self._slide = slide
+        if slide is not None and slide != "BMONSLIDE":
+            get_layer().show(slide)
+        else:
+            get_layer().release()
         self._end_event.reset()
         self._fader.reset(fadein=True)
         self.animation_scheduler.trigger(self._fader)
@@ -43,18 +48,20 @@ class Onboarding(Scene):
     def draw(self, ctx: Context):
         super().draw(ctx)
         ctx.image_smoothing = 0
-        if self._slide is not None:
-            if self._slide == "BMONSLIDE":
-                for m in range(3):
-                    draw_mon(ctx, self._bmons[m].template.sprite, 80*(m-1)-(16*2), -(16*2), False, False, 2)
-            else:
-                ctx.image(self._slide,-120,-120,240,240)
+        get_layer().draw(ctx)
+        if self._slide == "BMONSLIDE":
+            for m in range(3):
+                draw_mon(ctx, self._bmons[m].template.sprite, 80*(m-1)-(16*2), -(16*2), False, False, 2)
 
     def _mon_pick(self, mon: Mon):
         def f():
             self._picked_mon = mon
         return f
 
+    def scene_end(self):
+        super().scene_end()
+        get_layer().release()
+
     async def background_task(self):
         self._fader.detach()
         self._end_event = AnimationEvent(self._fade_complete)
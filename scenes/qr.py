@@ -4,6 +4,7 @@ from ..scenes.scene import Scene
 from ctx import Context
 from ..config import ASSET_PATH
 from events.input import ButtonDownEvent
+from ..util.image import get_layer
 
 class Qr(Scene):
     def __init__(self, *args, **kwargs):
@@ -11,8 +12,15 @@ class Qr(Scene):
         self._exit = Event()
 
     def draw(self, ctx: Context):
-        ctx.image_smoothing = 0
-        ctx.image(ASSET_PATH+"qr.png", -120, -120, 240, 240)
+        get_layer().draw(ctx)
+
+    def scene_start(self):
+        super().scene_start()
+        get_layer().show(ASSET_PATH+"qr.png")
+
+    def scene_end(self):
+        super().scene_end()
+        get_layer().release()
 
     def handle_buttondown(self, event: ButtonDownEvent):
         self._exit.set()
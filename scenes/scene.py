@@ -7,12 +7,55 @@ from system.eventbus import eventbus
 try:
     from sys import implementation as _sys_implementation
     if _sys_implementation.name != "micropython":
-        from typing import TYPE_CHECKING
+        from typing import TYPE_CHECKING, Callable, Union
         if TYPE_CHECKING:
             from .scene_manager import SceneManager
 except ImportError:
     pass
 
+class Element:
+    """
+    Part of a scene that stays on screen once drawn, and is only drawn again when it changes.
+    It has changed when invalidate() has been called, or when key() gives something different to last frame.
+    """
+    def __init__(self, x: float, y: float, width: float, height: float, draw: 'Callable[[Context], None]',
+                 key: 'Union[Callable[[], object], None]' = None):
+        """
+        :param x, y, width, height: Everything draw() can touch, in ctx coordinates.
+        :param draw: Draws the element. It should set any ctx state it needs.
+        :param key: Something cheap to check each frame, that changes when the element would look different.
+        """
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self._draw = draw
+        self._key = key
+        self._last_key = None
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def check(self) -> bool:
+        """
+        :return: Whether this needs drawing again.
+        """
+        if self._key is not None:
+            key = self._key()
+            if key != self._last_key:
+                self._last_key = key
+                self.dirty = True
+        return self.dirty
+
+    def overlaps(self, other: 'Element') -> bool:
+        return (self.x < other.x + other.width and other.x < self.x + self.width and
+                self.y < other.y + other.height and other.y < self.y + self.height)
+
+    def draw(self, ctx: Context):
+        self.dirty = False
+        self._draw(ctx)
+
 class Scene:
     def __init__(self, sm: 'SceneManager'):
         self.sm = sm
@@ -25,9 +68,15 @@ class Scene:
         self._battle_fader = sm._battle_fader
         self._scene_ready = Event()
         self.buttons = sm._button_states
+        # Scenes that draw with _draw_elements() keep what's on screen, and only redraw the elements that changed
+        self._elements = []
+        self._redraw_all = True
+        self._handling_input = False
 
     async def fade_to_scene(self, scene: int, *args, **kwargs):
         self._scene_ready.clear()
+        # The next scene is built during the fade, so this one mustn't open dialogs over it in the meantime
+        self._stop_input()
         end_event = Event()
         if scene == 3:
             fader = self._battle_fader
@@ -40,7 +89,11 @@ class Scene:
         fader._colour = (0,0,0)
         fader.and_then(AnimationEvent(end_event))
         self.animation_scheduler.trigger(fader)
+        if scene is not None:
+            # Build the next scene while this one fades out, so switching is just swapping them over
+            self.sm.preload_scene(scene, *args, **kwargs)
         await end_event.wait()
+        await self.sm.wait_for_preload()
         self.sm.switch_scene(scene, *args, **kwargs)
 
     def _fadein(self):
@@ -54,6 +107,12 @@ class Scene:
     def update(self, delta: float):
         pass
 
+    def idle(self) -> bool:
+        """
+        @return: True if nothing is going on, so frames can be skipped to save power.
+        """
+        return False
+
     def draw(self, ctx: Context):
         self._draw_background(ctx)
 
@@ -61,14 +120,71 @@ class Scene:
         pass
 
     def scene_start(self):
+        """
+        Called once the scene takes over, after the last scene's scene_end.
+        Scenes can be built while the last one is still running, so anything that touches what's shared
+        between scenes (the dialogs, the player, saving) goes here rather than in __init__.
+        """
         eventbus.on(ButtonDownEvent, self.handle_buttondown, self.sm)
+        self._handling_input = True
+
+    def _stop_input(self):
+        if self._handling_input:
+            self._handling_input = False
+            eventbus.remove(ButtonDownEvent, self.handle_buttondown, self.sm)
 
     def scene_end(self):
-        eventbus.remove(ButtonDownEvent, self.handle_buttondown, self.sm)
+        self._stop_input()
         self.animation_scheduler.kill_animation()
 
     def _draw_background(self, ctx: Context):
-        ctx.gray(0.9).rectangle(-120, -120, 240, 240).fill()
+        self._draw_background_region(ctx, -120, -120, 240, 240)
+
+    def _draw_background_region(self, ctx: Context, x: float, y: float, width: float, height: float):
+        ctx.gray(0.9).rectangle(x, y, width, height).fill()
+
+    def add_element(self, element: Element) -> Element:
+        """
+        Add something for _draw_elements() to draw. Elements are drawn in the order they're added.
+        """
+        self._elements.append(element)
+        element.invalidate()
+        return element
+
+    def invalidate(self):
+        """
+        Draw everything again next frame, e.g. because something else has drawn over the scene.
+        """
+        self._redraw_all = True
+
+    def _draw_elements(self, ctx: Context):
+        """
+        Draw this scene's elements, for scenes that use them instead of drawing everything each frame.
+        Anything that changed is drawn again, along with anything it overlaps, and anything they overlap.
+        All of their areas are cleared back to the background first, so nothing gets drawn over itself.
+        If nothing changed, nothing is drawn.
+        """
+        if self._redraw_all:
+            self._redraw_all = False
+            self._draw_background(ctx)
+            for element in self._elements:
+                element.check()
+                element.draw(ctx)
+            return
+        redraw = [element for element in self._elements if element.check()]
+        if not redraw:
+            return
+        i = 0
+        while i < len(redraw):
+            for element in self._elements:
+                if element not in redraw and element.overlaps(redraw[i]):
+                    redraw.append(element)
+            i += 1
+        for element in redraw:
+            self._draw_background_region(ctx, element.x, element.y, element.width, element.height)
+        for element in self._elements:
+            if element in redraw:
+                element.draw(ctx)
 
     async def background_task(self):
         await self._scene_ready.wait()
@@ -23,6 +23,7 @@ from system.eventbus import eventbus
 from events.input import Buttons
 from system.scheduler.events import RequestStopAppEvent
 from ..util.animation import AnimationScheduler
+from ..util.pacing import FrameScheduler
 from app import App
 from ctx import Context
 from ..config import SAVE_PATH
@@ -38,6 +39,22 @@ def dump_exception(e: Exception):
         import traceback
         traceback.print_exception(None, e, None)
 
+class _QueuedAnimations:
+    """
+    Stands in for the AnimationScheduler while a scene is built ahead of time. The old scene kills every
+    animation when it ends, so anything the new scene's constructor starts is held until then.
+    """
+    def __init__(self):
+        self._queued = []
+
+    def trigger(self, anim):
+        self._queued.append(anim)
+
+    def start(self, scheduler: AnimationScheduler):
+        for anim in self._queued:
+            scheduler.trigger(anim)
+        self._queued = []
+
 class SceneManager(App):
     def __init__(self):
         super().__init__()
@@ -59,6 +76,11 @@ class SceneManager(App):
         self._animation_scheduler = AnimationScheduler()
         self._button_states = Buttons(self)
         self._scene = None
+        self._faded = True
+        self._frames = FrameScheduler()
+        # The next scene, built while the current one fades out: (requested scene, built scene, its animations)
+        self._preloaded = None
+        self._preload_task = None
         self._attempt_load()
         if self._context == None:
             self._context = GameContext()
@@ -114,7 +136,14 @@ class SceneManager(App):
 
     def update(self, delta: float):
         try:
-            self._animation_scheduler.update(delta)
+            idle = (
+                self._context is not None and self._context.power_save
+                and self._scene is not None and self._scene.idle() and not self._faded
+            )
+            delta = self._frames.begin(delta, idle)
+            if delta is None:
+                return
+            self._animation_scheduler.update(delta, self._frames.skip_background())
             self._speech.update(delta)
             self._choice.update(delta)
             self._text.update(delta)
@@ -126,8 +155,17 @@ class SceneManager(App):
             sys.exit()
 
     def draw(self, ctx: Context):
+        if self._frames.skipped:
+            # Only with power saving on, and nothing moving. This leaves the last frame showing, which
+            # relies on the display keeping it, as scenes that use Scene._draw_elements do.
+            return
         try:
             if self._scene is not None:
+                # Fades draw over the scene, so scenes that keep what they drew can't while one is showing
+                faded = self._fader._fade > 0 or self._battle_fader._fade > 0
+                if faded or self._faded:
+                    self._scene.invalidate()
+                self._faded = faded
                 self._scene.draw(ctx)
             super().draw(ctx)
         except Exception as e:
@@ -153,6 +191,48 @@ class SceneManager(App):
             self._text.close()
             await asyncio.sleep(0.05)
 
+    def _build_scene(self, scene: int, *args, **kwargs):
+        """
+        Build a scene without starting any of its animations yet.
+        @return: (the scene, its animations to start when it does)
+        """
+        print("LOAD SCENE")
+        print((SCENE_LIST[scene]))
+        animations = _QueuedAnimations()
+        scheduler = self._animation_scheduler
+        self._animation_scheduler = animations
+        try:
+            built: Scene = (SCENE_LIST[scene])(self, *args, **kwargs)
+        finally:
+            self._animation_scheduler = scheduler
+        built.animation_scheduler = scheduler
+        return built, animations
+
+    def preload_scene(self, scene: int, *args, **kwargs):
+        """
+        Start building a scene in the background, ready for switch_scene to swap to it.
+        """
+        self._preloaded = None
+        self._preload_task = asyncio.create_task(self._preload(scene, args, kwargs))
+
+    async def _preload(self, scene: int, args, kwargs):
+        requested = scene
+        self._choice.close()
+        self._speech.close()
+        self._text.close()
+        while scene is not None:
+            # Give frames a chance to run between each step, so the fade keeps going
+            await asyncio.sleep(0)
+            built, animations = self._build_scene(scene, *args, **kwargs)
+            await asyncio.sleep(0)
+            scene = built.redirect()
+        self._preloaded = (requested, built, animations)
+
+    async def wait_for_preload(self):
+        if self._preload_task is not None:
+            await self._preload_task
+            self._preload_task = None
+
     def switch_scene(self, scene: int, *args, **kwargs):
         if self._scene is not None:
             self._scene.scene_end()
@@ -170,13 +250,19 @@ class SceneManager(App):
             self._choice.close()
             self._speech.close()
             self._text.close()
-            while scene is not None:
-                print("LOAD SCENE")
-                print((SCENE_LIST[scene]))
-                self._scene: Scene = (SCENE_LIST[scene])(self, *args, **kwargs)
-                gc.collect()
-                print(f"mem used: {gc.mem_alloc()}, mem free:{gc.mem_free()}")
-                scene = self._scene.redirect()
+            if self._preloaded is not None and self._preloaded[0] == scene:
+                # Already built while the last scene faded out
+                _, built, animations = self._preloaded
+                self._preloaded = None
+            else:
+                while scene is not None:
+                    built, animations = self._build_scene(scene, *args, **kwargs)
+                    scene = built.redirect()
+            self._scene: Scene = built
+            # The last scene is garbage now, and the screen is blank between the fades, so nobody sees this frame
+            gc.collect()
+            print(f"mem used: {gc.mem_alloc()}, mem free:{gc.mem_free()}")
+            animations.start(self._animation_scheduler)
             self._scene._fadein()
             self._battle_fader.reset()
             print("scene start")
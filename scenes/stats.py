@@ -2,6 +2,7 @@ from asyncio import Event
 import math
 from ctx import Context
 from ..game.mons import Mon
+from ..game.levels import xp_for_level
 from ..util.animation import AnimLerp, AnimSin, lerp
 from ..game.constants import type_to_str, status_to_str, STAT_HP, stat_names
 
@@ -21,7 +22,7 @@ class Stats(Scene):
         self.page = 0
         self._exit = Event()
         self._arrow_wobble = 0
-        self.animation_scheduler.trigger(AnimSin(AnimLerp(lambda x: self._set_wobble(x), end=4)))
+        self.animation_scheduler.trigger(AnimSin(AnimLerp(lambda x: self._set_wobble(x), end=4), background=True))
 
     def redirect(self):
         if self.mon is None:
@@ -95,8 +96,7 @@ class Stats(Scene):
             ctx.font_size = 20
             xp = f"XP: {self.mon.xp}"
             ctx.gray(0).move_to(0,80).text(xp).fill()
-            next = self.mon.level+1
-            next = next*next*next
+            next = xp_for_level(self.mon.level+1)
             xp = f"Next LVL: {next}"
             ctx.gray(0).move_to(0,65).text(xp).fill()
 
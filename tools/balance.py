@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Simulation-driven stat balancer.
+
+Plays the tournament from tools/tournament.py, then nudges mons and moves that are outside the target
+win-rate band and plays again, until everything is inside the band or it runs out of iterations.
+
+- Mons outside the band have all of their base stats scaled up or down together.
+- Moves are scored by how much more often their user wins when it uses them, compared with how often
+  that mon wins overall, so a strong mon doesn't make all of its moves look strong. Moves outside the
+  band have their power scaled, or their accuracy once power is at its limit.
+- catch_rate doesn't change how battles go, so it is kept in step with the stat changes instead:
+  a mon that was weakened gets easier to catch, and one that was strengthened never gets easier.
+
+Every configuration played is cached by its parameters in <out>-cache.json, so reruns and
+configurations the optimiser comes back to aren't played again.
+
+Writes <out>-mons.csv and <out>-moves.csv, with the final values in the order of the arguments to
+MonTemplate(...) and Move(...), ready to copy into game/mons_data.py and game/moves_data.py.
+Then run tools/build_pack.py, or the badge will keep loading the old values from assets/data.pack.
+
+Usage:
+    python3 tools/balance.py --levels 10,30 --seeds 16 --band 0.4,0.6 --out balance
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+
+from host import load
+import tournament
+
+MIN_STAT = 5
+MAX_STAT = 255
+MIN_POWER = 10
+MAX_POWER = 250
+MIN_ACCURACY = 30
+# Moves used in fewer games than this don't get adjusted, there isn't enough to go on
+MIN_MOVE_GAMES = 20
+
+_used = {}
+
+
+def read_config():
+    """
+    @return: The current parameters, {"mons": [[hp, atk, def, spatk, spdef, spd, catch_rate], ...],
+     "moves": [[power, accuracy], ...]}
+    """
+    mons = load("game.mons")
+    moves = load("game.moves")
+    return {
+        "mons": [list(m.base_stats) + [m.catch_rate] for m in mons.mons_list],
+        "moves": [[m.power, m.accuracy] for m in moves.moves_list],
+    }
+
+
+def apply_config(config):
+    mons = load("game.mons")
+    moves = load("game.moves")
+    for template, params in zip(mons.mons_list, config["mons"]):
+        (template.base_hp, template.base_atk, template.base_def,
+         template.base_spatk, template.base_spdef, template.base_spd) = params[:6]
+        template.base_stats = list(params[:6])
+        template.catch_rate = params[6]
+    for move, (power, accuracy) in zip(moves.moves_list, config["moves"]):
+        move.power = power
+        move.accuracy = accuracy
+
+
+def init_worker(config):
+    tournament.init_worker()
+    apply_config(config)
+    Move = load("game.moves").Move
+    Cpu = tournament._player.Cpu
+    get_move = Cpu.get_move
+
+    async def recording_get_move(self, mon):
+        move = await get_move(self, mon)
+        if isinstance(move, Move):
+            _used[self.name].add(move.id)
+        return move
+    Cpu.get_move = recording_get_move
+
+
+def play_pairing(job):
+    """
+    As tournament.play_pairing, but also returns {(move id, mon using it): [games used in, games won]}.
+    """
+    a, b, level, seeds = job
+    wins = 0
+    move_results = {}
+    for seed in range(seeds):
+        _used["A"] = set()
+        _used["B"] = set()
+        won = tournament.play_game(a, b, level, seed)
+        if won:
+            wins += 1
+        for name, mon, side_won in (("A", a, won), ("B", b, not won)):
+            for move_id in _used[name]:
+                result = move_results.setdefault((move_id, mon), [0, 0])
+                result[0] += 1
+                result[1] += side_won
+    return a, b, level, seeds, wins, move_results
+
+
+def evaluate(config, levels, seeds, processes):
+    """
+    Play a full tournament with these parameters.
+
+    @return: {"mons": [win rate, ...], "moves": [[games used in, games won, expected wins], ...]}
+    """
+    count = len(config["mons"])
+    jobs = [(a, b, level, seeds) for level in levels for a in range(count) for b in range(a + 1, count)]
+    games = {}
+    move_games = {}
+
+    def on_result(result):
+        a, b, level, seeds, wins, move_results = result
+        games[(a, b, level)] = (seeds, wins)
+        for key, (used, won) in move_results.items():
+            total = move_games.setdefault(key, [0, 0])
+            total[0] += used
+            total[1] += won
+
+    tournament.run_jobs(jobs, processes, on_result, play_pairing, init_worker, (config,))
+
+    played = [0] * count
+    wins = [0] * count
+    for (a, b, _), (s, w) in games.items():
+        played[a] += s
+        played[b] += s
+        wins[a] += w
+        wins[b] += s - w
+    win_rates = [w / p if p else 0.5 for w, p in zip(wins, played)]
+
+    moves = [[0, 0, 0.0] for _ in config["moves"]]
+    for (move_id, mon), (used, won) in move_games.items():
+        moves[move_id][0] += used
+        moves[move_id][1] += won
+        moves[move_id][2] += used * win_rates[mon]
+    return {"mons": win_rates, "moves": moves}
+
+
+def config_key(config, levels, seeds) -> str:
+    return hashlib.sha1(json.dumps([config, levels, seeds], sort_keys=True).encode()).hexdigest()
+
+
+def clamp(x, lo, hi):
+    return max(lo, min(hi, x))
+
+
+def adjust(config, original, results, band, step):
+    """
+    @return: New parameters with everything outside the band nudged toward the middle of it,
+     or None if everything is already inside.
+    """
+    lo, hi = band
+    middle = (lo + hi) / 2
+    changed = False
+    new = {"mons": [list(p) for p in config["mons"]], "moves": [list(p) for p in config["moves"]]}
+
+    for i, win_rate in enumerate(results["mons"]):
+        if lo <= win_rate <= hi:
+            continue
+        changed = True
+        scale = 1 + step * (middle - win_rate)
+        stats = [clamp(round(s * scale), MIN_STAT, MAX_STAT) for s in new["mons"][i][:6]]
+        # Easier to catch by however much weaker it got than it started, never harder than it started
+        catch_rate = max(original["mons"][i][6],
+                         round(original["mons"][i][6] * sum(original["mons"][i][:6]) / sum(stats)))
+        new["mons"][i] = stats + [catch_rate]
+
+    for i, (used, won, expected) in enumerate(results["moves"]):
+        if used < MIN_MOVE_GAMES:
+            continue
+        score = middle + (won - expected) / used
+        if lo <= score <= hi:
+            continue
+        changed = True
+        scale = 1 + step * (middle - score)
+        power, accuracy = new["moves"][i]
+        new_power = clamp(round(power * scale), MIN_POWER, MAX_POWER)
+        if new_power == power:
+            accuracy = clamp(round(accuracy * scale), MIN_ACCURACY, 100)
+        new["moves"][i] = [new_power, accuracy]
+
+    return new if changed else None
+
+
+def write_tables(out: str, config, results):
+    mons = load("game.mons")
+    moves = load("game.moves")
+    with open(f"{out}-mons.csv", "w", newline="") as f:
+        table = csv.writer(f)
+        table.writerow(["id", "name", "base_hp", "base_atk", "base_def", "base_spatk", "base_spdef", "base_spd",
+                        "catch_rate", "win_rate"])
+        for template, params, win_rate in zip(mons.mons_list, config["mons"], results["mons"]):
+            table.writerow([template.id, template.name] + params + [f"{win_rate:.3f}"])
+    with open(f"{out}-moves.csv", "w", newline="") as f:
+        table = csv.writer(f)
+        table.writerow(["id", "name", "power", "accuracy", "games_used", "win_rate_vs_expected"])
+        for move, params, (used, won, expected) in zip(moves.moves_list, config["moves"], results["moves"]):
+            table.writerow([move.id, move.name] + params + [used, f"{(won - expected) / used:+.3f}" if used else ""])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune mons and moves toward a win-rate band.")
+    parser.add_argument("--levels", default="10,30", help="comma separated levels to play at")
+    parser.add_argument("--seeds", type=int, default=16, help="games per pairing per level")
+    parser.add_argument("--band", default="0.4,0.6", help="target win rate, low,high")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--step", type=float, default=0.5, help="how hard to push per iteration")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes, defaults to every core")
+    parser.add_argument("--out", default="balance", help="prefix for the result files")
+    args = parser.parse_args()
+
+    levels = [int(l) for l in args.levels.split(",")]
+    band = tuple(float(b) for b in args.band.split(","))
+    cache_path = f"{args.out}-cache.json"
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
+
+    original = read_config()
+    config = original
+    for iteration in range(args.iterations):
+        key = config_key(config, levels, args.seeds)
+        if key in cache:
+            results = cache[key]
+        else:
+            results = evaluate(config, levels, args.seeds, args.processes)
+            cache[key] = results
+            with open(cache_path, "w") as f:
+                json.dump(cache, f)
+        outside = sum(1 for w in results["mons"] if not band[0] <= w <= band[1])
+        print(f"Iteration {iteration}: {outside} mons outside {band[0]}-{band[1]}, "
+              f"win rates {min(results['mons']):.2f}-{max(results['mons']):.2f}")
+        new = adjust(config, original, results, band, args.step)
+        if new is None or iteration == args.iterations - 1:
+            break
+        config = new
+
+    write_tables(args.out, config, results)
+    print(f"Wrote {args.out}-mons.csv and {args.out}-moves.csv. Copy the values into game/mons_data.py and "
+          f"game/moves_data.py, then rebuild the data pack with tools/build_pack.py.")
+
+
+if __name__ == "__main__":
+    main()
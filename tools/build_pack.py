@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Compile mons_list, moves_list and items_list into assets/data.pack, which the badge loads lazily
+instead of running mons_data, moves_data and items_data at startup. See game/datapack.py.
+Their descriptions go in assets/descriptions.pack, see game/descriptions.py.
+
+Each pack's header holds a hash of the data modules it was built from. The badge doesn't check it, so
+run this after changing any game data. flash.sh runs it before copying to the badge.
+--check tells you whether the packs that are there now match the data modules.
+
+Usage:
+    python3 tools/build_pack.py [--check] [data pack output path]
+"""
+import argparse
+import hashlib
+import os
+import sys
+from struct import pack
+
+from host import ROOT, load
+
+# The data modules the packs are built from, in game/
+SOURCES = ("mons_data.py", "moves_data.py", "items_data.py")
+
+
+def source_hash() -> bytes:
+    """
+    @return: A hash of the data modules, as the packs' headers hold it.
+    """
+    h = hashlib.sha256()
+    for name in SOURCES:
+        with open(os.path.join(ROOT, "game", name), "rb") as f:
+            h.update(f.read())
+    return h.digest()[:8]
+
+
+def is_current(datapack, path: str, sections: int, source: bytes) -> bool:
+    """
+    @return: True if the pack at path is readable and was built from the data modules as they are now.
+    """
+    try:
+        existing = datapack.DataPack(path, sections)
+    except (OSError, ValueError):
+        return False
+    existing._file.close()
+    return existing.source == source
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?", default=os.path.join(ROOT, "assets", "data.pack"),
+                        help="where to write the data pack, descriptions.pack goes next to it")
+    parser.add_argument("--check", action="store_true",
+                        help="don't build, exit non-zero if the packs are missing or out of date")
+    args = parser.parse_args()
+    path = args.path
+    desc_path = os.path.join(os.path.dirname(path), "descriptions.pack")
+
+    datapack = load("game.datapack")
+    # Build from the Python data, not whatever pack is already there
+    datapack.enabled = False
+    descriptions = load("game.descriptions")
+    source = source_hash()
+    if args.check:
+        current = (is_current(datapack, path, datapack.SECTIONS, source) and
+                   is_current(datapack, desc_path, descriptions.SECTIONS, source))
+        print(f"{path} and {desc_path} are {'up to date' if current else 'missing or out of date'}")
+        sys.exit(0 if current else 1)
+
+    mons = load("game.mons")
+    moves = load("game.moves")
+    items = load("game.items")
+
+    sections = [None] * datapack.SECTIONS
+    sections[datapack.MONS] = [m.pack_record() for m in mons.mons_list]
+    sections[datapack.MOVES] = [m.pack_record() for m in moves.moves_list]
+    sections[datapack.ITEMS] = [i.pack_record() for i in items.items_list]
+    sections[datapack.MON_WEIGHTS] = [pack(f"<{len(mons.mons_list)}H", *mons.mon_weights)]
+    datapack.write_pack(path, sections, source)
+    print(f"Wrote {path}: {len(mons.mons_list)} mons, {len(moves.moves_list)} moves, "
+          f"{len(items.items_list)} items, {os.path.getsize(path)} bytes")
+
+    texts = [None] * descriptions.SECTIONS
+    texts[descriptions.MONS] = [m.desc.encode("utf-8") for m in mons.mons_list]
+    texts[descriptions.MOVES] = [m.desc.encode("utf-8") for m in moves.moves_list]
+    texts[descriptions.ITEMS] = [i.desc.encode("utf-8") for i in items.items_list]
+    datapack.write_pack(desc_path, texts, source)
+    print(f"Wrote {desc_path}: {os.path.getsize(desc_path)} bytes")
+
+
+if __name__ == "__main__":
+    main()
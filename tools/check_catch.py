@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Checks the fixed-point catch rate in game/calculation.py against the float formula it replaced, and
+times it.
+
+- Tolerance: for every max HP, current HP, catch rate, HexBox and status swept, the chance of reaching
+  each shake count must be within TOLERANCE of the old formula's. Worked out exactly, no sampling.
+- Statistics: get_shakes is sampled with Python's random module, and through util/static_random as the
+  game does, and the shake counts are chi-square tested against the exact distribution for its threshold.
+- Speed: get_catch_rate and get_shakes are timed against the old float code.
+
+Exits non-zero if either check fails.
+
+Usage:
+    python3 tools/check_catch.py [--samples 200000] [--hp-step 7]
+"""
+import argparse
+import math
+import random as host_random
+import sys
+import time
+from types import SimpleNamespace
+
+from host import load
+
+# Most the chance of reaching any shake count may differ from the old formula by
+TOLERANCE = 0.0034
+# Chi-square critical value for 4 degrees of freedom at p = 0.001
+CHI2_CRITICAL = 18.467
+CATCH_RATES = (1, 2, 3)
+# HexBox multipliers, as function_in_battle returns them
+BALLS = (1, 1.5, 2)
+# The old status multipliers, by status
+OLD_STATUS = (1, 1.5, 1.5, 1.5, 2, 2)
+
+
+def old_catch_rate(max_hp: int, hp: int, catch_rate: int, ball: float, status: int):
+    """
+    get_catch_rate as it was before it went fixed point, without the prints.
+    """
+    three = 3 * max_hp
+    base = (three - 2 * hp) / three
+    base *= catch_rate * ball * OLD_STATUS[status]
+    base = min(max(base, 0.0), 1.0)
+    if base <= 0:
+        return (base, 0.0)
+    return (base, 1048560 / math.pow(65280 / base, 0.25))
+
+
+def old_shake(threshold: float) -> bool:
+    return host_random.randrange(0, 65536) < threshold
+
+
+def old_reach(base: float, threshold: float):
+    """
+    @return: Chance of reaching 1 to 4 shakes with the old code, which was certain at base 1.
+    """
+    if base >= 1:
+        return [1.0] * 4
+    p = min(threshold / 65536, 1.0)
+    return [p ** n for n in range(1, 5)]
+
+
+def new_reach(calculation, rate: int, threshold: int):
+    """
+    @return: Chance of reaching 1 to 4 shakes with get_shakes. It passes shake n if its one roll is under
+     the nth threshold it works out, so this follows the same steps.
+    """
+    if rate >= calculation.CATCH_CERTAIN:
+        return [1.0] * 4
+    reach = []
+    half = threshold >> 1
+    for _ in range(4):
+        reach.append(min(threshold, 65536) / 65536)
+        threshold = ((threshold >> 1) * half) >> 14
+    return reach
+
+
+def make_mon(constants, max_hp: int, hp: int, catch_rate: int, status: int):
+    stats = [0] * 6
+    stats[constants.STAT_HP] = max_hp
+    return SimpleNamespace(stats=stats, hp=hp, status=status, template=SimpleNamespace(catch_rate=catch_rate))
+
+
+def check_tolerance(calculation, constants, hp_step: int) -> bool:
+    worst = 0.0
+    worst_case = None
+    cases = 0
+    for max_hp in range(10, 1000, hp_step):
+        for hp in range(1, max_hp + 1, max(1, max_hp // 40)):
+            for catch_rate in CATCH_RATES:
+                for ball in BALLS:
+                    for status in range(len(OLD_STATUS)):
+                        mon = make_mon(constants, max_hp, hp, catch_rate, status)
+                        rate, threshold = calculation.get_catch_rate(mon, ball)
+                        new = new_reach(calculation, rate, threshold)
+                        old = old_reach(*old_catch_rate(max_hp, hp, catch_rate, ball, status))
+                        cases += 1
+                        for n in range(4):
+                            diff = abs(new[n] - old[n])
+                            if diff > worst:
+                                worst = diff
+                                worst_case = (max_hp, hp, catch_rate, ball, status, n + 1)
+    ok = worst <= TOLERANCE
+    print(f"Tolerance: {cases} cases, worst difference {worst * 100:.3f}pp "
+          f"(max HP, HP, catch rate, ball, status, shakes = {worst_case}), "
+          f"limit {TOLERANCE * 100:.2f}pp: {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def check_distribution(calculation, samples: int, source: str) -> bool:
+    ok = True
+    for threshold in (8000, 30000, 52000, 64000):
+        reach = new_reach(calculation, 0, threshold) + [0.0]
+        expected = [1 - reach[0]] + [(reach[n] - reach[n + 1]) for n in range(4)]
+        counts = [0] * 5
+        for _ in range(samples):
+            counts[calculation.get_shakes(threshold)] += 1
+        chi2 = sum((counts[k] - samples * e) ** 2 / (samples * e) for k, e in enumerate(expected) if e > 0)
+        passed = chi2 < CHI2_CRITICAL
+        ok = ok and passed
+        print(f"Distribution ({source}) at threshold {threshold}: {counts}, chi-square {chi2:.2f} "
+              f"(critical {CHI2_CRITICAL}): {'OK' if passed else 'FAIL'}")
+    return ok
+
+
+def bench(calculation, constants, calls: int):
+    mon = make_mon(constants, 150, 40, 2, 3)
+    start = time.perf_counter()
+    for _ in range(calls):
+        base, threshold = old_catch_rate(150, 40, 2, 1.5, 3)
+        shakes = 0
+        while shakes < 4 and old_shake(threshold):
+            shakes += 1
+    old = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(calls):
+        rate, threshold = calculation.get_catch_rate(mon, 1.5)
+        calculation.get_shakes(threshold)
+    new = time.perf_counter() - start
+    print(f"Speed: old {old / calls * 1e6:.2f}us per catch, new {new / calls * 1e6:.2f}us per catch "
+          f"({old / new:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=200000, help="get_shakes draws per threshold")
+    parser.add_argument("--hp-step", type=int, default=7, help="step between the max HPs swept")
+    parser.add_argument("--calls", type=int, default=200000, help="catches to time")
+    args = parser.parse_args()
+
+    calculation = load("game.calculation")
+    constants = load("game.constants")
+    load("util.static_random").set_state(1)
+    host_random.seed(1)
+
+    ok = check_tolerance(calculation, constants, args.hp_step)
+    game_random = calculation.random
+    calculation.random = host_random
+    ok = check_distribution(calculation, args.samples, "random") and ok
+    calculation.random = game_random
+    ok = check_distribution(calculation, args.samples, "static_random") and ok
+    bench(calculation, constants, args.calls)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
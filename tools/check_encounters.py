@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Checks EncounterTable in game/mons.py gives each mon in proportion to its weight, and times it.
+
+- Statistics: draws are chi-square tested against the weights, on the alias path and on the bisect
+  path it uses after set_weight, with draws through util/static_random as the game makes them.
+- Speed: samples per second on each path, and for the linear scan it replaced.
+
+Exits non-zero if a chi-square test fails.
+
+Usage:
+    python3 tools/check_encounters.py [--samples 300000]
+"""
+import argparse
+import math
+import sys
+import time
+
+from host import load
+
+
+def chi2_critical(df: int) -> float:
+    """
+    Chi-square critical value at p = 0.001, by the Wilson-Hilferty approximation.
+    """
+    z = 3.090
+    return df * (1 - 2 / (9 * df) + z * math.sqrt(2 / (9 * df))) ** 3
+
+
+def check(name: str, table, samples: int) -> bool:
+    counts = {}
+    for _ in range(samples):
+        template = table.sample()
+        counts[template.id] = counts.get(template.id, 0) + 1
+    total = table.total
+    chi2 = 0.0
+    df = -1
+    for i, weight in enumerate(table._weights):
+        if weight == 0:
+            if counts.get(table.templates[i].id):
+                print(f"{name}: drew {table.templates[i].name}, which has a weight of 0: FAIL")
+                return False
+            continue
+        expected = samples * weight / total
+        chi2 += (counts.get(table.templates[i].id, 0) - expected) ** 2 / expected
+        df += 1
+    critical = chi2_critical(df)
+    ok = chi2 < critical
+    print(f"{name}: chi-square {chi2:.1f} with {df} degrees of freedom (critical {critical:.1f}): "
+          f"{'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def linear_scan(templates, weights, total, random):
+    # How choose_weighted_mon picked a mon before EncounterTable
+    r = random.randrange(0, total)
+    for template, weight in zip(templates, weights):
+        if r < weight:
+            return template
+        r -= weight
+    return templates[-1]
+
+
+def bench(mons, random, samples: int):
+    table = mons.EncounterTable(mons.mon_weights)
+    start = time.perf_counter()
+    for _ in range(samples):
+        table.sample()
+    alias = time.perf_counter() - start
+
+    # Keep the table on the bisect path, as in main()
+    start = time.perf_counter()
+    for _ in range(samples):
+        if table._stale_samples < 0 or table._stale_samples >= len(table._weights) - 1:
+            table.set_weight(0, table._weights[0])
+        table.sample()
+    bisect = time.perf_counter() - start
+
+    templates = list(mons.mons_list)
+    weights = list(mons.mon_weights)
+    total = sum(weights)
+    start = time.perf_counter()
+    for _ in range(samples):
+        linear_scan(templates, weights, total, random)
+    linear = time.perf_counter() - start
+    print(f"Speed: alias {samples / alias:.0f}/s, bisect {samples / bisect:.0f}/s, "
+          f"linear scan {samples / linear:.0f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=300000, help="draws per test")
+    args = parser.parse_args()
+
+    mons = load("game.mons")
+    random = load("util.static_random")
+    random.set_state(1)
+
+    table = mons.EncounterTable(mons.mon_weights)
+    ok = check("Alias", table, args.samples)
+
+    # A changed weight puts the table on the bisect path until it has been sampled once per mon.
+    # Changing a weight again before then keeps it there.
+    table = mons.EncounterTable(mons.mon_weights)
+    table.set_weight(0, table._weights[0] * 2)
+    stay_stale = table.sample
+    def sample():
+        if table._stale_samples < 0 or table._stale_samples >= len(table._weights) - 1:
+            table.set_weight(0, table._weights[0])
+        return stay_stale()
+    table.sample = sample
+    ok = check("Bisect", table, args.samples) and ok
+
+    table = mons.EncounterTable([0, 5, 0, 10] + [0] * (len(mons.mons_list) - 4))
+    ok = check("Mostly zero weights", table, args.samples) and ok
+
+    empty = mons.EncounterTable([0] * len(mons.mons_list))
+    try:
+        empty.sample()
+        print("All zero weights: sampled something: FAIL")
+        ok = False
+    except ValueError:
+        print("All zero weights: ValueError: OK")
+
+    bench(mons, random, args.samples)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
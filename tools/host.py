@@ -0,0 +1,47 @@
+"""
+Loads the game logic into a normal Python install, so tools can run battles off the badge.
+
+Not copied to the badge by flash.sh.
+"""
+import os
+import sys
+import time
+import types
+import importlib
+
+PACKAGE = "badgemon_source"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _provide_badge_modules():
+    # game/moves.py imports the drawing API and App for its move animations.
+    # Battles run here never draw, so empty stand-ins are enough to import it.
+    if "ctx" not in sys.modules:
+        ctx = types.ModuleType("ctx")
+        class Context:
+            LEFT = RIGHT = CENTER = MIDDLE = 0
+        ctx.Context = Context
+        sys.modules["ctx"] = ctx
+    if "app" not in sys.modules:
+        app = types.ModuleType("app")
+        class App:
+            pass
+        app.App = App
+        sys.modules["app"] = app
+    # MicroPython's millisecond clock, used by Player
+    if not hasattr(time, "ticks_ms"):
+        time.ticks_ms = lambda: int(time.monotonic() * 1000)
+        time.ticks_diff = lambda a, b: a - b
+        time.ticks_add = lambda a, b: a + b
+
+
+def load(module: str):
+    """
+    Import a module from the game, e.g. load("game.battle_main").
+    """
+    if PACKAGE not in sys.modules:
+        _provide_badge_modules()
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ROOT]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{module}")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Measures how much memory a player's mons take, a party of 6 plus --case more in the badgemon case.
+
+Mons are measured as Mon stores them now, with stats, EVs, IVs and PP in one array('H'),
+and again copied into the layout Mon had before: four lists on a plain object with a __dict__.
+Both keep the template, nickname and moves they share with everything else, so only the mons themselves
+are counted.
+
+Under CPython this uses tracemalloc. CPython's objects aren't laid out like MicroPython's, and __slots__
+does nothing on MicroPython, so those numbers say nothing about the badge. For the badge's numbers run it
+under MicroPython (e.g. the unix port, from tools/), where gc.mem_alloc() is used instead.
+
+Usage:
+    python3 tools/measure_mons.py [--case 30]
+    micropython measure_mons.py [30]
+"""
+import gc
+import sys
+
+from host import load
+
+MICROPYTHON = sys.implementation.name == "micropython"
+
+
+class LegacyMon:
+    """
+    A Mon's data, laid out as Mon kept it before it moved to an array.
+    """
+    def __init__(self, mon):
+        self.template = mon.template
+        self.nickname = mon.nickname
+        self.level = mon.level
+        self.stats = list(mon.stats)
+        self.evs = list(mon.evs)
+        self.ivs = list(mon.ivs)
+        self.hp = mon.hp
+        self.fainted = mon.fainted
+        self.accuracy = mon.accuracy
+        self.evasion = mon.evasion
+        self.status = mon.status
+        self.xp = mon.xp
+        self.pp = list(mon.pp)
+        self.moves = list(mon.moves)
+
+
+def measure(build) -> int:
+    """
+    @return: Bytes still allocated after build() runs, for what it returns.
+    """
+    if MICROPYTHON:
+        gc.collect()
+        before = gc.mem_alloc()
+        kept = build()
+        gc.collect()
+        after = gc.mem_alloc()
+    else:
+        import tracemalloc
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main():
+    if MICROPYTHON:
+        # No argparse there
+        case = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    else:
+        import argparse
+        parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+        parser.add_argument("--case", type=int, default=30, help="mons in the case, on top of a party of 6")
+        case = parser.parse_args().case
+
+    mons = load("game.mons")
+    load("util.static_random").set_state(1)
+    count = 6 + case
+    templates = [mons.mons_list[i % len(mons.mons_list)] for i in range(count)]
+    # Build the templates, learnsets and moves before measuring, they're shared by every mon
+    for template in templates:
+        mons.Mon(template, 30)
+
+    current = []
+    now = measure(lambda: current.extend(mons.Mon(template, 5 + i) for i, template in enumerate(templates)))
+    before = measure(lambda: [LegacyMon(mon) for mon in current])
+    print(f"{count} mons under {sys.implementation.name}: {now} bytes now ({now // count} per mon), "
+          f"{before} bytes in the old layout ({before // count} per mon)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Measures the longest frames during a scene change, with the next scene preloaded during the fade as the
+game does now, and built all at once in a single frame as switch_scene did before.
+
+The real SceneManager is run frame by frame on an asyncio loop, with a fixed frame length, from Field to
+each scene below and back. A frame's time covers update() plus whatever tasks (the preload, the fade)
+ran before the next one. Drawing isn't timed, the badge's drawing API is stubbed out here.
+The badge's own modules (sasppu, ctx, the event bus, ...) are replaced by stand-ins that do nothing.
+
+Two frames are reported for each change: the worst while the fades are playing, where a long frame makes
+them stutter, and the one the scenes are switched in, which is between the fades while the screen is blank.
+
+These are CPython times, the badge is far slower. What matters is how the frames compare with each other,
+and with an ordinary frame.
+
+Usage:
+    python3 tools/measure_scene_change.py [--repeats 20]
+"""
+import argparse
+import asyncio
+import contextlib
+import gc
+import os
+import sys
+import tempfile
+import time
+import types
+import warnings
+
+from host import load
+
+# ms each frame moves the game on by
+FRAME = 33
+# From Field (2) to: (name, scene, kwargs), built once the game is loaded
+TARGETS = (
+    ("Badgedex", 5, lambda mons, player: {}),
+    ("Stats", 8, lambda mons, player: {"mon": mons.Mon(mons.mons_list[0], 5)}),
+    ("Battle", 3, lambda mons, player: {
+        "opponent": player.Cpu("Wild", [mons.Mon(mons.mons_list[1], 5)], [], [])}),
+)
+
+
+class _Anything:
+    """
+    Stands in for anything on the badge's drawing API: every call and attribute gives another one.
+    """
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return _Anything()
+
+    def __call__(self, *args, **kwargs):
+        return _Anything()
+
+    def text_width(self, text):
+        return len(text) * getattr(self, "font_size", 10) / 2
+
+
+def _module(name: str, **values):
+    module = types.ModuleType(name)
+    module.__dict__.update(values)
+    sys.modules[name] = module
+    return module
+
+
+def provide_ui_modules():
+    class _State(_Anything):
+        BG1_ENABLE = CMATH_ENABLE = SUB_SUB_SCREEN = 0
+
+    class _Background(_Anything):
+        WIDTH = 256
+        HEIGHT = 512
+
+    sasppu = _module(
+        "sasppu", Background=_Background, MainState=_State, CMathState=_State,
+        MAP_WIDTH=32, WINDOW_ALL=0xF, HDMA_NOOP=0, HDMA_MAIN_STATE_FLAGS=1, HDMA_CMATH_STATE_FLAGS=2,
+        HDMA_MAIN_STATE_SUBSCREEN_COLOUR=3, TRANSPARENT_BLACK=0, WHITE=1, GREEN=2, BLUE=3, RED=4,
+        hdma_enable=0, forced_blank=False, bg1=[0] * (32 * 64),
+        grey555=lambda *a: 0, grey555_cmath=lambda *a: 0, rgb555=lambda *a: 0,
+        fill_background=lambda *a: None, draw_text_background=lambda *a: None,
+        get_text_size=lambda font, text, *a: (len(text) * 6, 8), gfx_reset=lambda: None)
+    for channel in range(8):
+        setattr(sasppu, f"hdma_{channel}", [(0, 0)] * 240)
+    _module("display", get_fps=lambda: 30)
+    _module("ctx", Context=_Anything)
+
+    class App:
+        def __init__(self):
+            self.overlays = []
+
+        def draw(self, ctx):
+            pass
+
+    _module("app", App=App, SASPPUApp=App)
+    _module("app_components")
+    _module("app_components.tokens", colors={})
+
+    class EventBus:
+        def __init__(self):
+            self.handlers = []
+
+        def on(self, kind, handler, app):
+            self.handlers.append(handler)
+
+        def remove(self, kind, handler, app):
+            if handler in self.handlers:
+                self.handlers.remove(handler)
+
+        def emit(self, event):
+            pass
+
+    class Buttons:
+        def __init__(self, app):
+            pass
+
+        def get(self, button):
+            return False
+
+    _module("system")
+    _module("system.eventbus", eventbus=EventBus())
+    _module("system.scheduler")
+    _module("system.scheduler.events", RequestStopAppEvent=_Anything)
+    _module("events")
+    _module("events.input", ButtonDownEvent=_Anything, Buttons=Buttons,
+            BUTTON_TYPES={"UP": 1, "DOWN": 2, "LEFT": 3, "RIGHT": 4, "CONFIRM": 5, "CANCEL": 6})
+    # MicroPython's extra gc calls, which SceneManager prints after building a scene
+    gc.mem_alloc = lambda: 0
+    gc.mem_free = lambda: 0
+
+
+async def frame(sm) -> float:
+    """
+    Run one frame and whatever tasks get to run before the next.
+    @return: How long it took, in ms.
+    """
+    start = time.perf_counter()
+    sm.update(FRAME)
+    await asyncio.sleep(0)
+    return (time.perf_counter() - start) * 1000
+
+
+async def settle(sm, frames: int = 30) -> float:
+    """
+    Run frames until the scene has faded in.
+    @return: The longest frame, in ms.
+    """
+    worst = 0.0
+    for _ in range(frames):
+        worst = max(worst, await frame(sm))
+    return worst
+
+
+async def preloaded(sm, scene: int, kwargs):
+    """
+    Fade to the scene, as the game does.
+    @return: (longest frame while fading, the frame the scenes were switched in), in ms.
+    """
+    old = sm._scene
+    fade = asyncio.ensure_future(old.fade_to_scene(scene, **kwargs))
+    worst = 0.0
+    switch = 0.0
+    while not fade.done():
+        took = await frame(sm)
+        if sm._scene is old:
+            worst = max(worst, took)
+        else:
+            switch = took
+    fade.result()
+    return max(worst, await settle(sm)), switch
+
+
+async def all_at_once(sm, scene: int, kwargs):
+    """
+    Switch to the scene in one frame, building it there, as switch_scene did before preloading.
+    @return: (longest frame while fading in, the frame the scenes were switched in), in ms.
+    """
+    start = time.perf_counter()
+    sm.update(FRAME)
+    sm.switch_scene(scene, **kwargs)
+    await asyncio.sleep(0)
+    switch = (time.perf_counter() - start) * 1000
+    return await settle(sm), switch
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+async def run(repeats: int, report):
+    mons = load("game.mons")
+    player = load("game.player")
+    manager = load("scenes.scene_manager")
+    manager.SceneManager._attempt_load = lambda self: setattr(self, "_context", None)
+    sm = manager.SceneManager()
+    sm.switch_scene(2)
+    await settle(sm)
+    ordinary = median([await frame(sm) for _ in range(100)])
+    report.append(f"Ordinary frame in Field: {ordinary:.3f}ms")
+    for name, scene, make_kwargs in TARGETS:
+        for way, change in (("preloaded", preloaded), ("all at once", all_at_once)):
+            fading = []
+            switching = []
+            for _ in range(repeats):
+                worst, switch = await change(sm, scene, make_kwargs(mons, player))
+                fading.append(worst)
+                switching.append(switch)
+                await change(sm, 2, {})
+            report.append(f"Field to {name}, {way}: worst frame while fading {median(fading):.3f}ms, "
+                          f"switching frame {median(switching):.3f}ms (median of {repeats})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=20, help="scene changes to measure each way")
+    args = parser.parse_args()
+
+    provide_ui_modules()
+    # SceneManager saves into the working directory, so keep that out of the repo
+    os.chdir(tempfile.mkdtemp())
+    load("config").SAVE_PATH = os.path.join(os.getcwd(), "saves") + os.sep
+    # The game prints as it goes, and makes coroutines for menu entries that never get picked
+    warnings.simplefilter("ignore", RuntimeWarning)
+    report = []
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        asyncio.run(run(args.repeats, report))
+    print("\n".join(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Round-robin balance tournament.
+
+Every pairing of mons in mons_list fights at each level, once per seed, as Cpu vs Cpu through
+game/battle_main. Games are spread over a process pool, one pairing and level per job.
+
+Writes, for an --out of "tournament":
+    tournament-games.csv   wins per pairing and level. Appended to as jobs finish, so a rerun resumes.
+    tournament-matrix.csv  win rate of each mon (row) against each other mon (column), per level.
+    tournament-elo.csv     Elo rating of each mon across every game played.
+
+With --evolve, each mon plays as whatever it would have evolved into by the level being played, as it
+would be in a real game. Keep those results apart from unevolved ones with a different --out.
+
+Usage:
+    python3 tools/tournament.py --levels 5,20,50 --seeds 32 --out tournament
+"""
+import argparse
+import csv
+import math
+import multiprocessing
+import os
+
+from host import load
+
+_mons = None
+_player = None
+_battle_main = None
+_random = None
+_evolution = None
+_evolve = False
+
+
+def init_worker(evolve: bool = False):
+    global _mons, _player, _battle_main, _random, _evolution, _evolve
+    _evolve = evolve
+    _evolution = load("game.evolution")
+    _mons = load("game.mons")
+    _player = load("game.player")
+    _battle_main = load("game.battle_main")
+    _random = load("util.static_random")
+
+
+def run_sync(coro):
+    """
+    Run a coroutine that never actually waits on anything, like a battle between two Cpus.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError("Battle waited on something, is a human playing?")
+
+
+def game_seed(a: int, b: int, level: int, seed: int) -> int:
+    return a * 7919 + b * 104729 + level * 1299709 + seed * 15485863
+
+
+def play_game(a: int, b: int, level: int, seed: int) -> bool:
+    """
+    @return: Whether mons_list[a] beat mons_list[b], or their evolved forms with --evolve. Sides alternate with the seed.
+    """
+    _random.set_state(game_seed(a, b, level, seed))
+    if _evolve:
+        a = _evolution.form_at_level(a, level)
+        b = _evolution.form_at_level(b, level)
+    mon_a = _mons.Mon(_mons.mons_list[a], level)
+    mon_b = _mons.Mon(_mons.mons_list[b], level)
+    player_a = _player.Cpu("A", [mon_a], [], {})
+    player_b = _player.Cpu("B", [mon_b], [], {})
+    if seed & 1:
+        battle = _battle_main.Battle(player_b, player_a)
+    else:
+        battle = _battle_main.Battle(player_a, player_b)
+    return run_sync(battle.run()) is player_a
+
+
+def play_pairing(job):
+    a, b, level, seeds = job
+    wins = 0
+    for seed in range(seeds):
+        if play_game(a, b, level, seed):
+            wins += 1
+    return a, b, level, seeds, wins
+
+
+def run_jobs(jobs, processes, on_result, play=play_pairing, initializer=init_worker, initargs=()):
+    """
+    Play jobs of (a, b, level, seeds) across a process pool, calling on_result as each finishes.
+    """
+    with multiprocessing.Pool(processes, initializer, initargs) as pool:
+        for result in pool.imap_unordered(play, jobs):
+            on_result(result)
+
+
+def read_games(path: str):
+    """
+    @return: {(a, b, level): (seeds, wins)} from a games file, or {} if there isn't one.
+    """
+    games = {}
+    if not os.path.exists(path):
+        return games
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            games[(int(row["a"]), int(row["b"]), int(row["level"]))] = (int(row["seeds"]), int(row["wins_a"]))
+    return games
+
+
+def elo_ratings(games, count: int, iterations: int = 200):
+    """
+    Fit Elo ratings to every game at once (Bradley-Terry), so the order games finished in doesn't matter.
+    Each pairing gets half a win each way, so a mon that never wins still gets a finite rating.
+
+    @return: A list of ratings indexed by mon, averaging 1500.
+    """
+    played = [[0.0] * count for _ in range(count)]
+    wins = [0.0] * count
+    for (a, b, _), (seeds, w) in games.items():
+        played[a][b] += seeds + 1
+        played[b][a] += seeds + 1
+        wins[a] += w + 0.5
+        wins[b] += seeds - w + 0.5
+    strength = [1.0] * count
+    for _ in range(iterations):
+        new = []
+        for i in range(count):
+            denom = sum(played[i][j] / (strength[i] + strength[j]) for j in range(count) if played[i][j])
+            new.append(wins[i] / denom if denom else strength[i])
+        mean = math.exp(sum(math.log(s) for s in new) / count)
+        strength = [s / mean for s in new]
+    return [1500 + 400 * math.log10(s) for s in strength]
+
+
+def write_matrix(path: str, games, names, levels):
+    with open(path, "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["level", "mon"] + names)
+        for level in levels:
+            for a in range(len(names)):
+                row = [level, names[a]]
+                for b in range(len(names)):
+                    if (a, b, level) in games:
+                        seeds, w = games[(a, b, level)]
+                        row.append(f"{w / seeds:.3f}")
+                    elif (b, a, level) in games:
+                        seeds, w = games[(b, a, level)]
+                        row.append(f"{1 - w / seeds:.3f}")
+                    else:
+                        row.append("")
+                out.writerow(row)
+
+
+def write_elo(path: str, games, names):
+    ratings = elo_ratings(games, len(names))
+    played = [0] * len(names)
+    wins = [0] * len(names)
+    for (a, b, _), (seeds, w) in games.items():
+        played[a] += seeds
+        played[b] += seeds
+        wins[a] += w
+        wins[b] += seeds - w
+    with open(path, "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["mon", "elo", "games", "wins"])
+        for i in sorted(range(len(names)), key=lambda i: -ratings[i]):
+            out.writerow([names[i], f"{ratings[i]:.0f}", played[i], wins[i]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play every mon against every other mon.")
+    parser.add_argument("--levels", default="5,20,50", help="comma separated levels to play at")
+    parser.add_argument("--seeds", type=int, default=32, help="games per pairing per level")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes, defaults to every core")
+    parser.add_argument("--out", default="tournament", help="prefix for the result files")
+    parser.add_argument("--evolve", action="store_true", help="play each mon as its evolved form for the level")
+    args = parser.parse_args()
+
+    levels = [int(l) for l in args.levels.split(",")]
+    names = [m.name for m in load("game.mons").mons_list]
+    games_path = f"{args.out}-games.csv"
+
+    games = read_games(games_path)
+    jobs = [
+        (a, b, level, args.seeds)
+        for level in levels
+        for a in range(len(names))
+        for b in range(a + 1, len(names))
+        if games.get((a, b, level), (None,))[0] != args.seeds
+    ]
+    print(f"{len(jobs)} pairings to play, {len(games)} already done")
+
+    new_file = not os.path.exists(games_path)
+    with open(games_path, "a", newline="") as f:
+        out = csv.writer(f)
+        if new_file:
+            out.writerow(["a", "b", "level", "seeds", "wins_a"])
+        done = 0
+
+        def on_result(result):
+            nonlocal done
+            a, b, level, seeds, wins = result
+            out.writerow(result)
+            f.flush()
+            games[(a, b, level)] = (seeds, wins)
+            done += 1
+            if done % 100 == 0:
+                print(f"{done}/{len(jobs)}")
+
+        run_jobs(jobs, args.processes, on_result, initargs=(args.evolve,))
+
+    games = {k: v for k, v in games.items() if k[2] in levels}
+    write_matrix(f"{args.out}-matrix.csv", games, names, levels)
+    write_elo(f"{args.out}-elo.csv", games, names)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from array import array
 from asyncio import Event
 import math
 from ..util.static_random import hash_without_sine
@@ -6,7 +7,7 @@ if _sys_implementation.name != "micropython":
     from typing import List, Tuple
 
 class Animation:
-    def __init__(self, length: int=1000, infinite=False) -> None:
+    def __init__(self, length: int=1000, infinite=False, background=False) -> None:
         assert(length >= 0)
         self._next: List["Animation"] = []
         self._prev: List["Animation"] = []
@@ -20,6 +21,8 @@ class Animation:
         self._started: bool = False
         self._ended: bool = False
         self._infinite: bool = infinite
+        # Background animations can skip frames when things are running slow
+        self._background: bool = background
 
     def _update(self, time: float) -> None:
         pass
@@ -214,15 +217,57 @@ def slower(start:float=0, end:float=1, x:float=0):
 def scaled_hash_without_sine(start,end,p):
     return lerp(start,end,hash_without_sine(lerp(start,end*100,p)))
 
+# How many steps baked curves have between 0 and 1
+RESOLUTION = 256
+
+class Curve:
+    '''
+    An easing curve, worked out once at a fixed resolution and then looked up, interpolating between the
+    nearest two steps. Make your own at import time, e.g. BUMP = Curve(lambda x: 4*x*(1-x)), and pass it
+    as curve to any EditorAnim or AnimCycle.
+    Periodic curves repeat outside of 0 to 1, the others stay at their first or last value.
+    '''
+    def __init__(self, fun: callable, resolution: int=RESOLUTION, periodic: bool=False) -> None:
+        self._resolution = resolution
+        self._periodic = periodic
+        self._table = array("f", [fun(i / resolution) for i in range(resolution + 1)])
+        if periodic:
+            self._table[resolution] = self._table[0]
+
+    def at(self, x: float) -> float:
+        if self._periodic:
+            x %= 1.0
+        elif x <= 0:
+            return self._table[0]
+        elif x >= 1:
+            return self._table[self._resolution]
+        x *= self._resolution
+        i = int(x)
+        if i >= self._resolution:
+            i = self._resolution - 1
+        a = self._table[i]
+        return a + (self._table[i + 1] - a) * (x - i)
+
+SIN = Curve(lambda x: math.sin(x * math.tau), periodic=True)
+SSTEP = Curve(lambda x: sstep(x=x))
+FASTER = Curve(lambda x: faster(x=x))
+SLOWER = Curve(lambda x: slower(x=x))
+
 class AnimCycle(Animation):
     '''
-    Repeats the given animation forever, with a saw-wave like pattern
+    Repeats the given animation forever, with a saw-wave like pattern, or following curve if one is given.
     '''
+    _curve: "Curve | None" = None
+
     def _fun(self, time: float) -> float:
-        return time % 1.0
+        if self._curve is None:
+            return time % 1.0
+        return self._curve.at(time % 1.0)
 
-    def __init__(self, other: Animation, *args, **kwargs) -> None:
+    def __init__(self, other: Animation, *args, curve: "Curve | None"=None, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        if curve is not None:
+            self._curve = curve
         self._other = other
         self._infinite = True
 
@@ -256,19 +301,25 @@ class AnimSin(AnimCycle):
     '''
     Repeats the given animation forever, with a sine-wave like pattern
     '''
-    def _fun(self, time: float) -> float:
-        return math.sin(time*math.tau)
+    _curve = SIN
 
 class EditorAnim(Animation):
     '''
     Calls a function with the result of a curve between start and end.
+    With no curve it just gives start.
     '''
+    _curve: "Curve | None" = None
+
     def _fun(self, start:float,end:float,time:float):
-        return start
+        if self._curve is None:
+            return start
+        return lerp(start, end, self._curve.at(time))
 
-    def __init__(self, editor:callable, start:float=0, end:float=1, *args, **kwargs) -> None:
+    def __init__(self, editor:callable, start:float=0, end:float=1, *args, curve: "Curve | None"=None, **kwargs) -> None:
         self._start = start
         self._end = end
+        if curve is not None:
+            self._curve = curve
         self._editor = editor
         super().__init__(*args, **kwargs)
 
@@ -295,22 +346,19 @@ class AnimSStep(EditorAnim):
     '''
     Calls the editor function with a smoothstep function.
     '''
-    def _fun(self, start: float, end: float, time: float):
-        return sstep(start, end, time)
+    _curve = SSTEP
 
 class AnimFaster(EditorAnim):
     '''
     Calls the editor function with an Ease In function.
     '''
-    def _fun(self, start: float, end: float, time: float):
-        return faster(start, end, time)
+    _curve = FASTER
 
 class AnimSlower(EditorAnim):
     '''
     Calls the editor function with an Ease Out function.
     '''
-    def _fun(self, start: float, end: float, time: float):
-        return slower(start, end, time)
+    _curve = SLOWER
 
 class AnimRandom(EditorAnim):
     '''
@@ -325,7 +373,7 @@ class AnimationScheduler:
         self._time: int = 0
         self._event_stream: List[Tuple[int, Animation]] = []
 
-    def update(self, delta: int) -> None:
+    def update(self, delta: int, skip_background: bool=False) -> None:
         '''
         Updates all animations.
         This works by keeping track of the global time in milliseconds, and then works out how far
@@ -333,6 +381,7 @@ class AnimationScheduler:
         Before this it will run through the eventstram for this frame, which contains all the end times
         for the animations. If the animation ends this frame it will end, any animations that come after it
         will be started, and any animations that are ended by that animations are scheduled for ending next.
+        If skip_background is True, background animations aren't updated this frame. They still end on time.
         '''
         end_time = self._time + delta
         while True:
@@ -362,6 +411,8 @@ class AnimationScheduler:
         self._active[:] = [i for i in self._active if not i[1]._ended]
 
         for start, anim in self._active:
+            if skip_background and anim._background:
+                continue
             local_time = (self._time - start) / anim._length
             anim._update(local_time)
 
@@ -15,6 +15,8 @@ from ..util.misc import *
 
 import sasppu
 
+from ..util import hdma, compositor
+
 BOX_WIDTH = 64 # half of width
 BOX_HEIGHT = 120 # half of height
 ITEM_WIDTH = 128
@@ -40,6 +42,11 @@ SUBTITLE_START_Y = RESERVED_START
 SPARE_TILE_X = sasppu.Background.WIDTH - 8
 SPARE_TILE_Y = sasppu.Background.HEIGHT - 8
 
+Z_LEVEL = 1
+HDMA_CHANNEL = 6
+MS_FLAGS = sasppu.MainState.BG1_ENABLE
+CS_FLAGS = 0
+
 #----------------
 #TTTTTTT_44444444
 #1111111155555555
@@ -77,81 +84,65 @@ class ChoiceDialog:
         self.closed_event.set()
         
         self._text_update_needed = False
+        # What _draw_text last drew, so moving the selection only redraws the two entries that changed
+        self._drawn_tree = None
+        self._drawn_start = 0
+        self._drawn_selected = 0
 
         self._sasppu_init()
 
     def _sasppu_init(self):
-        self.ms = sasppu.MainState()
-        self.ms.bind(False)
-        self.cs = sasppu.CMathState()
-        self.cs.bind(False)
-        self.bg = sasppu.Background()
-        self.bg.bind(1, False)
-        self.bg1 = sasppu.bg1
-
-        self.bg.windows = sasppu.WINDOW_ALL
-        self.bg.x = BASE_BG1_X
-        self.bg.y = BASE_BG1_Y
-        self.bg.flags = 0
-
-        self.ms.flags = sasppu.MainState.BG1_ENABLE 
-
-        #self.ms.flags = sasppu.MainState.BG1_ENABLE | sasppu.MainState.CMATH_ENABLE
-        #self.cs.flags = sasppu.CMathState.CMATH_ENABLE | sasppu.CMathState.SUB_SUB_SCREEN
+        self._compositor = compositor.get_compositor()
+        self._region = self._compositor.allocate(self, RESERVED_HEIGHT // 4)
+        self._compositor.scroll(self, BASE_BG1_X, BASE_BG1_Y + self._region.y)
 
         self._write_bg1_map()
 
+        hdma.get_manager().claim(self, HDMA_CHANNEL)
         #self._fill_hdma()
 
     def _fill_hdma(self):
-        for i in range(240):
-            sasppu.hdma_7[i] = (sasppu.HDMA_NOOP, 0)
-        sasppu.hdma_enable |= 0x80
-        
+        entries = {}
         height = int(self._opened_amount * BOX_HEIGHT)
         box_top = 120 - height
         box_end = 120 + height
 
-        ms_flags = self.ms.flags & (~sasppu.MainState.BG1_ENABLE) & 0xFF
+        ms_flags = MS_FLAGS & (~sasppu.MainState.BG1_ENABLE) & 0xFF
         ms_sub_col = sasppu.grey555(13)
-        cs_flags = self.cs.flags & (~sasppu.CMathState.CMATH_ENABLE) & 0xFF
+        cs_flags = CS_FLAGS & (~sasppu.CMathState.CMATH_ENABLE) & 0xFF
 
-        sasppu.hdma_7[0] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
-        sasppu.hdma_7[1] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
-        sasppu.hdma_7[2] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
+        entries[0] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
+        entries[1] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
+        entries[2] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
 
-        sasppu.hdma_7[box_end] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
-        sasppu.hdma_7[box_end + 3] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
-        sasppu.hdma_7[box_end + 5] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
+        entries[box_end] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
+        entries[box_end + 3] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
+        entries[box_end + 5] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
 
         ms_flags |= sasppu.MainState.BG1_ENABLE
         ms_sub_col = sasppu.grey555(10)
         cs_flags |= sasppu.CMathState.CMATH_ENABLE
 
-        sasppu.hdma_7[box_top - 5] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
-        sasppu.hdma_7[box_top - 3] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
+        entries[box_top - 5] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
+        entries[box_top - 3] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
         if box_top != box_end:
-            sasppu.hdma_7[box_top] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
+            entries[box_top] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
+        hdma.get_manager().set(self, entries)
 
     def _clear_hdma(self):
-        for i in range(240):
-            sasppu.hdma_7[i] = (sasppu.HDMA_NOOP, 0)
-        #sasppu.hdma_enable &= 0x7F
-        #self.ms.flags &= (~sasppu.MainState.BG1_ENABLE) & 0xFF
-        #self.cs.flags &= (~sasppu.CMathState.CMATH_ENABLE) & 0xFF
+        hdma.get_manager().clear(self)
+        self._compositor.close(self)
 
     def _write_bg1_map(self):
+        xend = ITEM_WIDTH // 8
+        yend = RESERVED_HEIGHT // 8
+        spare = (((SPARE_TILE_X) + ((SPARE_TILE_Y) * sasppu.Background.WIDTH)) // 8) * 4
         for y in range(RESERVED_HEIGHT // 4):
-            for x in range(sasppu.MAP_WIDTH):
-                xend = ITEM_WIDTH // 8
-                yend = RESERVED_HEIGHT // 8
-                index = x + (y * sasppu.MAP_WIDTH)
-                if x >= xend:
-                    self.bg1[index] = (((SPARE_TILE_X) + ((SPARE_TILE_Y) * sasppu.Background.WIDTH)) // 8) * 4
-                elif y >= yend:
-                    self.bg1[index] = ((((x + xend) * 8) + ((((y - yend) * 8) + RESERVED_START) * sasppu.Background.WIDTH)) // 8) * 4
-                else:
-                    self.bg1[index] = (((x * 8) + (((y * 8) + RESERVED_START) * sasppu.Background.WIDTH)) // 8) * 4
+            if y >= yend:
+                row = compositor.bitmap_row(ITEM_WIDTH, ((y - yend) * 8) + RESERVED_START, xend, spare)
+            else:
+                row = compositor.bitmap_row(0, (y * 8) + RESERVED_START, xend, spare)
+            self._region.write_row(y, row)
 
     def is_open(self):
         return self._open
@@ -187,28 +178,52 @@ class ChoiceDialog:
             self.open()
     
     def _draw_text(self):
+        start_index = max(min(int(self._selected) - 3, len(self._current_tree[1]) - 7), 0)
+        if self._drawn_tree is self._current_tree and self._drawn_start == start_index:
+            # Same entries showing, only the highlight moved. Unlike SpeechDialog, there's no spare background
+            # to keep highlighted copies in and remap bg1 to: the title and 7 entries fill the reserved rows,
+            # and the speech cache strip sits right above them. So the two entries that changed are redrawn.
+            for index in (self._drawn_selected, int(self._selected)):
+                if start_index <= index < start_index + 7:
+                    self._draw_entry(start_index, index - start_index, True)
+            self._drawn_selected = int(self._selected)
+            return
+        self._drawn_tree = self._current_tree
+        self._drawn_start = start_index
+        self._drawn_selected = int(self._selected)
         sasppu.fill_background(0, RESERVED_START, 256, RESERVED_HEIGHT, sasppu.TRANSPARENT_BLACK)
         width = sasppu.get_text_size(255, self._current_tree[0], True)[0]
         offset_left = (ITEM_WIDTH - width) // 2
         sasppu.draw_text_background(offset_left, RESERVED_START - 12, sasppu.WHITE, ITEM_WIDTH, self._current_tree[0], True)
-        start_index = max(min(int(self._selected) - 3, len(self._current_tree[1]) - 7), 0)
-        for (i, choice) in enumerate(self._current_tree[1][start_index : start_index + 7]):
-            line = choice[0]
-            if line == "":
-                continue
-            width = sasppu.get_text_size(255, line, True)[0]
-            offset_left = (ITEM_WIDTH - width) // 2
-            start_y = (i * LINE_HEIGHT) + LINE_HEIGHT
-            if i >= 3:
-                offset_left += ITEM_WIDTH
-                start_y = ((i - 3) * LINE_HEIGHT)
-            if int(self._selected) == start_index + i:
-                colour = sasppu.rgb555(30,15,5)
-            else:
-                colour = sasppu.WHITE
-            sasppu.draw_text_background(offset_left, RESERVED_START + (start_y) - 12, colour, width, line, True)
+        for i in range(min(7, len(self._current_tree[1]) - start_index)):
+            self._draw_entry(start_index, i, False)
         sasppu.fill_background(SPARE_TILE_X, SPARE_TILE_Y, 8, 8, sasppu.GREEN)
 
+    def _draw_entry(self, start_index: int, i: int, clear: bool):
+        """
+        Draw the i-th entry showing, highlighted if it's selected.
+        :param clear: Whether to clear what was drawn there first.
+        """
+        line = self._current_tree[1][start_index + i][0]
+        offset_left = 0
+        start_y = (i * LINE_HEIGHT) + LINE_HEIGHT
+        if i >= 3:
+            offset_left += ITEM_WIDTH
+            start_y = ((i - 3) * LINE_HEIGHT)
+        if clear:
+            # Only rows from RESERVED_START are shown, and the title is drawn just above the first entry
+            top = max(RESERVED_START + start_y - 12, RESERVED_START)
+            sasppu.fill_background(offset_left, top, ITEM_WIDTH, RESERVED_START + start_y + 8 - top, sasppu.TRANSPARENT_BLACK)
+        if line == "":
+            return
+        width = sasppu.get_text_size(255, line, True)[0]
+        offset_left += (ITEM_WIDTH - width) // 2
+        if int(self._selected) == start_index + i:
+            colour = sasppu.rgb555(30,15,5)
+        else:
+            colour = sasppu.WHITE
+        sasppu.draw_text_background(offset_left, RESERVED_START + (start_y) - 12, colour, width, line, True)
+
     def update(self, delta: float):
         if self.is_open():
             if self._state == STATE_CLOSED:
@@ -220,6 +235,8 @@ class ChoiceDialog:
                 self.closed_event.clear()
                 self.opened_event.clear()
                 self._opened_amount = 0.0
+                self._compositor.open(self, Z_LEVEL, MS_FLAGS, CS_FLAGS)
+                self._text_update_needed = True
                 eventbus.on(ButtonDownEvent, self._handle_buttondown, self._app)
             if self._state == STATE_OPENING:
                 if self._opened_amount > 0.99:
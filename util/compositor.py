@@ -0,0 +1,147 @@
+from array import array
+
+import sasppu
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Union
+
+# bg1's map, in tiles
+MAP_ROWS = len(sasppu.bg1) // sasppu.MAP_WIDTH
+
+# Flags the compositor turns on and off for whichever overlay is showing
+_MS_FLAGS = sasppu.MainState.BG1_ENABLE | sasppu.MainState.CMATH_ENABLE
+_CS_FLAGS = sasppu.CMathState.CMATH_ENABLE
+
+def bitmap_row(x: int, y: int, tiles: int, spare: int) -> array:
+    """
+    One row of map entries, showing a strip of the background bitmap.
+    :param x, y: Where in the background the strip starts, in pixels. x should be a multiple of 8.
+    :param tiles: How many tiles of the strip to show. The rest of the row shows spare.
+    :param spare: Map entry for the rest of the row.
+    """
+    start = ((x + (y * sasppu.Background.WIDTH)) // 8) * 4
+    row = array("H", [spare] * sasppu.MAP_WIDTH)
+    for i in range(min(tiles, sasppu.MAP_WIDTH)):
+        row[i] = start + i * 4
+    return row
+
+class Region:
+    """
+    Some rows of bg1's map that belong to one overlay.
+    """
+    def __init__(self, first_row: int, rows: int):
+        self.first_row = first_row
+        self.rows = rows
+        # Add this to the layer's y scroll to show the top of the region
+        self.y = first_row * 8
+
+    def write_row(self, row: int, entries: array):
+        """
+        Replace a whole row of the region's map in one go.
+        """
+        start = (self.first_row + row) * sasppu.MAP_WIDTH
+        sasppu.bg1[start:start + sasppu.MAP_WIDTH] = entries
+
+class Compositor:
+    """
+    Owns the SASPPU state the overlays draw with: a MainState, a CMathState and the bg1 layer.
+
+    Overlays get their own rows of bg1's map with allocate(), so their maps are written once and left alone.
+    Only one of them can have the layer's scroll and flags at a time, so open overlays are ordered by z,
+    and the highest one gets them. The rest get them back as the ones above close.
+    """
+    def __init__(self):
+        self.ms = sasppu.MainState()
+        self.ms.bind(False)
+        self.cs = sasppu.CMathState()
+        self.cs.bind(False)
+        self.bg = sasppu.Background()
+        self.bg.bind(1, False)
+        self.bg.windows = sasppu.WINDOW_ALL
+        self.bg.flags = 0
+        self._regions = []
+        self._next_row = 0
+        # [z, owner, main state flags, cmath state flags], lowest z first
+        self._open = []
+        # Where each overlay last asked for the layer to be scrolled to, (x, y) by owner
+        self._scrolls = {}
+
+    def allocate(self, owner: object, rows: int) -> Region:
+        """
+        @return: rows rows of bg1's map for owner. Asking again gives the same region.
+        """
+        for o, region in self._regions:
+            if o is owner:
+                return region
+        if self._next_row + rows > MAP_ROWS:
+            raise ValueError(f"bg1's map has no room for {rows} more rows")
+        region = Region(self._next_row, rows)
+        self._next_row += rows
+        self._regions.append((owner, region))
+        return region
+
+    def open(self, owner: object, z: int, ms_flags: int, cs_flags: int):
+        """
+        Show owner on bg1 if nothing with a higher z is open.
+        :param ms_flags, cs_flags: The main and cmath state flags owner needs while it's showing.
+        """
+        entry = self._find(owner)
+        if entry is None:
+            entry = [z, owner, ms_flags, cs_flags]
+            i = len(self._open)
+            while i > 0 and self._open[i - 1][0] > z:
+                i -= 1
+            self._open.insert(i, entry)
+        else:
+            entry[2] = ms_flags
+            entry[3] = cs_flags
+        self._apply()
+
+    def close(self, owner: object):
+        entry = self._find(owner)
+        if entry is not None:
+            self._open.remove(entry)
+            self._apply()
+
+    def is_top(self, owner: object) -> bool:
+        return len(self._open) > 0 and self._open[-1][1] is owner
+
+    def scroll(self, owner: object, x: int, y: int):
+        """
+        Set where owner wants the layer scrolled to. It's only used while owner is on top.
+        """
+        self._scrolls[owner] = (x, y)
+        if self.is_top(owner):
+            self.bg.x = x
+            self.bg.y = y
+
+    def _find(self, owner: object) -> Union[list, None]:
+        for entry in self._open:
+            if entry[1] is owner:
+                return entry
+        return None
+
+    def _apply(self):
+        ms_flags = self.ms.flags & (~_MS_FLAGS) & 0xFF
+        cs_flags = self.cs.flags & (~_CS_FLAGS) & 0xFF
+        if self._open:
+            _, owner, top_ms, top_cs = self._open[-1]
+            ms_flags |= top_ms
+            cs_flags |= top_cs
+            if owner in self._scrolls:
+                self.bg.x, self.bg.y = self._scrolls[owner]
+        self.ms.flags = ms_flags
+        self.cs.flags = cs_flags
+
+
+_compositor = None
+
+def get_compositor() -> Compositor:
+    """
+    @return: The Compositor every overlay shares.
+    """
+    global _compositor
+    if _compositor is None:
+        _compositor = Compositor()
+    return _compositor
@@ -0,0 +1,98 @@
+import sasppu
+
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Dict, Tuple
+    HdmaEntry = Tuple[int, int]
+
+LINES = 240
+CHANNELS = 8
+
+class HdmaManager:
+    """
+    Shares sasppu's HDMA channels between the overlays that use them.
+
+    Each overlay claims a channel of its own, so two overlays never want the same entry. Channels are run
+    in order on every scanline, so an overlay that shows above another should claim a higher channel.
+    Whenever an overlay's entries change it hands over all of them, by scanline. Only scanlines whose
+    entry is different to what's already in its channel's table get written.
+    """
+    def __init__(self):
+        # Who has each channel, by channel
+        self._owners = [None] * CHANNELS
+        # What's in each channel's table, by scanline. Scanlines that aren't here are HDMA_NOOP.
+        self._written = [{} for _ in range(CHANNELS)]
+
+    def claim(self, owner: object, channel: int):
+        """
+        Give owner a channel, clearing its table. If something else had it, that loses it,
+        and any entries it tries to set from then on are refused.
+        """
+        previous = self._owners[channel]
+        if previous is owner:
+            return
+        if previous is not None:
+            print(f"HDMA channel {channel} taken over from {previous}")
+        self._owners[channel] = owner
+        table = _table(channel)
+        for i in range(LINES):
+            table[i] = (sasppu.HDMA_NOOP, 0)
+        self._written[channel] = {}
+        sasppu.hdma_enable &= (~(1 << channel)) & 0xFF
+
+    def _channel_of(self, owner: object) -> int:
+        for channel in range(CHANNELS):
+            if self._owners[channel] is owner:
+                return channel
+        return -1
+
+    def set(self, owner: object, entries: 'Dict[int, HdmaEntry]'):
+        """
+        Replace all of owner's entries.
+        :param owner: Whatever claimed the channel, usually the overlay itself.
+        :param entries: {scanline: (HDMA command, value)}. Scanlines off the screen are left out.
+        """
+        channel = self._channel_of(owner)
+        if channel < 0:
+            raise ValueError(f"{owner} hasn't claimed an HDMA channel")
+        table = _table(channel)
+        written = self._written[channel]
+        lines = {}
+        for line, entry in entries.items():
+            if 0 <= line < LINES:
+                lines[line] = entry
+        for line in written:
+            if line not in lines:
+                table[line] = (sasppu.HDMA_NOOP, 0)
+        for line, entry in lines.items():
+            if written.get(line) != entry:
+                table[line] = entry
+        bit = 1 << channel
+        if lines and not written:
+            sasppu.hdma_enable |= bit
+        elif written and not lines:
+            sasppu.hdma_enable &= (~bit) & 0xFF
+        self._written[channel] = lines
+
+    def clear(self, owner: object):
+        """
+        Remove all of owner's entries.
+        """
+        if self._channel_of(owner) >= 0:
+            self.set(owner, {})
+
+
+def _table(channel: int):
+    return getattr(sasppu, f"hdma_{channel}")
+
+
+_manager = None
+
+def get_manager() -> HdmaManager:
+    """
+    @return: The HdmaManager everything shares.
+    """
+    global _manager
+    if _manager is None:
+        _manager = HdmaManager()
+    return _manager
@@ -0,0 +1,38 @@
+from ctx import Context
+
+class ImageLayer:
+    """
+    A full screen image, shared so that only one is ever being drawn, and so only one is kept decoded
+    if ctx keeps them.
+    """
+    def __init__(self):
+        self._shown = None
+
+    def show(self, path: str):
+        """
+        Show an image from now on, in place of any other.
+        """
+        self._shown = path
+
+    def release(self):
+        """
+        Stop showing anything, so ctx can free the image.
+        """
+        self._shown = None
+
+    def draw(self, ctx: Context):
+        if self._shown is not None:
+            ctx.image_smoothing = 0
+            ctx.image(self._shown, -120, -120, 240, 240)
+
+
+_layer = None
+
+def get_layer() -> ImageLayer:
+    """
+    @return: The ImageLayer everything shares, so only one full screen image is ever kept decoded.
+    """
+    global _layer
+    if _layer is None:
+        _layer = ImageLayer()
+    return _layer
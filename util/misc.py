@@ -2,17 +2,46 @@ from ctx import Context
 from ..config import ASSET_PATH
 import sys
 import os
+from collections import OrderedDict
 
 def ctx_line(self: Context, x: float, y: float, x2: float, y2: float):
     return self.move_to(x,y).line_to(x2,y2)
 
+# Font sizes shrink_until_fit has worked out, keyed by (text, max_width, max_font), least recently used first.
+# The font face isn't in the key: the game never sets ctx.font, so every size is for the default face.
+_FIT_CACHE_SIZE = 64
+_fit_cache = OrderedDict()
+
 def shrink_until_fit(ctx: Context, text: str, max_width: float, max_font: int = 20):
-    width = max_font
-    ctx.font_size = width
-    while ctx.text_width(text) > max_width:
-        width -= 1
-        ctx.font_size = width
-    return width
+    """
+    Set ctx.font_size to the largest size up to max_font at which text is no wider than max_width.
+    @return: The font size
+    """
+    key = (text, max_width, max_font)
+    size = _fit_cache.pop(key, None)
+    if size is None:
+        size = _fit_font_size(ctx, text, max_width, max_font)
+        if len(_fit_cache) >= _FIT_CACHE_SIZE:
+            del _fit_cache[next(iter(_fit_cache))]
+    _fit_cache[key] = size
+    ctx.font_size = size
+    return size
+
+def _fit_font_size(ctx: Context, text: str, max_width: float, max_font: int) -> int:
+    # Text gets wider as the font gets bigger, so binary search for the last size that fits
+    ctx.font_size = max_font
+    if ctx.text_width(text) <= max_width:
+        return max_font
+    lo = 0
+    hi = max_font - 1
+    while lo < hi:
+        mid = (lo + hi + 1) >> 1
+        ctx.font_size = mid
+        if ctx.text_width(text) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
 
 def draw_mon(ctx: Context, monIndex: int, x: float, y: float, flipx: bool, flipy: bool, scale: int):
     ctx.image_smoothing = 0
@@ -0,0 +1,63 @@
+from sys import implementation as _sys_implementation
+if _sys_implementation.name != "micropython":
+    from typing import Union
+
+# How long a frame should take, in ms
+BUDGET = 33
+# While over budget, background animations are only updated every this many frames
+DECIMATE = 2
+# How long the scene has to be idle before power saving kicks in, in ms
+IDLE_AFTER = 10000
+# The shortest a frame can be while power saving, in ms
+IDLE_FRAME = 200
+
+class FrameScheduler:
+    """
+    Keeps track of how long frames are taking, and decides what can be left out of them.
+
+    When frames are taking longer than BUDGET, animations marked as background (wobbles and the like) are
+    only updated every DECIMATE frames. When power saving, once the scene has been idle for IDLE_AFTER,
+    whole frames are skipped until at least IDLE_FRAME has passed.
+    Skipped time is added to the next frame that runs, so animations still finish when they should.
+    """
+    def __init__(self):
+        # Smoothed time between frames, in ms
+        self.average = BUDGET
+        # True if the current frame is being skipped, so shouldn't be drawn either
+        self.skipped = False
+        self._frame = 0
+        self._idle_for = 0
+        self._pending = 0
+
+    def begin(self, delta: int, idle: bool) -> Union[int, None]:
+        """
+        Start a frame.
+        :param delta: Time since the last frame, in ms.
+        :param idle: Whether the frame can be skipped, if it's been like that for long enough.
+        @return: How far to move things on, in ms, or None if the frame is skipped.
+        """
+        self._pending += delta
+        if idle:
+            self._idle_for += delta
+        else:
+            self._idle_for = 0
+        if self._idle_for >= IDLE_AFTER and self._pending < IDLE_FRAME:
+            self.skipped = True
+            return None
+        self.skipped = False
+        if self._idle_for < IDLE_AFTER:
+            self.average += (delta - self.average) / 8
+        self._frame += 1
+        delta = self._pending
+        self._pending = 0
+        return delta
+
+    @property
+    def over_budget(self) -> bool:
+        return self.average > BUDGET
+
+    def skip_background(self) -> bool:
+        """
+        @return: True if background animations should sit this frame out.
+        """
+        return self.over_budget and self._frame % DECIMATE != 0
@@ -0,0 +1,42 @@
+# MicroPython has no bisect module, so here's the bit we need
+
+def bisect_left(a, x, lo: int = 0, hi: int = -1) -> int:
+    """
+    Find where x would be inserted into the sorted sequence a, before any equal entries.
+
+    @param a: A sorted sequence (list, array, ...)
+    @param x: The value to look for
+    @param lo: Start of the range to search
+    @param hi: End of the range to search, -1 for the whole sequence
+    @return: The index of the first entry greater than or equal to x
+    """
+    if hi < 0:
+        hi = len(a)
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if a[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def bisect_right(a, x, lo: int = 0, hi: int = -1) -> int:
+    """
+    Find where x would be inserted into the sorted sequence a, after any equal entries.
+
+    @param a: A sorted sequence (list, array, ...)
+    @param x: The value to look for
+    @param lo: Start of the range to search
+    @param hi: End of the range to search, -1 for the whole sequence
+    @return: The index of the first entry greater than x
+    """
+    if hi < 0:
+        hi = len(a)
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if x < a[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
@@ -9,6 +9,8 @@ from app import App, SASPPUApp
 
 import sasppu
 
+from ..util import hdma, compositor
+
 MAX_LINE_WIDTH = 200
 BOX_WIDTH = 100 # half of width
 BOX_HEIGHT = 30 # half of height
@@ -25,6 +27,21 @@ LINE_HEIGHT = 20
 RESERVED_HEIGHT = LINE_HEIGHT*4
 RESERVED_START = sasppu.Background.HEIGHT - RESERVED_HEIGHT
 
+# Lines of the current speech are drawn once each into this strip of the background, one after another,
+# and bg1's map is pointed at whichever four are showing. Scrolling only rewrites the map.
+# Map entries can start on any background row, so lines don't need to line up with the 8px tiles.
+# It sits above RESERVED_START, which the choice dialog draws into, with a gap for text drawn above a line.
+CACHE_LINES = 16
+CACHE_START = RESERVED_START - 12 - CACHE_LINES * LINE_HEIGHT
+
+# Drawn above the choice dialog when both are open
+Z_LEVEL = 2
+# Above the choice dialog's, so its entries are applied after
+HDMA_CHANNEL = 7
+MS_FLAGS = sasppu.MainState.BG1_ENABLE | sasppu.MainState.CMATH_ENABLE
+CS_FLAGS = sasppu.CMathState.CMATH_ENABLE | sasppu.CMathState.SUB_SUB_SCREEN
+SPARE_ENTRY = ((0x1FFFF - (sasppu.Background.WIDTH * 8) - 8) // 8) * 4
+
 class SpeechDialog:
     def __init__(self, app: App, speech: str):
         self._app = app
@@ -35,88 +52,73 @@ class SpeechDialog:
         self._ready_event.set()
         self._stay_open = False
         self._text_update_needed = False
+        # The line of the speech at the top of the cache strip, and which lines in the strip are drawn
+        self._cache_first = 0
+        self._cached = bytearray(CACHE_LINES)
 
         self.set_speech(speech)
         self._sasppu_init()
         self.open()
 
     def _sasppu_init(self):
-        self.ms = sasppu.MainState()
-        self.ms.bind(False)
-        self.cs = sasppu.CMathState()
-        self.cs.bind(False)
-        self.bg = sasppu.Background()
-        self.bg.bind(1, False)
-        self.bg1 = sasppu.bg1
-
-        self.bg.windows = sasppu.WINDOW_ALL
-        self.bg.x = BASE_BG1_X
-        self.bg.y = BASE_BG1_Y
-        self.bg.flags = 0
+        self._compositor = compositor.get_compositor()
+        self._region = self._compositor.allocate(self, RESERVED_HEIGHT // 8)
 
-        self.ms.flags = sasppu.MainState.BG1_ENABLE | sasppu.MainState.CMATH_ENABLE
-        self.cs.flags = sasppu.CMathState.CMATH_ENABLE | sasppu.CMathState.SUB_SUB_SCREEN
-
-        self._write_bg1_map()
+        self._write_bg1_map(0)
 
+        hdma.get_manager().claim(self, HDMA_CHANNEL)
         self._fill_hdma()
 
     def _fill_hdma(self):
-        for i in range(240):
-            sasppu.hdma_7[i] = (sasppu.HDMA_NOOP, 0)
-        sasppu.hdma_enable |= 0x80
-        
+        entries = {}
         height = int(self._opened_amount * BOX_HEIGHT)
         box_top = 120 - height
         box_end = 120 + height
 
-        ms_flags = self.ms.flags & (~sasppu.MainState.BG1_ENABLE) & 0xFF
+        ms_flags = MS_FLAGS & (~sasppu.MainState.BG1_ENABLE) & 0xFF
         ms_sub_col = sasppu.grey555(13)
-        cs_flags = self.cs.flags & (~sasppu.CMathState.CMATH_ENABLE) & 0xFF
+        cs_flags = CS_FLAGS & (~sasppu.CMathState.CMATH_ENABLE) & 0xFF
 
-        sasppu.hdma_7[0] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
-        sasppu.hdma_7[1] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
-        sasppu.hdma_7[2] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
+        entries[0] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
+        entries[1] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
+        entries[2] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
 
-        sasppu.hdma_7[box_end] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
-        sasppu.hdma_7[box_end + 3] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
-        sasppu.hdma_7[box_end + 5] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
+        entries[box_end] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
+        entries[box_end + 3] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
+        entries[box_end + 5] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
 
         ms_flags |= sasppu.MainState.BG1_ENABLE
         ms_sub_col = sasppu.grey555(10)
         cs_flags |= sasppu.CMathState.CMATH_ENABLE
 
-        sasppu.hdma_7[box_top - 5] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
-        sasppu.hdma_7[box_top - 3] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
+        entries[box_top - 5] = (sasppu.HDMA_CMATH_STATE_FLAGS, cs_flags)
+        entries[box_top - 3] = (sasppu.HDMA_MAIN_STATE_SUBSCREEN_COLOUR, ms_sub_col)
         if box_top != box_end:
-            sasppu.hdma_7[box_top] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
+            entries[box_top] = (sasppu.HDMA_MAIN_STATE_FLAGS, ms_flags)
+        hdma.get_manager().set(self, entries)
 
         self._set_bg1_scroll()
 
     def _clear_hdma(self):
-        for i in range(240):
-            sasppu.hdma_7[i] = (sasppu.HDMA_NOOP, 0)
-        sasppu.hdma_enable &= 0x7F
-        self.ms.flags &= (~sasppu.MainState.BG1_ENABLE) & 0xFF
-        self.cs.flags &= (~sasppu.CMathState.CMATH_ENABLE) & 0xFF
+        hdma.get_manager().clear(self)
+        self._compositor.close(self)
 
     def _set_bg1_scroll(self):
         if self._current_line_visually == 1.5:
-            self.bg.y = BASE_BG1_Y + LINE_HEIGHT // 2
+            y = BASE_BG1_Y + LINE_HEIGHT // 2
         elif self._current_line_visually == self._current_line:
-            self.bg.y = BASE_BG1_Y + LINE_HEIGHT
+            y = BASE_BG1_Y + LINE_HEIGHT
         else:
-            self.bg.y = int(BASE_BG1_Y + ((self._current_line_visually % 1.0) * LINE_HEIGHT))
-
-    def _write_bg1_map(self):
+            y = int(BASE_BG1_Y + ((self._current_line_visually % 1.0) * LINE_HEIGHT))
+        self._compositor.scroll(self, BASE_BG1_X, y + self._region.y)
+
+    def _write_bg1_map(self, slot: int):
+        """
+        Point bg1 at the cache strip, with the line in this slot at the top.
+        """
+        start = CACHE_START + slot * LINE_HEIGHT
         for y in range(RESERVED_HEIGHT // 8):
-            for x in range(sasppu.MAP_WIDTH):
-                end = MAX_LINE_WIDTH // 8
-                index = x + (y * sasppu.MAP_WIDTH)
-                if x > end:
-                    self.bg1[index] = ((0x1FFFF - (sasppu.Background.WIDTH * 8) - 8) // 8) * 4
-                else:
-                    self.bg1[index] = (((x * 8) + (((y * 8) + RESERVED_START) * sasppu.Background.WIDTH)) // 8) * 4
+            self._region.write_row(y, compositor.bitmap_row(0, (y * 8) + start, MAX_LINE_WIDTH // 8 + 1, SPARE_ENTRY))
 
     def is_open(self) -> bool:
         return self._open
@@ -154,17 +156,30 @@ class SpeechDialog:
             self._cleanup()
         print(self._lines)
         self._goto_start()
+        self._cache_first = 0
+        self._cached = bytearray(CACHE_LINES)
         self._text_update_needed = True
 
     def _draw_text(self):
-        sasppu.fill_background(0, RESERVED_START, 256, RESERVED_HEIGHT, sasppu.TRANSPARENT_BLACK)
         start_index = int(self._current_line)
-        for (i, line) in enumerate(self._lines[start_index : start_index + 4]):
-            if line == "":
+        if start_index < self._cache_first or start_index + 4 > self._cache_first + CACHE_LINES:
+            # Scrolled off the end of the strip, start it again from here
+            self._cache_first = start_index
+            self._cached = bytearray(CACHE_LINES)
+        for i in range(start_index, start_index + 4):
+            slot = i - self._cache_first
+            if self._cached[slot]:
                 continue
+            self._cached[slot] = 1
+            top = CACHE_START + (slot * LINE_HEIGHT) - 12
+            sasppu.fill_background(0, top, 256, LINE_HEIGHT, sasppu.TRANSPARENT_BLACK)
+            if i >= len(self._lines) or self._lines[i] == "":
+                continue
+            line = self._lines[i]
             width = sasppu.get_text_size(255, line, True)[0]
             offset_left = (MAX_LINE_WIDTH - width) // 2
-            sasppu.draw_text_background(offset_left, RESERVED_START + (i * LINE_HEIGHT) - 12, sasppu.WHITE, width, line, True)
+            sasppu.draw_text_background(offset_left, top, sasppu.WHITE, width, line, True)
+        self._write_bg1_map(start_index - self._cache_first)
 
     def _goto_start(self):
         if len(self._lines) < 4:
@@ -183,6 +198,8 @@ class SpeechDialog:
                 self._state = STATE_OPENING
                 self._opened_amount = 0.0
                 self._goto_start()
+                self._compositor.open(self, Z_LEVEL, MS_FLAGS, CS_FLAGS)
+                self._set_bg1_scroll()
                 eventbus.on(ButtonDownEvent, self._handle_buttondown, self._app)
             if self._state == STATE_OPENING:
                 if self._opened_amount > 0.99:
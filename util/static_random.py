@@ -1,5 +1,5 @@
 import math
-
+import os
 import time
 
 # Dave Hoskins
@@ -10,26 +10,49 @@ def hash_without_sine(p:float):
     p *= p + p
     return p - math.trunc(p)
 
+# A linear congruential generator, mod 2**30, worked out 15 bits at a time. That keeps every number in it
+# a small int on MicroPython (31 bits), so a draw doesn't put a long int on the heap.
+# The multiplier is under 2**15 and does well on the spectral test up to 5 dimensions.
+_MULTIPLIER = 32337
+_INCREMENT = 12345
+_HALF = 0x7FFF
+
 state = 0
 
-def new_state():
+def _next24() -> int:
+    """
+    @return: The top 24 bits of the next state. The low bits of an LCG repeat quickly, so they're left out.
+    """
     global state
-    state = int(random()*(2**24))
+    lo = _MULTIPLIER * (state & _HALF) + _INCREMENT
+    hi = (_MULTIPLIER * (state >> 15) + (lo >> 15)) & _HALF
+    state = (hi << 15) | (lo & _HALF)
+    return state >> 6
+
+def new_state():
+    set_state(int.from_bytes(os.urandom(4), "little"))
 
 def set_state(s):
     global state
-    state = int(s) % (2**24)
-
-set_state(time.time())
+    s = int(s)
+    state = (s ^ (s >> 30)) & 0x3FFFFFFF
+    # Seeds next to each other start off close, a few steps spreads them out
+    for _ in range(3):
+        _next24()
 
 def random():
-    global state
-    r = hash_without_sine(state)
-    state = (state + 1) % (2**24)
-    return r
+    # 24 bits, so it's exact as a float and never rounds up to 1
+    return _next24() / 16777216
+
+set_state(time.time())
 
 def getrandbits(n):
-    return int(random()*(2**n))
+    bits = 0
+    have = 0
+    while have < n:
+        bits = (bits << 24) | _next24()
+        have += 24
+    return bits >> (have - n)
 
 def randrange(start, end):
     return int((random()*(end-start))+start)
@@ -38,4 +61,4 @@ def randint(start, end):
     return randrange(start, end)
 
 def choice(choices):
-    return choices[int(random()*len(choices))]
\ No newline at end of file
+    return choices[int(random()*len(choices))]